@@ -0,0 +1,33 @@
+"""Add transcript cache table
+
+Revision ID: a3c1f7d2e9b4
+Revises: 5e8911293b23
+Create Date: 2026-10-17 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c1f7d2e9b4'
+down_revision: Union[str, Sequence[str], None] = '5e8911293b23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('transcript_cache',
+    sa.Column('cache_key', sa.String(), nullable=False),
+    sa.Column('transcript', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('cache_key')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('transcript_cache')
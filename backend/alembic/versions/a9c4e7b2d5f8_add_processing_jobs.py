@@ -0,0 +1,60 @@
+"""Add processing jobs table
+
+Revision ID: a9c4e7b2d5f8
+Revises: f3d8e2a6b4c1
+Create Date: 2026-10-17 19:04:27.318552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c4e7b2d5f8'
+down_revision: Union[str, Sequence[str], None] = 'f3d8e2a6b4c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+job_status = sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'DEAD', name='jobstatus')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('processing_jobs',
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('response_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('status', job_status, nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('run_after', sa.DateTime(), nullable=False),
+    sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+    sa.Column('worker_id', sa.String(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['response_id'], ['responses.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('response_id')
+    )
+    op.create_index(
+        'ix_processing_jobs_status_run_after',
+        'processing_jobs',
+        ['status', 'run_after'],
+        unique=False,
+    )
+
+    # Uploads spooled on local disk before the queue existed cannot be recovered
+    op.execute(
+        "UPDATE responses SET processing_stage = 'FAILED', evaluation_status = 'FAILED', "
+        "processing_error = 'Processing was interrupted. Please record your answer again.' "
+        "WHERE processing_stage IN ('RECEIVED', 'TRANSCRIBED')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_processing_jobs_status_run_after', table_name='processing_jobs')
+    op.drop_table('processing_jobs')
+    job_status.drop(op.get_bind())
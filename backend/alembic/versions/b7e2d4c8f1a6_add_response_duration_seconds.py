@@ -0,0 +1,28 @@
+"""Add duration_seconds to responses
+
+Revision ID: b7e2d4c8f1a6
+Revises: a3c1f7d2e9b4
+Create Date: 2026-10-17 10:04:18.227431
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4c8f1a6'
+down_revision: Union[str, Sequence[str], None] = 'a3c1f7d2e9b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('responses', sa.Column('duration_seconds', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('responses', 'duration_seconds')
@@ -0,0 +1,30 @@
+"""Add transcription_profile to responses
+
+Revision ID: c4f9a2e6d1b8
+Revises: b7e2d4c8f1a6
+Create Date: 2026-10-17 11:42:51.604183
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f9a2e6d1b8'
+down_revision: Union[str, Sequence[str], None] = 'b7e2d4c8f1a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'responses', sa.Column('transcription_profile', sa.String(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('responses', 'transcription_profile')
@@ -0,0 +1,70 @@
+"""Add evaluation state to responses
+
+Revision ID: d8a3b5f7c2e9
+Revises: c4f9a2e6d1b8
+Create Date: 2026-10-17 15:08:24.318452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a3b5f7c2e9'
+down_revision: Union[str, Sequence[str], None] = 'c4f9a2e6d1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+evaluation_status = sa.Enum('PENDING', 'SCORED', 'FAILED', name='evaluationstatus')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    evaluation_status.create(op.get_bind())
+    op.add_column(
+        'responses',
+        sa.Column(
+            'evaluation_status',
+            evaluation_status,
+            nullable=False,
+            server_default='PENDING',
+        ),
+    )
+    op.add_column(
+        'responses',
+        sa.Column(
+            'evaluation_attempts', sa.Integer(), nullable=False, server_default='0'
+        ),
+    )
+    op.add_column('responses', sa.Column('evaluation_error', sa.Text(), nullable=True))
+    op.add_column(
+        'responses',
+        sa.Column('evaluation_next_attempt_at', sa.DateTime(), nullable=True),
+    )
+
+    # Existing responses with a score are done; the rest are picked up by the worker
+    op.execute(
+        "UPDATE responses SET evaluation_status = 'SCORED' WHERE EXISTS "
+        '(SELECT 1 FROM response_scores WHERE response_scores.response_id = responses.id)'
+    )
+    op.alter_column('responses', 'evaluation_status', server_default=None)
+    op.alter_column('responses', 'evaluation_attempts', server_default=None)
+
+    op.create_index(
+        op.f('ix_responses_evaluation_status'),
+        'responses',
+        ['evaluation_status'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_responses_evaluation_status'), table_name='responses')
+    op.drop_column('responses', 'evaluation_next_attempt_at')
+    op.drop_column('responses', 'evaluation_error')
+    op.drop_column('responses', 'evaluation_attempts')
+    op.drop_column('responses', 'evaluation_status')
+    evaluation_status.drop(op.get_bind())
@@ -0,0 +1,34 @@
+"""Add evaluation model and rubric version to response_scores
+
+Revision ID: e5b1c9d3a7f2
+Revises: d8a3b5f7c2e9
+Create Date: 2026-10-17 16:21:47.902316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b1c9d3a7f2'
+down_revision: Union[str, Sequence[str], None] = 'd8a3b5f7c2e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'response_scores', sa.Column('evaluation_model', sa.String(), nullable=True)
+    )
+    op.add_column(
+        'response_scores', sa.Column('rubric_version', sa.String(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('response_scores', 'rubric_version')
+    op.drop_column('response_scores', 'evaluation_model')
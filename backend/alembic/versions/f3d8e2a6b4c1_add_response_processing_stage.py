@@ -0,0 +1,76 @@
+"""Add processing stage to responses
+
+Revision ID: f3d8e2a6b4c1
+Revises: e5b1c9d3a7f2
+Create Date: 2026-10-17 17:35:12.448190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3d8e2a6b4c1'
+down_revision: Union[str, Sequence[str], None] = 'e5b1c9d3a7f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+processing_stage = sa.Enum(
+    'RECEIVED', 'TRANSCRIBED', 'STORED', 'EVALUATED', 'FAILED', name='processingstage'
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    processing_stage.create(op.get_bind())
+    op.add_column(
+        'responses',
+        sa.Column(
+            'processing_stage',
+            processing_stage,
+            nullable=False,
+            server_default='STORED',
+        ),
+    )
+    op.add_column('responses', sa.Column('processing_error', sa.Text(), nullable=True))
+    op.add_column(
+        'responses',
+        sa.Column(
+            'processing_updated_at',
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+    # Existing responses were transcribed and stored inside the request
+    op.execute(
+        "UPDATE responses SET processing_stage = 'EVALUATED' "
+        "WHERE evaluation_status = 'SCORED'"
+    )
+    op.alter_column('responses', 'processing_stage', server_default=None)
+    op.alter_column('responses', 'processing_updated_at', server_default=None)
+
+    op.create_index(
+        op.f('ix_responses_processing_stage'),
+        'responses',
+        ['processing_stage'],
+        unique=False,
+    )
+    op.alter_column('responses', 'audio_path', existing_type=sa.String(), nullable=True)
+    op.alter_column('responses', 'transcript', existing_type=sa.Text(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Responses that never got through the pipeline cannot satisfy the old constraints
+    op.execute('DELETE FROM responses WHERE transcript IS NULL OR audio_path IS NULL')
+    op.alter_column('responses', 'transcript', existing_type=sa.Text(), nullable=False)
+    op.alter_column('responses', 'audio_path', existing_type=sa.String(), nullable=False)
+    op.drop_index(op.f('ix_responses_processing_stage'), table_name='responses')
+    op.drop_column('responses', 'processing_updated_at')
+    op.drop_column('responses', 'processing_error')
+    op.drop_column('responses', 'processing_stage')
+    processing_stage.drop(op.get_bind())
@@ -1,9 +1,11 @@
 """Job description API endpoints."""
 
+import asyncio
 import logging
-from typing import List
+from typing import List, Optional, Set
+from uuid import UUID
 
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
 from app.core.security import get_current_user
 from app.models.job_description import JobDescription, JobDescriptionStatus
 from app.models.question import Question
@@ -16,26 +18,183 @@ from app.schemas.job_description import (
 )
 from app.schemas.question import QuestionResponse
 from app.services.claude_service import claude_service
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix='/api/job-descriptions', tags=['Job Descriptions'])
 logger = logging.getLogger(__name__)
 
+# Streamed generations still running, which must outlive a disconnected client
+_generation_tasks: Set[asyncio.Task] = set()
+
+
+def _sse(event: str, data: str) -> str:
+    """Format one Server-Sent Event."""
+    return f'event: {event}\ndata: {data}\n\n'
+
+
+def _store_question(
+    db: Session, job_description: JobDescription, question_text: str
+) -> Question:
+    """Store one generated question of a job description."""
+    question = Question(
+        job_description_id=job_description.id,
+        user_id=job_description.user_id,
+        question_text=question_text,
+    )
+    db.add(question)
+    db.commit()
+    db.refresh(question)
+    return question
+
+
+def _mark_generated(db: Session, job_description: JobDescription) -> None:
+    """Record that every question of a job description has been stored."""
+    job_description.status = JobDescriptionStatus.QUESTIONS_GENERATED  # type: ignore
+    db.commit()
+    db.refresh(job_description)
+
+
+def _mark_failed(
+    db: Session,
+    job_description: JobDescription,
+    question_ids: List[UUID],
+    error: Exception,
+) -> None:
+    """Delete the questions a failed generation stored and record its error."""
+    db.rollback()
+    if question_ids:
+        db.query(Question).filter(Question.id.in_(question_ids)).delete(
+            synchronize_session=False
+        )
+    job_description.status = JobDescriptionStatus.ERROR  # type: ignore
+    job_description.error_message = str(error)  # type: ignore
+    db.commit()
+    db.refresh(job_description)
+
+
+async def _generate_questions(
+    job_description_id: UUID,
+    force_refresh: bool = False,
+    events: Optional[asyncio.Queue] = None,
+) -> None:
+    """
+    Generate and store questions for a pending job description.
+
+    Runs outside the creating request, with its own database session. Each
+    question is stored as soon as Claude has finished writing it, and the
+    outcome is recorded in the job description's status. If generation
+    fails partway, the questions stored so far are deleted again, so a job
+    description has either all of its questions or an error.
+
+    Args:
+        job_description_id: ID of the pending job description
+        force_refresh: Generate new questions even if this posting is cached
+        events: Optional queue receiving (event, data) pairs for each stored
+            question and the final status, followed by None
+    """
+    async def publish(event: str, data: BaseModel) -> None:
+        if events is not None:
+            await events.put((event, data.model_dump_json()))
+
+    db = SessionLocal()
+    try:
+        job_description = await asyncio.to_thread(
+            db.get, JobDescription, job_description_id
+        )
+        if job_description is None:
+            logger.warning(f'Job description {job_description_id} no longer exists')
+            return
+
+        question_ids: List[UUID] = []
+        try:
+            async for question_text in claude_service.stream_questions(
+                str(job_description.description_text),
+                str(job_description.company_name),
+                str(job_description.job_title),
+                force_refresh=force_refresh,
+            ):
+                # Save each question as soon as it is complete
+                question = await asyncio.to_thread(
+                    _store_question, db, job_description, question_text
+                )
+                question_ids.append(question.id)
+                await publish('question', QuestionResponse.model_validate(question))
+
+            await asyncio.to_thread(_mark_generated, db, job_description)
+            logger.info(
+                f'Successfully generated {len(question_ids)} questions for job description {job_description.id}'
+            )
+
+        except Exception as e:
+            logger.error(f'Failed to generate questions: {e}')
+            await asyncio.to_thread(_mark_failed, db, job_description, question_ids, e)
+
+        await publish('status', JobDescriptionResponse.model_validate(job_description))
+
+    finally:
+        db.close()
+        if events is not None:
+            await events.put(None)
+
+
+def _create_pending_job_description(
+    db: Session, job_data: JobDescriptionCreate, user: User
+) -> JobDescription:
+    """
+    Store a new job description awaiting question generation.
+
+    Raises:
+        HTTPException: If the job description cannot be stored
+    """
+    try:
+        # Create job description record with text
+        job_description = JobDescription(
+            user_id=user.id,
+            company_name=job_data.company_name,
+            job_title=job_data.job_title,
+            description_text=job_data.description_text,
+            status=JobDescriptionStatus.PENDING,
+        )
+
+        db.add(job_description)
+        db.commit()
+        db.refresh(job_description)
+        return job_description
+
+    except Exception as e:
+        logger.error(f'Error creating job description: {e}')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail='Failed to process job description',
+        )
+
 
 @router.post(
-    '', response_model=JobDescriptionResponse, status_code=status.HTTP_201_CREATED
+    '', response_model=JobDescriptionResponse, status_code=status.HTTP_202_ACCEPTED
 )
-async def create_job_description(
+def create_job_description(
     job_data: JobDescriptionCreate,
+    background_tasks: BackgroundTasks,
+    force_refresh: bool = False,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
-    Create a job description with text input and generate interview questions.
+    Create a job description and start generating interview questions.
+
+    Returns immediately with status ``pending``; questions are generated in
+    the background and progress can be followed with
+    ``GET /api/job-descriptions/{id}``. Questions for a posting that was
+    submitted recently are reused from the question cache unless
+    force_refresh is set.
 
     Args:
         job_data: Job description data including text
+        background_tasks: Tasks run after the response is sent
+        force_refresh: Generate new questions even if this posting is cached
         current_user: Authenticated user
         db: Database session
 
@@ -45,61 +204,66 @@ async def create_job_description(
     Raises:
         HTTPException: If processing fails
     """
-    try:
-        # Create job description record with text
-        job_description = JobDescription(
-            user_id=current_user.id,
-            company_name=job_data.company_name,
-            job_title=job_data.job_title,
-            description_text=job_data.description_text,
-            status=JobDescriptionStatus.PENDING,
-        )
+    job_description = _create_pending_job_description(db, job_data, current_user)
 
-        db.add(job_description)
-        db.commit()
-        db.refresh(job_description)
+    # Generate questions using Claude once the response has been sent
+    background_tasks.add_task(
+        _generate_questions, job_description.id, force_refresh
+    )
 
-        # Generate questions using Claude
-        try:
-            questions_list = claude_service.generate_questions(
-                job_data.description_text, job_data.company_name, job_data.job_title
-            )
+    return job_description
 
-            # Save questions to database
-            for question_text in questions_list:
-                question = Question(
-                    job_description_id=job_description.id,
-                    user_id=current_user.id,
-                    question_text=question_text,
-                )
-                db.add(question)
 
-            # Update status to success
-            job_description.status = JobDescriptionStatus.QUESTIONS_GENERATED  # type: ignore
-            db.commit()
-            db.refresh(job_description)
+@router.post('/stream')
+def create_job_description_stream(
+    job_data: JobDescriptionCreate,
+    force_refresh: bool = False,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Create a job description and stream its questions as they are generated.
 
-            logger.info(
-                f'Successfully generated {len(questions_list)} questions for job description {job_description.id}'
-            )
+    Responds with Server-Sent Events:
+        - ``job_description``: the created job description (status ``pending``)
+        - ``question``: each question, as soon as it has been generated and stored
+        - ``status``: the job description with its final status and any error
 
-        except Exception as e:
-            # Update status to error
-            job_description.status = JobDescriptionStatus.ERROR  # type: ignore
-            job_description.error_message = str(e)  # type: ignore
-            db.commit()
-            db.refresh(job_description)
+    Generation continues in the background if the client disconnects, so the
+    job description always ends up with every question or an error.
 
-            logger.error(f'Failed to generate questions: {e}')
+    Args:
+        job_data: Job description data including text
+        force_refresh: Generate new questions even if this posting is cached
+        current_user: Authenticated user
+        db: Database session
 
-        return job_description
+    Returns:
+        Streaming response of Server-Sent Events
+    """
+    job_description = _create_pending_job_description(db, job_data, current_user)
+    created = JobDescriptionResponse.model_validate(job_description).model_dump_json()
+    job_description_id = job_description.id
 
-    except Exception as e:
-        logger.error(f'Error creating job description: {e}')
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail='Failed to process job description',
+    async def event_stream():
+        yield _sse('job_description', created)
+
+        events: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(
+            _generate_questions(job_description_id, force_refresh, events)
         )
+        # Keep a reference so the task is not garbage collected if the client leaves
+        _generation_tasks.add(task)
+        task.add_done_callback(_generation_tasks.discard)
+
+        while (item := await events.get()) is not None:
+            yield _sse(*item)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
 
 
 @router.get('', response_model=List[JobDescriptionListResponse])
@@ -157,6 +321,43 @@ def list_job_descriptions(
     return result
 
 
+@router.get('/{job_description_id}', response_model=JobDescriptionResponse)
+def get_job_description(
+    job_description_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Get a job description, including its question generation status.
+
+    Args:
+        job_description_id: ID of the job description
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        Job description with status and any error message
+
+    Raises:
+        HTTPException: If job description not found or unauthorized
+    """
+    job_description = (
+        db.query(JobDescription)
+        .filter(
+            JobDescription.id == job_description_id,
+            JobDescription.user_id == current_user.id,
+        )
+        .first()
+    )
+
+    if not job_description:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail='Job description not found'
+        )
+
+    return job_description
+
+
 @router.get('/{job_description_id}/questions', response_model=List[QuestionResponse])
 def get_questions(
     job_description_id: str,
@@ -1,16 +1,17 @@
 """Response and evaluation API endpoints."""
 
+import asyncio
+import io
+import json
 import logging
-import tempfile
-from pathlib import Path
-from typing import List
+import os
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 from app.core.constants import MAX_AUDIO_DURATION_MINUTES, MAX_AUDIO_SIZE_MB
-from app.core.database import get_db
-from app.core.security import get_current_user
-from app.models.job_description import JobDescription
+from app.core.database import SessionLocal, get_db
+from app.core.security import get_current_user, get_user_from_token
 from app.models.question import Question
-from app.models.response import Response
+from app.models.response import EvaluationStatus, ProcessingStage, Response
 from app.models.response_score import ResponseScore
 from app.models.user import User
 from app.schemas.response import (
@@ -18,10 +19,34 @@ from app.schemas.response import (
     ResponseResponse,
     ScoresResponse,
 )
+from app.services.audio_probe_service import (
+    AudioProbeError,
+    AudioProbeResult,
+    audio_probe_service,
+)
 from app.services.claude_service import claude_service
+from app.services.evaluation_service import evaluation_service
+from app.services.job_queue import job_queue
+from app.services.live_transcription_service import LiveTranscriptionSession
+from app.services.resilience import UpstreamUnavailableError
 from app.services.storage_service import storage_service
-from app.services.whisper_service import whisper_service
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from app.services.whisper_service import (
+    TranscriptionQueueFullError,
+    decode_audio_input,
+    whisper_service,
+)
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix='/api/questions', tags=['Responses'])
@@ -30,11 +55,305 @@ logger = logging.getLogger(__name__)
 # Audio size limit (convert MB to bytes)
 MAX_AUDIO_SIZE = MAX_AUDIO_SIZE_MB * 1024 * 1024
 
+# Audio duration limit (convert minutes to seconds)
+MAX_AUDIO_DURATION = MAX_AUDIO_DURATION_MINUTES * 60
+
+# How often live sessions look for finished speech to transcribe
+LIVE_TRANSCRIPTION_INTERVAL_SECONDS = 2.0
+
+# How long a live session waits for the client's auth message
+LIVE_AUTH_TIMEOUT_SECONDS = 10.0
+
+EVALUATION_DEFERRED_DETAIL = (
+    'Your answer was saved, but feedback is temporarily unavailable. '
+    'It will be added automatically once the evaluation service recovers.'
+)
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event with a JSON payload."""
+    return f'event: {event}\ndata: {json.dumps(data)}\n\n'
+
+
+def _get_question_for_user(
+    db: Session, question_id: str, user: User
+) -> Optional[Question]:
+    """Return the question if it exists and belongs to the user."""
+    return (
+        db.query(Question)
+        .filter(Question.id == question_id, Question.user_id == user.id)
+        .first()
+    )
+
+
+async def _probe_audio(content: Union[bytes, BinaryIO]) -> AudioProbeResult:
+    """
+    Probe uploaded audio and enforce the duration limit.
+
+    Args:
+        content: Encoded audio bytes or a seekable file object
+
+    Returns:
+        Probed stream information
+
+    Raises:
+        HTTPException: If the audio is unreadable or too long
+    """
+    try:
+        probe = await asyncio.to_thread(
+            audio_probe_service.probe, content, MAX_AUDIO_DURATION
+        )
+    except AudioProbeError as e:
+        logger.warning(f'Rejecting unreadable audio: {e}')
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Audio file could not be read. Please record your answer again.',
+        )
+
+    if probe.duration_seconds > MAX_AUDIO_DURATION:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'Audio is too long ({probe.duration_seconds / 60:.1f} minutes). Maximum duration is {MAX_AUDIO_DURATION_MINUTES} minutes.',
+        )
+
+    return probe
+
+
+def _create_response(
+    db: Session,
+    question: Question,
+    user: User,
+    transcript: str,
+    r2_key: str,
+    probe: AudioProbeResult,
+    transcription_profile: str,
+) -> Response:
+    """Store a transcribed response that has not been evaluated yet."""
+    # Create response record with R2 key
+    response = Response(
+        question_id=question.id,
+        user_id=user.id,
+        audio_path=r2_key,
+        transcript=transcript,
+        duration_seconds=probe.duration_seconds,
+        transcription_profile=transcription_profile,
+        evaluation_status=EvaluationStatus.PENDING,
+        processing_stage=ProcessingStage.STORED,
+    )
+
+    db.add(response)
+    db.commit()
+    db.refresh(response)
+    return response
+
+
+def _format_response(response: Response, evaluation: Optional[Dict[str, Any]]) -> dict:
+    """
+    Format a response and its evaluation, if it has one, for the API.
+
+    Args:
+        response: Stored response
+        evaluation: Scores, feedback and overall comment, or None if not scored yet
+
+    Returns:
+        Response with processing stage, transcript, evaluation status, scores,
+        and feedback
+    """
+    evaluation = evaluation or {}
+    scores = evaluation.get('scores')
+    feedback = evaluation.get('feedback')
+    return {
+        'response_id': response.id,
+        'transcript': response.transcript,
+        'processing_stage': response.processing_stage.value,
+        'processing_error': response.processing_error,
+        'evaluation_status': response.evaluation_status.value,
+        'scores': ScoresResponse(**scores) if scores else None,
+        'feedback': FeedbackResponse(**feedback) if feedback else None,
+        'overall_comment': evaluation.get('overall_comment'),
+        'duration_seconds': response.duration_seconds,
+        'created_at': response.created_at,
+    }
+
+
+async def _save_and_evaluate_response(
+    db: Session,
+    question: Question,
+    user: User,
+    transcript: str,
+    r2_key: str,
+    probe: AudioProbeResult,
+    transcription_profile: str,
+) -> dict:
+    """
+    Store a transcribed response, evaluate it with Claude and store the scores.
+
+    Args:
+        db: Database session
+        question: Question being answered
+        user: User who recorded the response
+        transcript: Transcribed answer
+        r2_key: R2 key of the stored audio
+        probe: Probed audio information
+        transcription_profile: Name of the Whisper decoding profile used
+
+    Returns:
+        Response with transcript, scores, and feedback
+
+    Raises:
+        HTTPException: If the evaluation fails; the response stays pending and
+            the evaluation worker retries it
+    """
+    response = await asyncio.to_thread(
+        _create_response,
+        db,
+        question,
+        user,
+        transcript,
+        r2_key,
+        probe,
+        transcription_profile,
+    )
+
+    # Evaluate response using Claude
+    try:
+        evaluation = await evaluation_service.evaluate(db, response)
+    except UpstreamUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=EVALUATION_DEFERRED_DETAIL,
+        )
+    except Exception as e:
+        logger.error(f'Error evaluating response {response.id}: {e}')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f'Failed to evaluate response: {str(e)}. {EVALUATION_DEFERRED_DETAIL}',
+        )
+
+    return _format_response(response, evaluation)
+
+
+async def _receive_audio(audio_file: UploadFile) -> AudioProbeResult:
+    """
+    Enforce the size and duration limits of an uploaded recording without reading it into memory.
+
+    The request body limit already stops oversized uploads while they are
+    received; the upload itself stays in its spooled file, which is rewound
+    for whoever reads it next.
+
+    Args:
+        audio_file: Audio file upload
+
+    Returns:
+        Probed audio information
+
+    Raises:
+        HTTPException: If the upload is too large, unreadable or too long
+    """
+    # Validate file size
+    size = audio_file.size
+    if size is None:
+        size = audio_file.file.seek(0, os.SEEK_END)
+    await audio_file.seek(0)
+
+    if size > MAX_AUDIO_SIZE:
+        file_size_mb = size / 1024 / 1024
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'Audio file is too large ({file_size_mb:.1f}MB). Maximum size is {MAX_AUDIO_SIZE_MB}MB (~{MAX_AUDIO_DURATION_MINUTES} minutes).',
+        )
+
+    # Validate duration from the container before any transcription or upload work
+    return await _probe_audio(audio_file.file)
+
+
+def _start_upload(file: BinaryIO, filename: str) -> asyncio.Task:
+    """Start uploading audio to R2 in a worker thread, returning the task that yields its key."""
+    return asyncio.create_task(
+        asyncio.to_thread(storage_service.save_audio, file, filename)
+    )
+
+
+def _discard_upload(upload: asyncio.Task) -> None:
+    """Delete the object of an upload started for a response that will not be stored."""
+
+    def discard(task: asyncio.Task) -> None:
+        if task.cancelled() or task.exception() is not None:
+            return
+        # Delete in the default executor, without blocking or awaiting in the caller
+        asyncio.get_running_loop().run_in_executor(
+            None, storage_service.delete_file, task.result()
+        )
+
+    upload.add_done_callback(discard)
+
+
+async def _receive_and_transcribe(
+    question_id: str, audio_file: UploadFile
+) -> Tuple[str, str, AudioProbeResult, str]:
+    """
+    Validate an uploaded recording, transcribe it and store the audio in R2.
+
+    The upload is decoded once, straight from its spooled file, and then
+    streams to R2 while the samples are transcribed, so the slower of the
+    two sets the latency. If transcription fails, the uploaded object is
+    deleted.
+
+    Args:
+        question_id: ID of the question being answered
+        audio_file: Audio file upload
+
+    Returns:
+        Transcript, R2 key, probed audio information and decoding profile name
+
+    Raises:
+        HTTPException: If the upload is invalid, the service is busy, or processing fails
+    """
+    probe = await _receive_audio(audio_file)
+    filename = audio_file.filename or 'response.webm'
+
+    try:
+        # Decode straight from the spooled upload, then rewind it so it can
+        # stream to R2 while the samples are transcribed
+        samples = await asyncio.to_thread(decode_audio_input, audio_file.file)
+        await audio_file.seek(0)
+        upload = _start_upload(audio_file.file, filename)
+
+        # Decode faster under load
+        profile = whisper_service.select_profile(probe.duration_seconds)
+        logger.info(
+            f'Transcribing audio for question {question_id} ({profile.name} profile)'
+        )
+        try:
+            transcript = await whisper_service.transcribe_async(samples, profile)
+        except BaseException:
+            _discard_upload(upload)
+            raise
+
+        r2_key = await upload
+        logger.info(f'Audio saved to R2: {r2_key}')
+
+        return transcript, r2_key, probe, profile.name
+
+    except TranscriptionQueueFullError as e:
+        logger.warning(f'Rejecting response for question {question_id}: {e}')
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Transcription service is busy. Please try again shortly.',
+            headers={'Retry-After': '10'},
+        )
+    except Exception as e:
+        logger.error(f'Error processing response: {e}')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f'Failed to process response: {str(e)}',
+        )
+
 
 @router.post(
     '/{question_id}/responses',
     response_model=ResponseResponse,
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def submit_response(
     question_id: str,
@@ -43,7 +362,12 @@ async def submit_response(
     db: Session = Depends(get_db),
 ):
     """
-    Submit an audio response to a question, transcribe it, and get evaluation.
+    Accept an audio response to a question for background processing.
+
+    The upload is validated, stored in R2 and queued; a pipeline worker then
+    transcribes and evaluates it. Poll
+    ``GET /{question_id}/responses/{response_id}`` until the processing stage
+    is ``evaluated`` or ``failed``.
 
     Args:
         question_id: ID of the question being answered
@@ -52,120 +376,452 @@ async def submit_response(
         db: Database session
 
     Returns:
-        Response with transcript, scores, and feedback
+        The received response, without transcript or scores yet
 
     Raises:
-        HTTPException: If question not found or processing fails
+        HTTPException: If question not found, the upload is invalid, or it
+            cannot be recorded
     """
     # Verify question belongs to user
-    question = (
-        db.query(Question)
-        .filter(Question.id == question_id, Question.user_id == current_user.id)
+    question = _get_question_for_user(db, question_id, current_user)
+
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail='Question not found'
+        )
+
+    probe = await _receive_audio(audio_file)
+
+    # Store the audio first so that a worker on any machine can transcribe it
+    try:
+        r2_key = await asyncio.to_thread(
+            storage_service.save_audio,
+            audio_file.file,
+            audio_file.filename or 'response.webm',
+        )
+    except Exception as e:
+        logger.error(f'Error processing response: {e}')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f'Failed to process response: {str(e)}',
+        )
+
+    try:
+        response = Response(
+            question_id=question.id,
+            user_id=current_user.id,
+            audio_path=r2_key,
+            duration_seconds=probe.duration_seconds,
+            evaluation_status=EvaluationStatus.PENDING,
+            processing_stage=ProcessingStage.RECEIVED,
+        )
+        db.add(response)
+        job_queue.enqueue(db, response)
+        db.commit()
+        db.refresh(response)
+    except Exception:
+        db.rollback()
+        await asyncio.to_thread(storage_service.delete_file, r2_key)
+        raise
+
+    return _format_response(response, None)
+
+
+@router.get(
+    '/{question_id}/responses/{response_id}', response_model=ResponseResponse
+)
+def get_response(
+    question_id: str,
+    response_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Get a response with its processing stage, and its evaluation once scored.
+
+    Args:
+        question_id: ID of the question
+        response_id: ID of the response
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        Response with processing stage, transcript, scores, and feedback
+
+    Raises:
+        HTTPException: If the question or response is not found
+    """
+    # Verify question belongs to user
+    question = _get_question_for_user(db, question_id, current_user)
+
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail='Question not found'
+        )
+
+    row = (
+        db.query(Response, ResponseScore)
+        .outerjoin(ResponseScore, Response.id == ResponseScore.response_id)
+        .filter(Response.id == response_id, Response.question_id == question.id)
         .first()
     )
 
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail='Response not found'
+        )
+
+    response, score = row
+    return _format_response(response, score.scores_json if score else None)
+
+
+@router.post('/{question_id}/responses/stream')
+async def submit_response_stream(
+    question_id: str,
+    audio_file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Submit an audio response and stream its evaluation as it is written.
+
+    Upload validation and transcription happen before streaming starts, so
+    their errors are ordinary HTTP errors. The response is then a stream of
+    Server-Sent Events:
+        - ``transcript``: response ID and transcript
+        - ``criterion``: score and feedback of each criterion, in order
+        - ``overall_comment``: the overall assessment
+        - ``result``: the stored response, as returned by the non-streaming endpoint
+        - ``error``: evaluation failed; ends the stream
+
+    The score record is written once, after the whole evaluation is complete.
+    If the evaluation fails, the response stays pending and the evaluation
+    worker retries it.
+
+    Args:
+        question_id: ID of the question being answered
+        audio_file: Audio file upload
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        Streaming response of Server-Sent Events
+
+    Raises:
+        HTTPException: If question not found or transcription fails
+    """
+    # Session work runs in threads so open streams do not stall the event loop
+    question = await asyncio.to_thread(
+        _get_question_for_user, db, question_id, current_user
+    )
+
     if not question:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail='Question not found'
         )
 
-    # Get job description for evaluation context
-    job_description = (
-        db.query(JobDescription)
-        .filter(JobDescription.id == question.job_description_id)
-        .first()
+    transcript, r2_key, probe, profile_name = await _receive_and_transcribe(
+        question_id, audio_file
+    )
+    response = await asyncio.to_thread(
+        _create_response,
+        db,
+        question,
+        current_user,
+        transcript,
+        r2_key,
+        probe,
+        profile_name,
+    )
+    job_description_text, question_text, _ = await asyncio.to_thread(
+        evaluation_service.evaluation_inputs, db, response
     )
 
-    # Validate file size
-    content = await audio_file.read()
-    await audio_file.seek(0)
+    async def event_stream():
+        yield _sse(
+            'transcript', {'response_id': str(response.id), 'transcript': transcript}
+        )
+
+        try:
+            logger.info(f'Evaluating response {response.id}')
+            async for event, data in claude_service.stream_evaluation(
+                job_description_text, question_text, transcript
+            ):
+                if event == 'criterion':
+                    yield _sse('criterion', data)
+                    continue
+
+                yield _sse('overall_comment', {'overall_comment': data['overall_comment']})
+                await asyncio.to_thread(evaluation_service.store, db, response, data)
+                result = _format_response(response, data)
+                yield _sse('result', jsonable_encoder(ResponseResponse(**result)))
+
+        except Exception as e:
+            # The response stays pending and the evaluation worker retries it
+            await asyncio.to_thread(evaluation_service.record_failure, db, response, e)
+            if isinstance(e, UpstreamUnavailableError):
+                yield _sse('error', {'detail': EVALUATION_DEFERRED_DETAIL})
+            else:
+                logger.error(f'Error evaluating response {response.id}: {e}')
+                yield _sse(
+                    'error',
+                    {
+                        'detail': f'Failed to evaluate response: {str(e)}. {EVALUATION_DEFERRED_DETAIL}'
+                    },
+                )
+
+    return StreamingResponse(
+        event_stream(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+async def _send_partial_transcripts(
+    websocket: WebSocket, session: LiveTranscriptionSession, stop: asyncio.Event
+) -> None:
+    """Periodically transcribe finished speech and push the growing transcript."""
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), LIVE_TRANSCRIPTION_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        if stop.is_set() or session.too_long:
+            # The receive loop rejects a recording that is too long
+            break
 
-    if len(content) > MAX_AUDIO_SIZE:
-        file_size_mb = len(content) / 1024 / 1024
+        try:
+            transcript = await session.transcribe_ready()
+        except Exception as e:
+            logger.error(f'Live transcription error: {e}')
+            continue
+        if transcript is not None:
+            await websocket.send_json({'type': 'partial', 'transcript': transcript})
+
+
+def _check_live_duration(session: LiveTranscriptionSession) -> None:
+    """
+    Reject a live recording once more than the maximum duration has been decoded.
+
+    Raises:
+        HTTPException: If the recording is too long
+    """
+    if session.too_long:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f'Audio file is too large ({file_size_mb:.1f}MB). Maximum size is {MAX_AUDIO_SIZE_MB}MB (~{MAX_AUDIO_DURATION_MINUTES} minutes).',
+            detail=f'Recording is too long. Maximum duration is {MAX_AUDIO_DURATION_MINUTES} minutes.',
         )
 
+
+def _live_message_type(text: str) -> Optional[str]:
+    """Return the type of a live response text frame, or None if it is not a typed JSON object."""
     try:
-        filename = audio_file.filename or 'response.webm'
+        message = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(message, dict) or not isinstance(message.get('type'), str):
+        return None
+    return message['type']
+
+
+def _websocket_close_code(status_code: int) -> int:
+    """Map the HTTP status of an error to the WebSocket close code reporting it."""
+    if status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
+        # Busy transcription workers or a deferred evaluation; the client may retry
+        return status.WS_1013_TRY_AGAIN_LATER
+    if status_code >= 500:
+        return status.WS_1011_INTERNAL_ERROR
+    return status.WS_1008_POLICY_VIOLATION
+
+
+def _authorize_live_response(
+    token: str, question_id: str
+) -> Tuple[Optional[User], Optional[Question]]:
+    """
+    Resolve the user and question of a live response with a short-lived session.
 
-        # Save uploaded file to temporary location for transcription
-        with tempfile.NamedTemporaryFile(suffix='.webm', delete=False) as temp_file:
-            temp_file.write(content)
-            temp_audio_path = temp_file.name
+    The session is closed before recording starts, so a connection is not
+    held for the length of the recording; the loaded user and question stay
+    usable after it is closed.
 
-        try:
-            # Transcribe audio from temporary file
-            logger.info(f'Transcribing audio for question {question_id}')
-            transcript = whisper_service.transcribe(temp_audio_path)
+    Returns:
+        The user and question, with None for the question if it does not
+        exist or belongs to someone else
 
-            # Upload to R2 after successful transcription
-            # Reset file position to beginning for upload
-            audio_file.file.seek(0)
-            r2_key = storage_service.save_audio(audio_file.file, filename)
-            logger.info(f'Audio saved to R2: {r2_key}')
+    Raises:
+        HTTPException: If the token is invalid
+    """
+    db = SessionLocal()
+    try:
+        user = get_user_from_token(token, db)
+        return user, _get_question_for_user(db, question_id, user)
+    finally:
+        db.close()
 
-        finally:
-            # Clean up temporary file
-            Path(temp_audio_path).unlink(missing_ok=True)
 
-        # Create response record with R2 key
-        response = Response(
-            question_id=question.id,
-            user_id=current_user.id,
-            audio_path=r2_key,  
-            transcript=transcript,
-        )
+async def _authenticate_live_response(
+    websocket: WebSocket, question_id: str
+) -> Optional[Tuple[User, Question]]:
+    """
+    Authenticate an accepted live response from its first message.
 
-        db.add(response)
-        db.commit()
-        db.refresh(response)
+    The token travels in a message rather than the URL, so it does not end
+    up in access logs or proxy logs.
 
-        # Evaluate response using Claude
-        logger.info(f'Evaluating response {response.id}')
-        evaluation = claude_service.evaluate_response(
-            str(job_description.description_text) if job_description else '',
-            str(question.question_text),
-            transcript
+    Returns:
+        The user and question, or None once the socket has been closed
+        because authentication failed
+    """
+    try:
+        message = await asyncio.wait_for(
+            websocket.receive_json(), LIVE_AUTH_TIMEOUT_SECONDS
+        )
+        if not isinstance(message, dict) or message.get('type') != 'auth':
+            raise ValueError('first message must be an auth message')
+        current_user, question = await asyncio.to_thread(
+            _authorize_live_response, str(message.get('token', '')), question_id
         )
+    except WebSocketDisconnect:
+        return None
+    except (asyncio.TimeoutError, ValueError, KeyError, HTTPException):
+        await websocket.send_json({'type': 'error', 'detail': 'Could not validate credentials'})
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return None
 
-        # Create response score record
-        scores = evaluation['scores']
-        feedback = evaluation['feedback']
+    if not question:
+        await websocket.send_json({'type': 'error', 'detail': 'Question not found'})
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return None
 
-        response_score = ResponseScore(
-            response_id=response.id,
-            scores_json=evaluation,
-            score_confidence=scores.get('confidence'),
-            score_clarity_structure=scores.get('clarity_structure'),
-            score_technical_depth=scores.get('technical_depth'),
-            score_communication_skills=scores.get('communication_skills'),
-            score_relevance=scores.get('relevance'),
-        )
+    return current_user, question
 
-        db.add(response_score)
-        db.commit()
-        db.refresh(response_score)
 
-        logger.info(f'Successfully processed response {response.id}')
+@router.websocket('/{question_id}/responses/live')
+async def live_response(websocket: WebSocket, question_id: str):
+    """
+    Record a response over a WebSocket, transcribing it while the user speaks.
+
+    Protocol:
+        - Send ``{"type": "auth", "token": ...}`` with the access token as the
+          first message, and wait for ``{"type": "ready"}``
+        - Send the recording as binary messages (MediaRecorder chunks, in order)
+        - Receive ``{"type": "partial", "transcript": ...}`` as speech is transcribed
+        - Send ``{"type": "stop"}`` when recording ends
+        - Receive ``{"type": "transcript", ...}`` with the full transcript, then
+          ``{"type": "result", "response": ...}`` once the evaluation is stored
+        - Any other text message while recording closes the socket with 1008
+        - Errors are reported as ``{"type": "error", "detail": ...}`` before closing
 
-        # Return formatted response
-        return {
-            'response_id': response.id,
-            'transcript': transcript,
-            'scores': ScoresResponse(**scores),
-            'feedback': FeedbackResponse(**feedback),
-            'overall_comment': evaluation.get('overall_comment'),
-            'created_at': response.created_at,
-        }
+    Args:
+        websocket: WebSocket connection
+        question_id: ID of the question being answered
+    """
+    await websocket.accept()
+
+    authenticated = await _authenticate_live_response(websocket, question_id)
+    if authenticated is None:
+        return
+    current_user, question = authenticated
+    await websocket.send_json({'type': 'ready'})
+
+    session = LiveTranscriptionSession(max_duration_seconds=MAX_AUDIO_DURATION)
+    stop = asyncio.Event()
+    partials = asyncio.create_task(_send_partial_transcripts(websocket, session, stop))
+
+    try:
+        # Receive audio until the client stops recording
+        while True:
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                raise WebSocketDisconnect(message.get('code', 1000))
+
+            if message.get('bytes'):
+                session.feed(message['bytes'])
+                if session.size > MAX_AUDIO_SIZE:
+                    await websocket.send_json(
+                        {
+                            'type': 'error',
+                            'detail': f'Recording is too large. Maximum size is {MAX_AUDIO_SIZE_MB}MB.',
+                        }
+                    )
+                    await websocket.close(code=status.WS_1009_MESSAGE_TOO_BIG)
+                    return
+                # Checked while streaming so a low-bitrate recording cannot keep
+                # the Whisper workers busy past the limit until it stops
+                _check_live_duration(session)
+            elif message.get('text') is not None:
+                if _live_message_type(message['text']) == 'stop':
+                    break
+                # Only stop is valid once recording has started
+                await websocket.send_json(
+                    {'type': 'error', 'detail': 'Unexpected message during recording'}
+                )
+                await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+                return
+
+        # Let any in-flight partial transcription finish, then transcribe the rest
+        stop.set()
+        await partials
+        _check_live_duration(session)
+
+        audio = session.audio
+        probe = await _probe_audio(audio)
+
+        # Store the recording while the rest of it is transcribed
+        upload = _start_upload(io.BytesIO(audio), 'response.webm')
+        try:
+            transcript = await session.finish()
+            await websocket.send_json({'type': 'transcript', 'transcript': transcript})
+        except BaseException:
+            _discard_upload(upload)
+            raise
 
+        r2_key = await upload
+        logger.info(f'Audio saved to R2: {r2_key}')
+
+        # Only now take a database session, for storing and evaluating the response
+        db = SessionLocal()
+        try:
+            result = await _save_and_evaluate_response(
+                db,
+                question,
+                current_user,
+                transcript,
+                r2_key,
+                probe,
+                session.profile.name,
+            )
+        finally:
+            db.close()
+        await websocket.send_json(
+            {'type': 'result', 'response': jsonable_encoder(ResponseResponse(**result))}
+        )
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        logger.info(f'Live response for question {question_id} disconnected')
+    except HTTPException as e:
+        await websocket.send_json({'type': 'error', 'detail': e.detail})
+        await websocket.close(code=_websocket_close_code(e.status_code))
+    except TranscriptionQueueFullError as e:
+        logger.warning(f'Rejecting live response for question {question_id}: {e}')
+        await websocket.send_json(
+            {
+                'type': 'error',
+                'detail': 'Transcription service is busy. Please try again shortly.',
+            }
+        )
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
     except Exception as e:
-        logger.error(f'Error processing response: {e}')
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f'Failed to process response: {str(e)}',
+        logger.error(f'Error processing live response: {e}')
+        await websocket.send_json(
+            {'type': 'error', 'detail': f'Failed to process response: {str(e)}'}
         )
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+    finally:
+        stop.set()
+        partials.cancel()
+        session.close()
 
 
 @router.get('/{question_id}/responses', response_model=List[ResponseResponse])
@@ -183,47 +839,31 @@ def list_responses(
         db: Database session
 
     Returns:
-        List of responses with full details (transcript, scores, feedback)
+        List of responses with full details (transcript, scores, feedback);
+        responses that are not scored yet have no scores or feedback
 
     Raises:
         HTTPException: If question not found or unauthorized
     """
     # Verify question belongs to user
-    question = (
-        db.query(Question)
-        .filter(Question.id == question_id, Question.user_id == current_user.id)
-        .first()
-    )
+    question = _get_question_for_user(db, question_id, current_user)
 
     if not question:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail='Question not found'
         )
 
-    # Get all responses with scores
+    # Get all responses, including those still waiting for a score
     responses = (
         db.query(Response, ResponseScore)
-        .join(ResponseScore, Response.id == ResponseScore.response_id)
+        .outerjoin(ResponseScore, Response.id == ResponseScore.response_id)
         .filter(Response.question_id == question_id)
         .order_by(Response.created_at.desc())
         .all()
     )
 
     # Format response with full details
-    result = []
-    for response, score in responses:
-        evaluation = score.scores_json
-        scores_data = evaluation.get('scores', {})
-        feedback_data = evaluation.get('feedback', {})
-        result.append(
-            {
-                'response_id': response.id,
-                'transcript': response.transcript,
-                'scores': ScoresResponse(**scores_data),
-                'feedback': FeedbackResponse(**feedback_data),
-                'overall_comment': evaluation.get('overall_comment'),
-                'created_at': response.created_at,
-            }
-        )
-
-    return result
+    return [
+        _format_response(response, score.scores_json if score else None)
+        for response, score in responses
+    ]
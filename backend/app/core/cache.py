@@ -0,0 +1,62 @@
+"""In-memory caching utilities."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar('V')
+
+
+class LRUCache(Generic[V]):
+    """
+    Thread-safe cache that evicts the least recently used entry when full.
+
+    Entries optionally expire a fixed time after they were stored.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: Optional[float] = None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep (0 disables caching)
+            ttl_seconds: Lifetime of each entry (None keeps entries until evicted)
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: 'OrderedDict[Hashable, Tuple[V, Optional[float]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for key, or None if it is not cached or expired."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            value, expires_at = self._data[key]
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry if needed."""
+        if self.maxsize <= 0:
+            return
+        expires_at = (
+            time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        )
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
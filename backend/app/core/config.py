@@ -49,6 +49,39 @@ class Settings(BaseSettings):
     # AI Services
     claude_api_key: str
     claude_model: str = 'claude-sonnet-4-5-20250929'
+    claude_base_url: Optional[str] = None  # Point at another Messages endpoint, e.g. a local stub
+    claude_max_concurrency: int = 8  # Concurrent Claude requests per process
+    claude_max_connections: int = 16  # HTTP connections kept open to the API
+    claude_max_keepalive_connections: int = 8
+    claude_keepalive_expiry_seconds: float = 30.0
+    claude_timeout_seconds: float = 120.0
+    claude_max_attempts: int = 3  # Attempts per request, including the first
+    claude_retry_base_delay_seconds: float = 1.0
+    claude_retry_max_delay_seconds: float = 16.0
+    claude_hedge_after_seconds: float = 30.0  # Send a second request if slower (0 disables)
+    claude_deadline_seconds: float = 150.0  # Budget for a request across all attempts
+    claude_circuit_failure_threshold: int = 5  # Consecutive failures that open the circuit
+    claude_circuit_reset_seconds: float = 30.0
+    question_cache_size: int = 256  # Generated question sets kept in memory (0 disables)
+    question_cache_ttl_seconds: int = 86400  # How long generated questions are reused
+    question_generation_timeout_seconds: float = 600.0  # Pending job descriptions older than this are failed
+    question_generation_sweep_seconds: float = 60.0  # How often to look for abandoned generations
+
+    # Evaluation worker (re-evaluates responses whose scoring failed or was interrupted)
+    evaluation_worker_enabled: bool = True
+    evaluation_worker_concurrency: int = 2  # Responses evaluated at once per process
+    evaluation_worker_poll_seconds: float = 10.0
+    evaluation_retry_delay_seconds: float = 30.0  # Doubles with every failed attempt
+    evaluation_max_attempts: int = 8  # Failed attempts before a response is marked failed
+    evaluation_lease_seconds: float = 300.0  # How long a claimed or in-flight evaluation is left alone
+
+    # Response processing pipeline (queued transcription of accepted submissions)
+    pipeline_worker_enabled: bool = True  # Disable on API processes when dedicated workers run
+    pipeline_concurrency: int = 4  # Jobs processed at once per worker process
+    pipeline_poll_seconds: float = 2.0  # How often an idle worker looks for queued jobs
+    pipeline_max_attempts: int = 5  # Attempts before a job is dead-lettered
+    pipeline_retry_delay_seconds: float = 5.0  # Doubles with every failed attempt
+    pipeline_lease_seconds: float = 120.0  # Renewed while a job runs; expired leases are reclaimed
 
     # Storage
     max_audio_size_mb: int = MAX_AUDIO_SIZE_MB
@@ -66,10 +99,32 @@ class Settings(BaseSettings):
     r2_secret_access_key: str
     r2_bucket_name: str
     r2_public_url: Optional[str] = None  # Optional: Custom domain for public access
+    r2_multipart_threshold_mb: int = 8  # Larger uploads are sent as parallel parts
+    r2_multipart_part_size_mb: int = 8  # At least 5; R2 needs equal-sized parts
+    r2_multipart_concurrency: int = 4  # Parts uploaded at once per file
 
     # Whisper
     whisper_model: str = 'base.en'
-    whisper_device: str = 'cpu' 
+    whisper_device: str = 'cpu'
+    whisper_compute_type: Optional[str] = None  # Defaults to int8 on CPU, float16 on GPU
+    whisper_executor: str = 'thread'  # 'thread' or 'process'
+    whisper_workers: int = 1  # Concurrent transcriptions in the pool
+    whisper_max_queue_size: int = 8  # Pending transcriptions allowed beyond busy workers
+    whisper_share_model: bool = False  # One model per process shared by all workers
+    whisper_preload: bool = False  # Load and warm up models at startup
+    whisper_batching: bool = False  # Batch segments from concurrent requests
+    whisper_batch_size: int = 8  # Maximum segments per batched inference
+    whisper_batch_max_wait_ms: int = 50  # How long to wait for more requests to batch
+    whisper_default_profile: str = 'accurate'  # 'accurate', 'balanced' or 'fast'
+    whisper_adaptive_profiles: bool = False  # Step down to faster profiles under load
+    whisper_fast_model: str = 'tiny.en'  # Model used by the fast profile
+    whisper_cpu_threads: int = 0  # Threads per model (0 divides cores across workers)
+    whisper_num_workers: int = 0  # Parallel transcriptions per model (0 = automatic)
+    whisper_download_root: Optional[str] = None  # Directory models are downloaded to
+    whisper_local_files_only: bool = False  # Only load models already on disk
+    web_concurrency: int = 1  # Uvicorn worker processes sharing this machine
+    transcript_cache_size: int = 256  # Transcripts kept in memory (0 disables)
+    transcript_cache_persistent: bool = False  # Also cache transcripts in Postgres
 
     # CORS
     cors_origins: str = '["http://localhost:5173", "http://localhost:3000"]'
@@ -3,6 +3,7 @@
 # Audio constraints - single source of truth for all audio limits
 MAX_AUDIO_SIZE_MB = 30  # 30MB maximum file size
 MAX_AUDIO_DURATION_MINUTES = 30  # 30 minutes maximum duration
+MAX_UPLOAD_OVERHEAD_BYTES = 64 * 1024  # Multipart boundaries and form fields around the audio
 
 # Job Description text limits
 JOB_DESCRIPTION_COMPANY_NAME_MAX_LENGTH = 200
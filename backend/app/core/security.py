@@ -102,7 +102,26 @@ def get_current_user(
     Raises:
         HTTPException: If authentication fails
     """
-    token = credentials.credentials
+    return get_user_from_token(credentials.credentials, db)
+
+
+def get_user_from_token(token: str, db: Session) -> User:
+    """
+    Resolve the user a JWT access token was issued to.
+
+    Used directly by endpoints that cannot send an Authorization header,
+    such as WebSockets.
+
+    Args:
+        token: JWT token string
+        db: Database session
+
+    Returns:
+        Authenticated user
+
+    Raises:
+        HTTPException: If the token is invalid or the user does not exist
+    """
     payload = decode_access_token(token)
 
     user_id: Optional[str] = payload.get('sub')
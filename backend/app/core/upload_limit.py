@@ -0,0 +1,59 @@
+"""Request body size limit enforced while the body is received."""
+
+from fastapi import HTTPException, status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class BodySizeLimitMiddleware:
+    """
+    Rejects request bodies larger than max_body_size with 413.
+
+    A declared Content-Length over the limit is rejected before any of the
+    body is read. Otherwise the body is counted as it arrives and the request
+    fails as soon as the limit is crossed, so an oversized upload is never
+    spooled in full. The error is raised from receive(), inside the route,
+    so the usual exception handling and CORS headers apply to it.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int, detail: str):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped application
+            max_body_size: Largest accepted request body in bytes
+            detail: Error detail returned for oversized bodies
+        """
+        self.app = app
+        self.max_body_size = max_body_size
+        self.detail = detail
+
+    def _too_large(self) -> HTTPException:
+        """Return the error raised for an oversized body."""
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=self.detail
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Pass the request on with a receive() that enforces the limit."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope['headers']).get(b'content-length', b'')
+        too_large = declared.isdigit() and int(declared) > self.max_body_size
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            if too_large:
+                raise self._too_large()
+
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > self.max_body_size:
+                    raise self._too_large()
+            return message
+
+        await self.app(scope, limited_receive, send)
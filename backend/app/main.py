@@ -1,9 +1,22 @@
 """FastAPI main application."""
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from app.api import auth, job_descriptions, responses
 from app.core.config import settings
+from app.core.constants import (
+    MAX_AUDIO_DURATION_MINUTES,
+    MAX_AUDIO_SIZE_MB,
+    MAX_UPLOAD_OVERHEAD_BYTES,
+)
+from app.core.upload_limit import BodySizeLimitMiddleware
+from app.services.claude_service import claude_service
+from app.services.evaluation_worker import evaluation_worker
+from app.services.question_generation_sweeper import question_generation_sweeper
+from app.services.response_pipeline import response_pipeline
+from app.services.whisper_service import whisper_service
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -14,12 +27,39 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks."""
+    if settings.whisper_preload:
+        # Load and warm up Whisper before accepting traffic
+        logger.info('Preloading Whisper models')
+        await asyncio.to_thread(whisper_service.preload)
+    if settings.pipeline_worker_enabled:
+        # Process queued submissions here rather than on dedicated workers
+        response_pipeline.start()
+    if settings.evaluation_worker_enabled:
+        # Retry evaluations that failed or were interrupted
+        evaluation_worker.start()
+    # Fail job descriptions whose question generation died with its process
+    question_generation_sweeper.start()
+    yield
+    await question_generation_sweeper.stop()
+    await response_pipeline.stop()
+    await evaluation_worker.stop()
+    # Let in-flight transcriptions finish and release the worker pool
+    whisper_service.shutdown()
+    # Close pooled connections to the Claude API
+    await claude_service.aclose()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description='AI-powered interview preparation coach',
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
 # Configure CORS - must be added before other middleware
@@ -35,6 +75,13 @@ app.add_middleware(
     expose_headers=['*'],
 )
 
+# Reject oversized uploads before they are read in full
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_size=MAX_AUDIO_SIZE_MB * 1024 * 1024 + MAX_UPLOAD_OVERHEAD_BYTES,
+    detail=f'Audio file is too large. Maximum size is {MAX_AUDIO_SIZE_MB}MB (~{MAX_AUDIO_DURATION_MINUTES} minutes).',
+)
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(job_descriptions.router)
@@ -57,6 +104,12 @@ def health_check():
     return {'status': 'healthy'}
 
 
+@app.get('/metrics')
+def metrics():
+    """Process-local usage counters."""
+    return {'prompt_cache': claude_service.prompt_cache_stats.snapshot()}
+
+
 if __name__ == '__main__':
     import uvicorn
 
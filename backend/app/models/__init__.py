@@ -1,9 +1,19 @@
 """Database models package."""
 
 from app.models.job_description import JobDescription
+from app.models.processing_job import ProcessingJob
 from app.models.question import Question
 from app.models.response import Response
 from app.models.response_score import ResponseScore
+from app.models.transcript_cache_entry import TranscriptCacheEntry
 from app.models.user import User
 
-__all__ = ['User', 'JobDescription', 'Question', 'Response', 'ResponseScore']
+__all__ = [
+    'User',
+    'JobDescription',
+    'Question',
+    'Response',
+    'ResponseScore',
+    'ProcessingJob',
+    'TranscriptCacheEntry',
+]
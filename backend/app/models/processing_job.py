@@ -0,0 +1,54 @@
+"""Processing job model."""
+
+import enum
+import uuid
+from datetime import datetime, timezone
+
+from app.core.database import Base
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+
+class JobStatus(enum.Enum):
+    """Status of a processing job."""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    # Out of attempts; kept for inspection until requeued
+    DEAD = 'dead'
+
+
+class ProcessingJob(Base):
+    """Queued processing of a received response, claimed by pipeline workers."""
+
+    __tablename__ = 'processing_jobs'
+    __table_args__ = (
+        Index('ix_processing_jobs_status_run_after', 'status', 'run_after'),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    response_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey('responses.id', ondelete='CASCADE'),
+        nullable=False,
+        unique=True,
+    )
+    status = Column(SQLEnum(JobStatus), default=JobStatus.QUEUED, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    # When a queued job may next be claimed
+    run_after = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    # A running job whose lease has expired belongs to a dead worker
+    lease_expires_at = Column(DateTime, nullable=True)
+    worker_id = Column(String, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    # Relationships
+    response = relationship('Response')
+
+    def __repr__(self):
+        return f'<ProcessingJob(id={self.id}, response_id={self.response_id}, status={self.status})>'
@@ -1,14 +1,34 @@
 """Response model."""
 
+import enum
 import uuid
 from datetime import datetime, timezone
 
 from app.core.database import Base
-from sqlalchemy import Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 
+class ProcessingStage(enum.Enum):
+    """Stage a submitted response has reached in the processing pipeline."""
+
+    RECEIVED = 'received'
+    TRANSCRIBED = 'transcribed'
+    STORED = 'stored'
+    EVALUATED = 'evaluated'
+    FAILED = 'failed'
+
+
+class EvaluationStatus(enum.Enum):
+    """Status of a response's evaluation."""
+
+    PENDING = 'pending'
+    SCORED = 'scored'
+    FAILED = 'failed'
+
+
 class Response(Base):
     """User response to an interview question."""
 
@@ -23,8 +43,32 @@ class Response(Base):
     user_id = Column(
         UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False
     )
-    audio_path = Column(String, nullable=False)
-    transcript = Column(Text, nullable=False)
+    # Both are filled in by the processing pipeline
+    audio_path = Column(String, nullable=True)
+    transcript = Column(Text, nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+    transcription_profile = Column(String, nullable=True)
+    processing_stage = Column(
+        SQLEnum(ProcessingStage),
+        default=ProcessingStage.RECEIVED,
+        nullable=False,
+        index=True,
+    )
+    processing_error = Column(Text, nullable=True)
+    # Updated on every stage change; a stale value means the pipeline run died
+    processing_updated_at = Column(
+        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    evaluation_status = Column(
+        SQLEnum(EvaluationStatus),
+        default=EvaluationStatus.PENDING,
+        nullable=False,
+        index=True,
+    )
+    evaluation_attempts = Column(Integer, default=0, nullable=False)
+    evaluation_error = Column(Text, nullable=True)
+    # When the evaluation worker may next pick up a pending response
+    evaluation_next_attempt_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
 
     # Relationships
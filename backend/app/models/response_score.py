@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime, timezone
 
 from app.core.database import Base
-from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -32,6 +32,10 @@ class ResponseScore(Base):
     score_communication_skills = Column(Integer, nullable=True)
     score_relevance = Column(Integer, nullable=True)
 
+    # Model and rubric that produced the scores, to find stale scores after either changes
+    evaluation_model = Column(String, nullable=True)
+    rubric_version = Column(String, nullable=True)
+
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
 
     # Relationships
@@ -0,0 +1,19 @@
+"""Transcript cache model."""
+
+from datetime import datetime, timezone
+
+from app.core.database import Base
+from sqlalchemy import Column, DateTime, String, Text
+
+
+class TranscriptCacheEntry(Base):
+    """Persisted transcript keyed by audio content hash and decoding parameters."""
+
+    __tablename__ = 'transcript_cache'
+
+    cache_key = Column(String, primary_key=True)
+    transcript = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    def __repr__(self):
+        return f'<TranscriptCacheEntry(cache_key={self.cache_key})>'
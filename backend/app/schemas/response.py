@@ -43,13 +43,17 @@ class EvaluationResponse(BaseModel):
 
 
 class ResponseResponse(BaseModel):
-    """Schema for response with evaluation."""
+    """Schema for response with evaluation; the transcript and scores are missing until processed."""
 
     response_id: UUID4
-    transcript: str
-    scores: ScoresResponse
-    feedback: FeedbackResponse
+    processing_stage: str
+    processing_error: Optional[str] = None
+    transcript: Optional[str] = None
+    evaluation_status: str
+    scores: Optional[ScoresResponse] = None
+    feedback: Optional[FeedbackResponse] = None
     overall_comment: Optional[str] = None
+    duration_seconds: Optional[float] = None
     created_at: datetime
 
     class Config:
@@ -0,0 +1,101 @@
+"""Audio container probing without decoding."""
+
+import io
+import logging
+from typing import BinaryIO, Optional, Union
+
+import av
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class AudioProbeError(Exception):
+    """Raised when an upload cannot be read as audio."""
+
+
+class AudioProbeResult(BaseModel):
+    """Stream information read from an audio container."""
+
+    duration_seconds: float
+    sample_rate: Optional[int] = None
+    codec: Optional[str] = None
+    channels: Optional[int] = None
+
+
+class AudioProbeService:
+    """Service for reading audio metadata from container headers and packets."""
+
+    def probe(
+        self,
+        audio: Union[bytes, BinaryIO, str],
+        max_duration_seconds: Optional[float] = None,
+    ) -> AudioProbeResult:
+        """
+        Read the duration, sample rate and codec of an audio file without decoding it.
+
+        The duration comes from the container header when present. Browser
+        recordings (MediaRecorder webm) usually omit it, in which case packets
+        are demuxed, but not decoded, and the end of the last packet is used.
+
+        Args:
+            audio: Encoded audio bytes, a readable file object, or a file path
+            max_duration_seconds: Stop scanning packets once this duration is
+                exceeded; the returned duration is then a lower bound
+
+        Returns:
+            Probed stream information
+
+        Raises:
+            AudioProbeError: If the file is not a readable audio container
+        """
+        if isinstance(audio, (bytes, bytearray, memoryview)):
+            audio = io.BytesIO(audio)
+
+        position = audio.tell() if hasattr(audio, 'tell') else None
+        try:
+            with av.open(audio, mode='r', metadata_errors='ignore') as container:
+                if not container.streams.audio:
+                    raise AudioProbeError('File contains no audio stream')
+                stream = container.streams.audio[0]
+
+                duration = None
+                if container.duration is not None:
+                    duration = container.duration / av.time_base
+                elif stream.duration is not None and stream.time_base is not None:
+                    duration = float(stream.duration * stream.time_base)
+                else:
+                    duration = self._scan_packets(
+                        container, stream, max_duration_seconds
+                    )
+
+                return AudioProbeResult(
+                    duration_seconds=duration,
+                    sample_rate=stream.sample_rate or None,
+                    codec=stream.codec_context.name,
+                    channels=stream.codec_context.channels or None,
+                )
+        except AudioProbeError:
+            raise
+        except Exception as e:
+            logger.error(f'Error probing audio: {e}')
+            raise AudioProbeError(f'Could not read audio file: {str(e)}')
+        finally:
+            if position is not None:
+                audio.seek(position)
+
+    @staticmethod
+    def _scan_packets(container, stream, max_duration_seconds: Optional[float]) -> float:
+        """Find the end time of the last packet by demuxing without decoding."""
+        end = 0.0
+        for packet in container.demux(stream):
+            if packet.pts is None or packet.time_base is None:
+                continue
+            end = max(end, float((packet.pts + (packet.duration or 0)) * packet.time_base))
+            if max_duration_seconds is not None and end > max_duration_seconds:
+                break
+        return end
+
+
+# Global service instance
+audio_probe_service = AudioProbeService()
@@ -1,12 +1,51 @@
 """Claude API service for question generation and response evaluation."""
 
+import asyncio
+import hashlib
+import logging
+import threading
 from textwrap import dedent
-from typing import Any, Dict, List
-
-from anthropic import Anthropic
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+import jiter
+from anthropic import (
+    AsyncAnthropic,
+    DefaultAsyncHttpxClient,
+    transform_schema,
+)
 from app.core.config import settings
+from app.services.question_cache import QuestionCache
+from app.services.resilience import CircuitBreaker, ResilientCaller
 from pydantic import BaseModel, Field
 
+logger = logging.getLogger(__name__)
+
+# Static evaluation instructions; together with the job description they form
+# a prompt prefix that stays identical across every answer to the same JD
+EVALUATION_RUBRIC = dedent("""\
+    You are an expert interview coach evaluating a candidate's response to a behavioral interview question for the job described below.
+
+    Evaluate the response on the following criteria (score 1-10 for each):
+
+    1. **Confidence**: How confident and self-assured does the candidate sound?
+    2. **Clarity/Structure**: How well-structured and clear is the response? Does it follow STAR method?
+    3. **Technical Depth**: How well does the response demonstrate relevant technical/domain knowledge?
+    4. **Communication Skills**: How effectively does the candidate communicate their ideas?
+    5. **Relevance/Alignment**: How well does the response align with the job requirements?
+
+    For each category, provide:
+    - A score from 1 to 10
+    - Concise, actionable feedback (2-3 sentences)
+
+    Also provide an overall comment summarizing the response quality and key areas for improvement.
+    """)
+
+# Stored with every score so scores from an older rubric can be found and re-scored
+RUBRIC_VERSION = hashlib.sha256(EVALUATION_RUBRIC.encode('utf-8')).hexdigest()[:12]
+
+STRUCTURED_OUTPUTS_BETA = 'structured-outputs-2025-11-13'
+
 
 # Pydantic models for structured outputs
 class QuestionsList(BaseModel):
@@ -58,123 +97,542 @@ class EvaluationResult(BaseModel):
     )
 
 
+class CriterionEvaluation(BaseModel):
+    """Schema for the score and feedback of a single criterion."""
+
+    score: int = Field(..., ge=1, le=10, description='Score 1-10')
+    feedback: str = Field(..., description='Concise, actionable feedback')
+
+
+class StreamedEvaluationResult(BaseModel):
+    """
+    Schema for an evaluation written one criterion at a time.
+
+    Each criterion's score and feedback are adjacent in the output, so a
+    criterion can be shown as soon as its feedback is complete.
+    """
+
+    confidence: CriterionEvaluation
+    clarity_structure: CriterionEvaluation
+    technical_depth: CriterionEvaluation
+    communication_skills: CriterionEvaluation
+    relevance: CriterionEvaluation
+    overall_comment: str = Field(
+        ..., description='Overall assessment and improvement areas'
+    )
+
+
+# Criteria in the order they are evaluated
+CRITERIA = list(Scores.model_fields)
+
+
+def _questions_prompt(
+    job_description_text: str, company_name: str, job_title: str
+) -> str:
+    """Build the prompt asking Claude for interview questions."""
+    return dedent(f"""\
+        You are an expert interview coach. Based on the following job description, generate exactly 5 behavioral interview questions that are tailored to this specific role.
+
+        Company: {company_name}
+        Job Title: {job_title}
+
+        Job Description:
+        {job_description_text}
+
+        Generate 5 behavioral interview questions that:
+        1. Are specific to this role and company
+        2. Follow the STAR method (Situation, Task, Action, Result)
+        3. Test relevant competencies for this position
+        4. Are clear and professionally worded
+        5. Cover different aspects of the role
+        """)
+
+
+def _evaluation_system(job_description_text: str) -> List[Dict[str, Any]]:
+    """
+    Build the system prompt for evaluations: the rubric followed by the job description.
+
+    The cache breakpoint on the last block lets Claude reuse the processed
+    prefix for later answers to questions from the same job description.
+    """
+    return [
+        {'type': 'text', 'text': EVALUATION_RUBRIC},
+        {
+            'type': 'text',
+            'text': f'Job Description:\n{job_description_text}',
+            'cache_control': {'type': 'ephemeral'},
+        },
+    ]
+
+
+def _evaluation_prompt(question_text: str, transcript: str) -> str:
+    """Build the per-answer part of the evaluation prompt."""
+    return dedent(f"""\
+        Interview Question:
+        {question_text}
+
+        Candidate's Response:
+        {transcript}
+        """)
+
+
+def _parse_questions(response) -> List[str]:
+    """Extract the questions from a parsed Claude response."""
+    if response.parsed_output is None:
+        raise Exception('Failed to parse questions from Claude response')
+    return response.parsed_output.questions
+
+
+def _complete_questions(snapshot: str) -> List[str]:
+    """Return the questions fully present in a partial QuestionsList JSON snapshot."""
+    try:
+        # Incomplete trailing strings are dropped, so every question returned is final
+        data = jiter.from_json(snapshot.encode('utf-8'), partial_mode='on')
+    except ValueError:
+        return []
+    if not isinstance(data, dict):
+        return []
+    return [q for q in data.get('questions') or [] if isinstance(q, str)]
+
+
+def _complete_criteria(snapshot: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """Return the criteria whose score and feedback are complete in a partial snapshot."""
+    try:
+        data = jiter.from_json(snapshot.encode('utf-8'), partial_mode='on')
+    except ValueError:
+        return []
+    if not isinstance(data, dict):
+        return []
+
+    complete = []
+    for criterion in CRITERIA:
+        # Feedback follows the score, so a closed feedback string means both are final
+        value = data.get(criterion)
+        if not isinstance(value, dict) or not isinstance(value.get('feedback'), str):
+            break
+        complete.append((criterion, value))
+    return complete
+
+
+def _parse_evaluation(response) -> Dict[str, Any]:
+    """Convert a parsed Claude evaluation to the dictionary format expected by the API."""
+    if response.parsed_output is None:
+        raise Exception('Failed to parse evaluation from Claude response')
+    return _evaluation_dict(response.parsed_output)
+
+
+def parse_evaluation_text(text: str) -> Dict[str, Any]:
+    """Validate the JSON text of an evaluation and convert it to the API's dictionary format."""
+    return _evaluation_dict(EvaluationResult.model_validate_json(text))
+
+
+def _evaluation_dict(result: EvaluationResult) -> Dict[str, Any]:
+    """Convert an evaluation to the dictionary format expected by the API."""
+    return {
+        'scores': result.scores.model_dump(),
+        'feedback': result.feedback.model_dump(),
+        'overall_comment': result.overall_comment,
+    }
+
+
+class PromptCacheStats:
+    """Running totals of prompt-cache token usage for evaluations in this process."""
+
+    def __init__(self):
+        """Initialize all counters to zero."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.input_tokens = 0
+        self.cache_creation_input_tokens = 0
+        self.cache_read_input_tokens = 0
+
+    def record(self, usage) -> None:
+        """Add the token usage of one response and log it."""
+        input_tokens = usage.input_tokens or 0
+        cache_creation = usage.cache_creation_input_tokens or 0
+        cache_read = usage.cache_read_input_tokens or 0
+
+        with self._lock:
+            self.requests += 1
+            self.input_tokens += input_tokens
+            self.cache_creation_input_tokens += cache_creation
+            self.cache_read_input_tokens += cache_read
+
+        logger.info(
+            f'Evaluation prompt tokens: {input_tokens} uncached, '
+            f'{cache_creation} written to cache, {cache_read} read from cache '
+            f'({"hit" if cache_read else "miss"})'
+        )
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return the current totals."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'input_tokens': self.input_tokens,
+                'cache_creation_input_tokens': self.cache_creation_input_tokens,
+                'cache_read_input_tokens': self.cache_read_input_tokens,
+            }
+
+
 class ClaudeService:
     """Service for interacting with Claude API."""
 
     def __init__(self):
-        """Initialize Claude client."""
-        self.client = Anthropic(api_key=settings.claude_api_key)
+        """Initialize the service; the async client is created on first use."""
         self.model = settings.claude_model
+        self._async_client: Optional[AsyncAnthropic] = None
+        self._limiter: Optional[asyncio.Semaphore] = None
+        self.prompt_cache_stats = PromptCacheStats()
+        self._question_cache = QuestionCache(
+            maxsize=settings.question_cache_size,
+            ttl_seconds=settings.question_cache_ttl_seconds,
+        )
+        self.circuit_breaker = CircuitBreaker(
+            'Claude API',
+            failure_threshold=settings.claude_circuit_failure_threshold,
+            reset_timeout_seconds=settings.claude_circuit_reset_seconds,
+        )
+        self._resilient = ResilientCaller(
+            self.circuit_breaker,
+            max_attempts=settings.claude_max_attempts,
+            base_delay_seconds=settings.claude_retry_base_delay_seconds,
+            max_delay_seconds=settings.claude_retry_max_delay_seconds,
+            hedge_after_seconds=settings.claude_hedge_after_seconds,
+            deadline_seconds=settings.claude_deadline_seconds,
+        )
+
+    @property
+    def async_client(self) -> AsyncAnthropic:
+        """
+        Async Claude client backed by a shared, size-limited connection pool.
 
-    def generate_questions(
+        Created lazily so the pool and limiter bind to the running event loop.
+        """
+        if self._async_client is None:
+            http_client = DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=settings.claude_max_connections,
+                    max_keepalive_connections=settings.claude_max_keepalive_connections,
+                    keepalive_expiry=settings.claude_keepalive_expiry_seconds,
+                ),
+                timeout=httpx.Timeout(settings.claude_timeout_seconds, connect=5.0),
+            )
+            # Retries are handled by the resilience layer, not the SDK
+            self._async_client = AsyncAnthropic(
+                api_key=settings.claude_api_key,
+                base_url=settings.claude_base_url,
+                http_client=http_client,
+                max_retries=0,
+            )
+            self._limiter = asyncio.Semaphore(max(1, settings.claude_max_concurrency))
+        return self._async_client
+
+    async def _parse_async(self, **kwargs):
+        """
+        Send a structured-output request with retries, hedging and circuit breaking.
+
+        Every attempt waits for a free upstream slot; a slow attempt is only
+        hedged while a slot is free, so hedges never queue behind other requests.
+
+        Raises:
+            UpstreamUnavailableError: If Claude is unavailable or kept failing
+        """
+        client = self.async_client
+
+        async def request():
+            async with self._limiter:
+                return await client.beta.messages.parse(
+                    model=self.model,
+                    betas=[STRUCTURED_OUTPUTS_BETA],
+                    **kwargs,
+                )
+
+        return await self._resilient.call(
+            request, can_hedge=lambda: not self._limiter.locked()
+        )
+
+    def _cached_questions(
         self, job_description_text: str, company_name: str, job_title: str
-    ) -> List[str]:
+    ) -> Tuple[Optional[str], Optional[List[str]]]:
+        """Return the question cache key and any cached questions for a job description."""
+        if not self._question_cache.enabled:
+            return None, None
+        key = QuestionCache.make_key(
+            company_name, job_title, job_description_text, self.model
+        )
+        return key, self._question_cache.get(key)
+
+    async def stream_questions(
+        self,
+        job_description_text: str,
+        company_name: str,
+        job_title: str,
+        force_refresh: bool = False,
+    ) -> AsyncIterator[str]:
         """
-        Generate 5 behavioral interview questions based on job description.
+        Generate interview questions, yielding each one as soon as it is complete.
 
         Args:
             job_description_text: Extracted text from job description
             company_name: Name of the company
             job_title: Title of the job position
+            force_refresh: Generate new questions even if this posting is cached
 
-        Returns:
-            List of 5 question strings
+        Yields:
+            Question strings in order
 
         Raises:
-            Exception: If Claude API call fails
+            UpstreamUnavailableError: If Claude is unavailable or kept failing
+            Exception: If the Claude API rejects the request
+        """
+        cache_key, cached = self._cached_questions(
+            job_description_text, company_name, job_title
+        )
+        if cached is not None and not force_refresh:
+            logger.info('Question cache hit, skipping Claude')
+            for question in cached:
+                yield question
+            return
+
+        prompt = _questions_prompt(job_description_text, company_name, job_title)
+        client = self.async_client
+        questions: List[str] = []
+
+        async def attempt() -> AsyncGenerator[str, None]:
+            emitted = 0
+            async with self._limiter:
+                async with client.beta.messages.stream(
+                    model=self.model,
+                    max_tokens=2000,
+                    betas=[STRUCTURED_OUTPUTS_BETA],
+                    messages=[{'role': 'user', 'content': prompt}],
+                    output_format=QuestionsList,
+                ) as stream:
+                    async for event in stream:
+                        if event.type != 'text':
+                            continue
+                        complete = _complete_questions(event.snapshot)
+                        for question in complete[emitted:]:
+                            yield question
+                        emitted = max(emitted, len(complete))
+
+                    final_message = await stream.get_final_message()
+
+            # Validate the complete output and emit anything the snapshots missed
+            questions.extend(_parse_questions(final_message))
+            for question in questions[emitted:]:
+                yield question
+
+        # Failures before the first question are retried; later ones are raised
+        async for question in self._resilient.stream(attempt):
+            yield question
+
+        if cache_key:
+            self._question_cache.set(cache_key, questions)
+
+    async def evaluate_response_async(
+        self, job_description_text: str, question_text: str, transcript: str
+    ) -> Dict[str, Any]:
         """
-        prompt = dedent(f"""\
-            You are an expert interview coach. Based on the following job description, generate exactly 5 behavioral interview questions that are tailored to this specific role.
+        Evaluate user's response without blocking the event loop.
 
-            Company: {company_name}
-            Job Title: {job_title}
+        Args:
+            job_description_text: Original job description text
+            question_text: The interview question
+            transcript: User's transcribed response
 
-            Job Description:
-            {job_description_text}
+        Returns:
+            Dictionary containing scores and feedback
 
-            Generate 5 behavioral interview questions that:
-            1. Are specific to this role and company
-            2. Follow the STAR method (Situation, Task, Action, Result)
-            3. Test relevant competencies for this position
-            4. Are clear and professionally worded
-            5. Cover different aspects of the role
-            """)
+        Raises:
+            UpstreamUnavailableError: If Claude is unavailable or kept failing
+            Exception: If the Claude API rejects the request
+        """
+        prompt = _evaluation_prompt(question_text, transcript)
 
-        response = self.client.beta.messages.parse(
-            model=self.model,
-            max_tokens=2000,
-            betas=['structured-outputs-2025-11-13'],
+        response = await self._parse_async(
+            max_tokens=3000,
+            system=_evaluation_system(job_description_text),
             messages=[{'role': 'user', 'content': prompt}],
-            output_format=QuestionsList,
+            output_format=EvaluationResult,
         )
 
-        if response.parsed_output is None:
-            raise Exception('Failed to parse questions from Claude response')
-        return response.parsed_output.questions
+        self.prompt_cache_stats.record(response.usage)
+        return _parse_evaluation(response)
 
-    def evaluate_response(
+    async def stream_evaluation(
         self, job_description_text: str, question_text: str, transcript: str
-    ) -> Dict[str, Any]:
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
         """
-        Evaluate user's response using Claude API with structured outputs.
+        Evaluate user's response, yielding each criterion as soon as it is complete.
 
         Args:
             job_description_text: Original job description text
             question_text: The interview question
             transcript: User's transcribed response
 
-        Returns:
-            Dictionary containing scores and feedback
+        Yields:
+            ('criterion', {'criterion', 'score', 'feedback'}) for each criterion in
+            order, then ('result', evaluation) with the dictionary returned by
+            evaluate_response_async()
 
         Raises:
-            Exception: If Claude API call fails
+            UpstreamUnavailableError: If Claude is unavailable or kept failing
+            Exception: If the Claude API rejects the request
         """
-        prompt = dedent(f"""\
-            You are an expert interview coach evaluating a candidate's response to a behavioral interview question.
-
-            Job Description:
-            {job_description_text}
+        prompt = _evaluation_prompt(question_text, transcript)
+        client = self.async_client
+
+        async def attempt() -> AsyncGenerator[Tuple[str, Dict[str, Any]], None]:
+            emitted = 0
+            async with self._limiter:
+                async with client.beta.messages.stream(
+                    model=self.model,
+                    max_tokens=3000,
+                    betas=[STRUCTURED_OUTPUTS_BETA],
+                    system=_evaluation_system(job_description_text),
+                    messages=[{'role': 'user', 'content': prompt}],
+                    output_format=StreamedEvaluationResult,
+                ) as stream:
+                    async for event in stream:
+                        if event.type != 'text':
+                            continue
+                        criteria = _complete_criteria(event.snapshot)
+                        for criterion, value in criteria[emitted:]:
+                            yield 'criterion', {
+                                'criterion': criterion,
+                                'score': value.get('score'),
+                                'feedback': value['feedback'],
+                            }
+                        emitted = max(emitted, len(criteria))
+
+                    final_message = await stream.get_final_message()
+
+            self.prompt_cache_stats.record(final_message.usage)
+            if final_message.parsed_output is None:
+                raise Exception('Failed to parse evaluation from Claude response')
+            result = final_message.parsed_output
+
+            # Emit anything the snapshots missed from the validated output
+            for criterion in CRITERIA[emitted:]:
+                value = getattr(result, criterion)
+                yield 'criterion', {
+                    'criterion': criterion,
+                    'score': value.score,
+                    'feedback': value.feedback,
+                }
+
+            yield 'result', {
+                'scores': {c: getattr(result, c).score for c in CRITERIA},
+                'feedback': {c: getattr(result, c).feedback for c in CRITERIA},
+                'overall_comment': result.overall_comment,
+            }
+
+        # Failures before the first criterion are retried; later ones are raised
+        async for item in self._resilient.stream(attempt):
+            yield item
+
+    def evaluation_batch_request(
+        self,
+        custom_id: str,
+        job_description_text: str,
+        question_text: str,
+        transcript: str,
+    ) -> Dict[str, Any]:
+        """
+        Build a Message Batches request that evaluates one response.
 
-            Interview Question:
-            {question_text}
+        Uses the same prompt, including its cache breakpoint, as evaluate_response_async().
 
-            Candidate's Response:
-            {transcript}
+        Args:
+            custom_id: ID used to match the result to the request
+            job_description_text: Original job description text
+            question_text: The interview question
+            transcript: User's transcribed response
 
-            Evaluate the response on the following criteria (score 1-10 for each):
+        Returns:
+            Request for create_batch()
+        """
+        return {
+            'custom_id': custom_id,
+            'params': {
+                'model': self.model,
+                'max_tokens': 3000,
+                'system': _evaluation_system(job_description_text),
+                'messages': [
+                    {
+                        'role': 'user',
+                        'content': _evaluation_prompt(question_text, transcript),
+                    }
+                ],
+                'output_format': {
+                    'type': 'json_schema',
+                    'schema': transform_schema(EvaluationResult),
+                },
+            },
+        }
 
-            1. **Confidence**: How confident and self-assured does the candidate sound?
-            2. **Clarity/Structure**: How well-structured and clear is the response? Does it follow STAR method?
-            3. **Technical Depth**: How well does the response demonstrate relevant technical/domain knowledge?
-            4. **Communication Skills**: How effectively does the candidate communicate their ideas?
-            5. **Relevance/Alignment**: How well does the response align with the job requirements?
+    async def create_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Submit requests to the Message Batches API.
 
-            For each category, provide:
-            - A score from 1 to 10
-            - Concise, actionable feedback (2-3 sentences)
+        Args:
+            requests: Requests built by evaluation_batch_request()
 
-            Also provide an overall comment summarizing the response quality and key areas for improvement.
-            """)
+        Returns:
+            ID of the created batch
+        """
+        batch = await self.async_client.beta.messages.batches.create(
+            requests=requests, betas=[STRUCTURED_OUTPUTS_BETA]
+        )
+        return batch.id
 
-        response = self.client.beta.messages.parse(
-            model=self.model,
-            max_tokens=3000,
-            betas=['structured-outputs-2025-11-13'],
-            messages=[{'role': 'user', 'content': prompt}],
-            output_format=EvaluationResult,
+    async def batch_status(self, batch_id: str) -> str:
+        """Return a batch's processing status: in_progress, canceling or ended."""
+        batch = await self.async_client.beta.messages.batches.retrieve(
+            batch_id, betas=[STRUCTURED_OUTPUTS_BETA]
         )
+        return batch.processing_status
 
-        if response.parsed_output is None:
-            raise Exception('Failed to parse evaluation from Claude response')
+    async def evaluation_batch_results(
+        self, batch_id: str
+    ) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Stream the evaluations of an ended batch.
 
-        result = response.parsed_output
+        Args:
+            batch_id: ID of a batch whose processing has ended
 
-        # Convert to dictionary format expected by the API
-        return {
-            'scores': result.scores.model_dump(),
-            'feedback': result.feedback.model_dump(),
-            'overall_comment': result.overall_comment,
-        }
+        Yields:
+            (custom_id, evaluation, None) for each successful request and
+            (custom_id, None, error) for each failed one
+        """
+        results = await self.async_client.beta.messages.batches.results(
+            batch_id, betas=[STRUCTURED_OUTPUTS_BETA]
+        )
+        async for entry in results:
+            if entry.result.type != 'succeeded':
+                error = getattr(entry.result, 'error', None)
+                yield entry.custom_id, None, str(error or entry.result.type)
+                continue
+
+            text = ''.join(
+                block.text
+                for block in entry.result.message.content
+                if block.type == 'text'
+            )
+            try:
+                yield entry.custom_id, parse_evaluation_text(text), None
+            except ValueError as e:
+                yield entry.custom_id, None, f'Invalid evaluation: {e}'
+
+    async def aclose(self) -> None:
+        """Close the async client's connection pool."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+            self._limiter = None
 
 
 # Global service instance
@@ -0,0 +1,237 @@
+"""Evaluation of stored responses and tracking of their evaluation state."""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Tuple
+
+from app.core.config import settings
+from app.models.job_description import JobDescription
+from app.models.response import EvaluationStatus, ProcessingStage, Response
+from app.models.response_score import ResponseScore
+from app.services.claude_service import RUBRIC_VERSION, claude_service
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# ResponseScore columns replaced when a response is re-scored
+RESCORED_COLUMNS = [
+    'scores_json',
+    'score_confidence',
+    'score_clarity_structure',
+    'score_technical_depth',
+    'score_communication_skills',
+    'score_relevance',
+    'evaluation_model',
+    'rubric_version',
+    'created_at',
+]
+
+
+def _score_values(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the ResponseScore column values for an evaluation by the current model and rubric."""
+    scores = evaluation['scores']
+    return {
+        'scores_json': evaluation,
+        'score_confidence': scores.get('confidence'),
+        'score_clarity_structure': scores.get('clarity_structure'),
+        'score_technical_depth': scores.get('technical_depth'),
+        'score_communication_skills': scores.get('communication_skills'),
+        'score_relevance': scores.get('relevance'),
+        'evaluation_model': claude_service.model,
+        'rubric_version': RUBRIC_VERSION,
+    }
+
+
+class EvaluationService:
+    """
+    Scores stored responses with Claude and records the outcome on the response.
+
+    A response starts out pending. It becomes scored once its ResponseScore is
+    written, or failed after settings.evaluation_max_attempts failed attempts.
+    Until then every failure schedules the next attempt with exponential
+    backoff, which the evaluation worker picks up.
+    """
+
+    @staticmethod
+    def job_description_text(db: Session, response: Response) -> str:
+        """Return the text of the job description a response's question came from."""
+        job_description = (
+            db.query(JobDescription)
+            .filter(JobDescription.id == response.question.job_description_id)
+            .first()
+        )
+        return str(job_description.description_text) if job_description else ''
+
+    def evaluation_inputs(self, db: Session, response: Response) -> Tuple[str, str, str]:
+        """Return the job description, question and transcript Claude evaluates."""
+        return (
+            self.job_description_text(db, response),
+            str(response.question.question_text),
+            str(response.transcript),
+        )
+
+    def store(
+        self, db: Session, response: Response, evaluation: Dict[str, Any]
+    ) -> ResponseScore:
+        """
+        Store Claude's evaluation of a response and mark it scored.
+
+        A response that already has a score, because another worker or
+        request evaluated it concurrently, keeps that score and is still
+        marked scored.
+
+        Args:
+            db: Database session
+            response: Evaluated response
+            evaluation: Scores, feedback and overall comment from Claude
+
+        Returns:
+            The stored score record
+        """
+        db.execute(
+            insert(ResponseScore)
+            .values(
+                id=uuid.uuid4(),
+                response_id=response.id,
+                created_at=datetime.now(timezone.utc),
+                **_score_values(evaluation),
+            )
+            .on_conflict_do_nothing(index_elements=[ResponseScore.response_id])
+        )
+        response.evaluation_status = EvaluationStatus.SCORED
+        response.evaluation_error = None
+        response.evaluation_next_attempt_at = None
+        response.processing_stage = ProcessingStage.EVALUATED
+        db.commit()
+        # Reload here so callers on the event loop can read the response without querying
+        db.refresh(response)
+
+        response_score = (
+            db.query(ResponseScore)
+            .filter(ResponseScore.response_id == response.id)
+            .one()
+        )
+        logger.info(f'Successfully processed response {response.id}')
+        return response_score
+
+    def store_many(
+        self, db: Session, evaluations: Dict[uuid.UUID, Dict[str, Any]]
+    ) -> None:
+        """
+        Store evaluations of many responses at once, replacing any existing scores.
+
+        Writes all score rows with a single upsert and marks the responses scored.
+
+        Args:
+            db: Database session
+            evaluations: Evaluations keyed by response ID
+        """
+        if not evaluations:
+            return
+
+        now = datetime.now(timezone.utc)
+        statement = insert(ResponseScore).values(
+            [
+                {
+                    'id': uuid.uuid4(),
+                    'response_id': response_id,
+                    'created_at': now,
+                    **_score_values(evaluation),
+                }
+                for response_id, evaluation in evaluations.items()
+            ]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[ResponseScore.response_id],
+            set_={column: statement.excluded[column] for column in RESCORED_COLUMNS},
+        )
+        db.execute(statement)
+        db.execute(
+            update(Response)
+            .where(Response.id.in_(list(evaluations)))
+            .values(
+                evaluation_status=EvaluationStatus.SCORED,
+                evaluation_error=None,
+                evaluation_next_attempt_at=None,
+                processing_stage=ProcessingStage.EVALUATED,
+            )
+        )
+        db.commit()
+
+    def record_failure(self, db: Session, response: Response, error: Exception) -> None:
+        """
+        Record a failed evaluation attempt and schedule the next one.
+
+        Args:
+            db: Database session
+            response: Response whose evaluation failed
+            error: Error raised by the attempt
+        """
+        # Discard anything the failed attempt left in the session
+        db.rollback()
+
+        attempts = (response.evaluation_attempts or 0) + 1
+        response.evaluation_attempts = attempts
+        response.evaluation_error = str(error)
+
+        if attempts >= settings.evaluation_max_attempts:
+            response.evaluation_status = EvaluationStatus.FAILED
+            response.evaluation_next_attempt_at = None
+            logger.error(
+                f'Evaluation of response {response.id} failed {attempts} times, giving up: {error}'
+            )
+        else:
+            delay = max(
+                settings.evaluation_retry_delay_seconds * 2 ** (attempts - 1),
+                claude_service.circuit_breaker.retry_after,
+            )
+            response.evaluation_next_attempt_at = datetime.now(timezone.utc) + timedelta(
+                seconds=delay
+            )
+            logger.warning(
+                f'Evaluation of response {response.id} failed (attempt {attempts}), '
+                f'retrying in {delay:.0f}s: {error}'
+            )
+
+        db.commit()
+        db.refresh(response)
+
+    async def evaluate(self, db: Session, response: Response) -> Dict[str, Any]:
+        """
+        Evaluate a stored response with Claude and store the result.
+
+        Failures are recorded on the response before being re-raised. Session
+        work runs in threads, so only the Claude call is awaited on the event
+        loop.
+
+        Args:
+            db: Database session
+            response: Response to evaluate
+
+        Returns:
+            Evaluation with scores, feedback and overall comment
+
+        Raises:
+            Exception: If the evaluation fails
+        """
+        logger.info(f'Evaluating response {response.id}')
+        try:
+            job_description_text, question_text, transcript = await asyncio.to_thread(
+                self.evaluation_inputs, db, response
+            )
+            evaluation = await claude_service.evaluate_response_async(
+                job_description_text, question_text, transcript
+            )
+            await asyncio.to_thread(self.store, db, response, evaluation)
+        except Exception as e:
+            await asyncio.to_thread(self.record_failure, db, response, e)
+            raise
+        return evaluation
+
+
+# Global service instance
+evaluation_service = EvaluationService()
@@ -0,0 +1,129 @@
+"""Background worker that evaluates responses left without a score."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Set
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.response import EvaluationStatus, ProcessingStage, Response
+from app.services.claude_service import claude_service
+from app.services.evaluation_service import evaluation_service
+from sqlalchemy import and_, or_
+
+logger = logging.getLogger(__name__)
+
+
+class EvaluationWorker:
+    """
+    Polls the database for pending responses and evaluates them.
+
+    Picks up responses whose retry is due, and responses that were never
+    scheduled but are older than the lease (their request died mid-evaluation).
+    The state lives in the responses table, so nothing is lost on restart, and
+    rows are claimed with SKIP LOCKED so several processes can run the worker.
+    At most settings.evaluation_worker_concurrency evaluations run at once.
+    """
+
+    def __init__(self):
+        """Initialize a stopped worker."""
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start polling on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info('Evaluation worker started')
+
+    async def stop(self) -> None:
+        """Stop polling and cancel in-flight evaluations; their leases expire and they are retried."""
+        tasks = list(self._in_flight)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self) -> None:
+        """Claim and evaluate due responses until stopped."""
+        concurrency = max(1, settings.evaluation_worker_concurrency)
+        while True:
+            free = concurrency - len(self._in_flight)
+            # Leave responses alone while Claude is known to be down
+            if free > 0 and not claude_service.circuit_breaker.is_open:
+                try:
+                    response_ids = await asyncio.to_thread(self._claim, free)
+                except Exception as e:
+                    logger.error(f'Evaluation worker failed to claim responses: {e}')
+                    response_ids = []
+
+                for response_id in response_ids:
+                    task = asyncio.create_task(self._evaluate(response_id))
+                    self._in_flight.add(task)
+                    task.add_done_callback(self._in_flight.discard)
+
+            await asyncio.sleep(settings.evaluation_worker_poll_seconds)
+
+    @staticmethod
+    def _claim(limit: int) -> List[UUID]:
+        """
+        Claim up to limit due responses by pushing their next attempt past the lease.
+
+        Returns:
+            IDs of the claimed responses
+        """
+        now = datetime.now(timezone.utc)
+        lease = timedelta(seconds=settings.evaluation_lease_seconds)
+
+        db = SessionLocal()
+        try:
+            responses = (
+                db.query(Response)
+                .filter(
+                    Response.evaluation_status == EvaluationStatus.PENDING,
+                    # Earlier stages belong to the response pipeline
+                    Response.processing_stage == ProcessingStage.STORED,
+                    or_(
+                        Response.evaluation_next_attempt_at <= now,
+                        and_(
+                            Response.evaluation_next_attempt_at.is_(None),
+                            Response.created_at <= now - lease,
+                        ),
+                    ),
+                )
+                .order_by(Response.created_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            for response in responses:
+                response.evaluation_next_attempt_at = now + lease
+            db.commit()
+            return [response.id for response in responses]
+        finally:
+            db.close()
+
+    @staticmethod
+    async def _evaluate(response_id: UUID) -> None:
+        """Evaluate one claimed response with its own database session."""
+        db = SessionLocal()
+        try:
+            response = await asyncio.to_thread(
+                lambda: db.query(Response).filter(Response.id == response_id).first()
+            )
+            if response is None or response.evaluation_status != EvaluationStatus.PENDING:
+                return
+            await evaluation_service.evaluate(db, response)
+        except Exception as e:
+            # Already recorded on the response by the evaluation service
+            logger.debug(f'Background evaluation of response {response_id} failed: {e}')
+        finally:
+            db.close()
+
+
+# Global worker instance
+evaluation_worker = EvaluationWorker()
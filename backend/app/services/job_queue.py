@@ -0,0 +1,178 @@
+"""Durable Postgres queue of response processing jobs."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List
+from uuid import UUID
+
+from app.core.config import settings
+from app.models.processing_job import JobStatus, ProcessingJob
+from app.models.response import Response
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue:
+    """
+    Queue of processing jobs stored in the processing_jobs table.
+
+    Jobs are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so any number of
+    worker processes on any number of machines can share the table without
+    two of them running the same job. A claimed job holds a lease that its
+    worker renews while it runs; a job whose lease expires belonged to a dead
+    worker and is claimed again. Failed jobs are retried with exponential
+    backoff and dead-lettered after settings.pipeline_max_attempts attempts,
+    staying in the table with their last error until requeued.
+    """
+
+    @staticmethod
+    def _lease_expiry(now: datetime) -> datetime:
+        """Return when a lease taken or renewed now runs out."""
+        return now + timedelta(seconds=settings.pipeline_lease_seconds)
+
+    def enqueue(self, db: Session, response: Response) -> ProcessingJob:
+        """
+        Queue a received response for processing.
+
+        The job is added to the session and committed together with the response.
+
+        Args:
+            db: Database session
+            response: Received response
+
+        Returns:
+            The queued job
+        """
+        job = ProcessingJob(response=response, status=JobStatus.QUEUED)
+        db.add(job)
+        return job
+
+    def claim(self, db: Session, worker_id: str, limit: int) -> List[UUID]:
+        """
+        Claim up to limit due jobs, including jobs whose worker's lease expired.
+
+        Every claim counts as an attempt, so a job that keeps killing its
+        worker is eventually dead-lettered.
+
+        Args:
+            db: Database session
+            worker_id: Identifier of the claiming worker
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            IDs of the claimed jobs
+        """
+        now = datetime.now(timezone.utc)
+        jobs = (
+            db.query(ProcessingJob)
+            .filter(
+                or_(
+                    and_(
+                        ProcessingJob.status == JobStatus.QUEUED,
+                        ProcessingJob.run_after <= now,
+                    ),
+                    and_(
+                        ProcessingJob.status == JobStatus.RUNNING,
+                        ProcessingJob.lease_expires_at < now,
+                    ),
+                )
+            )
+            .order_by(ProcessingJob.run_after)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        for job in jobs:
+            if job.status == JobStatus.RUNNING:
+                logger.warning(f'Reclaiming job {job.id} from {job.worker_id}, whose lease expired')
+            job.status = JobStatus.RUNNING
+            job.attempts += 1
+            job.worker_id = worker_id
+            job.lease_expires_at = self._lease_expiry(now)
+            job.updated_at = now
+        db.commit()
+        return [job.id for job in jobs]
+
+    def renew(self, db: Session, job_id: UUID, worker_id: str) -> bool:
+        """
+        Extend the lease of a running job.
+
+        Returns:
+            False if the job is no longer held by this worker
+        """
+        now = datetime.now(timezone.utc)
+        result = db.execute(
+            update(ProcessingJob)
+            .where(
+                ProcessingJob.id == job_id,
+                ProcessingJob.worker_id == worker_id,
+                ProcessingJob.status == JobStatus.RUNNING,
+            )
+            .values(lease_expires_at=self._lease_expiry(now), updated_at=now)
+        )
+        db.commit()
+        return result.rowcount == 1
+
+    def complete(self, db: Session, job: ProcessingJob) -> None:
+        """Mark a job as done."""
+        job.status = JobStatus.SUCCEEDED
+        job.lease_expires_at = None
+        job.last_error = None
+        job.updated_at = datetime.now(timezone.utc)
+        db.commit()
+
+    def release(self, db: Session, job: ProcessingJob, delay_seconds: float = 0.0) -> None:
+        """
+        Return an interrupted job to the queue without counting the attempt.
+
+        Args:
+            db: Database session
+            job: Interrupted job
+            delay_seconds: How long to wait before the job may be claimed again
+        """
+        now = datetime.now(timezone.utc)
+        job.status = JobStatus.QUEUED
+        job.attempts = max(0, job.attempts - 1)
+        job.run_after = now + timedelta(seconds=delay_seconds)
+        job.lease_expires_at = None
+        job.updated_at = now
+        db.commit()
+
+    def fail(self, db: Session, job: ProcessingJob, error: Exception) -> bool:
+        """
+        Record a failed attempt, scheduling a retry or dead-lettering the job.
+
+        Args:
+            db: Database session
+            job: Failed job
+            error: Error raised by the attempt
+
+        Returns:
+            True if the job was dead-lettered
+        """
+        now = datetime.now(timezone.utc)
+        job.last_error = str(error)
+        job.lease_expires_at = None
+        job.updated_at = now
+
+        if job.attempts >= settings.pipeline_max_attempts:
+            job.status = JobStatus.DEAD
+            logger.error(
+                f'Job {job.id} failed {job.attempts} times, dead-lettering it: {error}'
+            )
+        else:
+            delay = settings.pipeline_retry_delay_seconds * 2 ** (job.attempts - 1)
+            job.status = JobStatus.QUEUED
+            job.run_after = now + timedelta(seconds=delay)
+            logger.warning(
+                f'Job {job.id} failed (attempt {job.attempts}), retrying in {delay:.0f}s: {error}'
+            )
+
+        db.commit()
+        return job.status == JobStatus.DEAD
+
+
+# Global queue instance
+job_queue = JobQueue()
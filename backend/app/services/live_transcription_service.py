@@ -0,0 +1,244 @@
+"""Incremental transcription of audio while it is still being recorded."""
+
+import asyncio
+import io
+import logging
+import threading
+from typing import List, Optional
+
+import av
+import numpy as np
+from app.services.whisper_service import (
+    NO_SPEECH_TRANSCRIPT,
+    SAMPLE_RATE,
+    VAD_MIN_SILENCE_DURATION_MS,
+    TranscriptionQueueFullError,
+    whisper_service,
+)
+
+logger = logging.getLogger(__name__)
+
+# Minimum amount of new audio before looking for finished speech segments
+MIN_PENDING_SECONDS = 2.0
+
+# Speech ending this close to the newest sample may still continue
+TAIL_GUARD_SECONDS = 1.0
+
+# Longest speech segment VAD may produce before forcing a split
+MAX_SEGMENT_SECONDS = 30
+
+
+class _ChunkStream(io.RawIOBase):
+    """Blocking, read-only file object fed with encoded chunks as they arrive."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._condition = threading.Condition()
+        self._finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def push(self, data: bytes) -> None:
+        """Make more encoded audio available to the reader."""
+        with self._condition:
+            self._buffer += data
+            self._condition.notify_all()
+
+    def finish(self) -> None:
+        """Signal end of stream; the reader sees EOF once the buffer is drained."""
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+    def abort(self) -> None:
+        """Drop buffered data and signal end of stream immediately."""
+        with self._condition:
+            self._buffer.clear()
+            self._finished = True
+            self._condition.notify_all()
+
+    def readinto(self, target) -> int:
+        with self._condition:
+            while not self._buffer and not self._finished:
+                self._condition.wait()
+            size = min(len(target), len(self._buffer))
+            target[:size] = self._buffer[:size]
+            del self._buffer[:size]
+            return size
+
+
+class LiveTranscriptionSession:
+    """
+    Transcribes a recording incrementally as encoded chunks arrive.
+
+    A decoder thread turns the growing webm/ogg stream into 16 kHz samples.
+    Speech segments that VAD reports as finished are transcribed on the
+    Whisper worker pool, so when recording stops only the final segment is
+    left to transcribe. The decoding profile is chosen from the load when the
+    session starts and used for every segment, so the transcript is consistent.
+    Once more than max_duration_seconds of audio has been decoded, decoding
+    and partial transcription stop and the session reports itself too long.
+    """
+
+    def __init__(self, max_duration_seconds: Optional[float] = None):
+        """
+        Start the decoder thread for a new recording.
+
+        Args:
+            max_duration_seconds: Longest recording to decode and transcribe
+        """
+        self.profile = whisper_service.select_profile()
+        self._max_samples = (
+            int(max_duration_seconds * SAMPLE_RATE) if max_duration_seconds else None
+        )
+        self._decoded_samples = 0
+        self._stream = _ChunkStream()
+        self._encoded = bytearray()
+        self._samples: List[np.ndarray] = []
+        self._samples_lock = threading.Lock()
+        self._parts: List[str] = []
+        self._decode_error: Optional[Exception] = None
+        self._decoder = threading.Thread(
+            target=self._decode, name='live-decoder', daemon=True
+        )
+        self._decoder.start()
+
+    @property
+    def audio(self) -> bytes:
+        """Complete encoded recording received so far."""
+        return bytes(self._encoded)
+
+    @property
+    def size(self) -> int:
+        """Number of encoded bytes received so far."""
+        return len(self._encoded)
+
+    @property
+    def transcript(self) -> str:
+        """Transcript of every committed segment."""
+        return ' '.join(self._parts).strip()
+
+    @property
+    def too_long(self) -> bool:
+        """Whether more audio than the maximum duration has been decoded."""
+        return self._max_samples is not None and self._decoded_samples > self._max_samples
+
+    def feed(self, chunk: bytes) -> None:
+        """Add the next encoded chunk of the recording."""
+        self._encoded += chunk
+        self._stream.push(chunk)
+
+    def _decode(self) -> None:
+        """Decoder thread: decode and resample the stream until it ends."""
+        resampler = av.audio.resampler.AudioResampler(
+            format='flt', layout='mono', rate=SAMPLE_RATE
+        )
+        try:
+            with av.open(self._stream, mode='r', metadata_errors='ignore') as container:
+                for frame in container.decode(audio=0):
+                    for resampled in resampler.resample(frame):
+                        self._append_samples(resampled.to_ndarray()[0])
+                    if self.too_long:
+                        logger.warning('Live recording exceeded the maximum duration')
+                        return
+            for resampled in resampler.resample(None):
+                self._append_samples(resampled.to_ndarray()[0])
+        except Exception as e:
+            self._decode_error = e
+            logger.warning(f'Live audio decoding stopped: {e}')
+
+    def _append_samples(self, samples: np.ndarray) -> None:
+        with self._samples_lock:
+            self._samples.append(samples)
+            self._decoded_samples += len(samples)
+
+    def _pending_audio(self) -> np.ndarray:
+        """Return decoded samples that have not been transcribed yet."""
+        with self._samples_lock:
+            if not self._samples:
+                return np.zeros(0, dtype=np.float32)
+            if len(self._samples) > 1:
+                self._samples = [np.concatenate(self._samples)]
+            return self._samples[0]
+
+    def _commit(self, sample_count: int, text: str) -> None:
+        """Record a transcribed slice and drop its samples from the buffer."""
+        if text != NO_SPEECH_TRANSCRIPT:
+            self._parts.append(text)
+        with self._samples_lock:
+            if self._samples:
+                self._samples = [np.concatenate(self._samples)[sample_count:]]
+
+    @staticmethod
+    def _finished_speech_end(audio: np.ndarray) -> int:
+        """Return the sample index where the last finished speech segment ends, or 0."""
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        timestamps = get_speech_timestamps(
+            audio,
+            VadOptions(
+                min_silence_duration_ms=VAD_MIN_SILENCE_DURATION_MS,
+                max_speech_duration_s=MAX_SEGMENT_SECONDS,
+            ),
+        )
+        limit = len(audio) - int(TAIL_GUARD_SECONDS * SAMPLE_RATE)
+        finished = [ts['end'] for ts in timestamps if ts['end'] <= limit]
+        return finished[-1] if finished else 0
+
+    async def _transcribe_segment(self, audio: np.ndarray) -> None:
+        """Transcribe a slice from the start of the pending audio and commit it."""
+        text = await whisper_service.transcribe_async(audio, self.profile)
+        self._commit(len(audio), text)
+
+    async def transcribe_ready(self) -> Optional[str]:
+        """
+        Transcribe speech segments that finished since the last call.
+
+        Returns:
+            The updated transcript, or None if nothing new was transcribed
+        """
+        if self.too_long:
+            return None
+
+        audio = self._pending_audio()
+        if len(audio) < MIN_PENDING_SECONDS * SAMPLE_RATE:
+            return None
+
+        end = await asyncio.to_thread(self._finished_speech_end, audio)
+        if not end:
+            return None
+
+        try:
+            await self._transcribe_segment(audio[:end])
+        except TranscriptionQueueFullError:
+            # Workers are busy; the segment is picked up again on the next call
+            return None
+        return self.transcript
+
+    async def finish(self) -> str:
+        """
+        Stop receiving audio and transcribe whatever is left.
+
+        If the decoder thread failed partway, the incremental transcript is
+        incomplete, so the whole recording is transcribed again instead.
+
+        Returns:
+            Full transcript of the recording
+        """
+        self._stream.finish()
+        await asyncio.to_thread(self._decoder.join)
+
+        if self._decode_error is not None:
+            logger.warning('Live decoding failed, transcribing the full recording')
+            return await whisper_service.transcribe_async(self.audio, self.profile)
+
+        remaining = self._pending_audio()
+        if len(remaining):
+            await self._transcribe_segment(remaining)
+
+        return self.transcript or NO_SPEECH_TRANSCRIPT
+
+    def close(self) -> None:
+        """Abort the session and stop the decoder thread."""
+        self._stream.abort()
@@ -0,0 +1,68 @@
+"""In-memory cache of generated interview questions."""
+
+import hashlib
+import re
+from typing import List, Optional
+
+from app.core.cache import LRUCache
+
+
+class QuestionCache:
+    """
+    Cache of generated question sets keyed by a normalized job description.
+
+    Postings pasted again, by the same or another user, differ at most in
+    case and whitespace, so those are normalized away before hashing.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Number of question sets kept (0 disables the cache)
+            ttl_seconds: How long a question set is reused before regenerating
+        """
+        self._memory: LRUCache[List[str]] = LRUCache(maxsize, ttl_seconds)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything."""
+        return self._memory.maxsize > 0
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Lowercase text and collapse runs of whitespace."""
+        return re.sub(r'\s+', ' ', text).strip().casefold()
+
+    @classmethod
+    def make_key(
+        cls, company_name: str, job_title: str, description_text: str, model: str
+    ) -> str:
+        """
+        Build a cache key from the job description fields and the Claude model.
+
+        Args:
+            company_name: Name of the company
+            job_title: Title of the job position
+            description_text: Job description text
+            model: Claude model generating the questions
+
+        Returns:
+            Hex digest identifying this job description
+        """
+        digest = hashlib.sha256()
+        for part in (company_name, job_title, description_text):
+            digest.update(cls._normalize(part).encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(model.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """Return the cached questions for key, or None on a miss."""
+        questions = self._memory.get(key)
+        return list(questions) if questions is not None else None
+
+    def set(self, key: str, questions: List[str]) -> None:
+        """Store a generated question set."""
+        self._memory.set(key, list(questions))
@@ -0,0 +1,96 @@
+"""Background sweep of job descriptions whose question generation was abandoned."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.job_description import JobDescription, JobDescriptionStatus
+from app.models.question import Question
+
+logger = logging.getLogger(__name__)
+
+INTERRUPTED_MESSAGE = 'Question generation was interrupted. Please submit the job description again.'
+
+
+class QuestionGenerationSweeper:
+    """
+    Marks job descriptions stuck in pending as failed.
+
+    Questions are generated in the process that accepted the job description,
+    so a restart or crash during generation would leave it pending forever
+    and its clients polling. A job description still pending after
+    settings.question_generation_timeout_seconds is given up on: any
+    questions stored so far are deleted and the error is recorded, as for a
+    generation that failed. The update is idempotent, so every API process
+    can run the sweep.
+    """
+
+    def __init__(self):
+        """Initialize a stopped sweeper."""
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start sweeping on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info('Question generation sweeper started')
+
+    async def stop(self) -> None:
+        """Stop sweeping."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        """Sweep until stopped."""
+        while True:
+            try:
+                await asyncio.to_thread(self.sweep)
+            except Exception as e:
+                logger.error(f'Question generation sweep failed: {e}')
+            await asyncio.sleep(settings.question_generation_sweep_seconds)
+
+    @staticmethod
+    def sweep() -> int:
+        """
+        Fail job descriptions that have been pending for too long.
+
+        Returns:
+            Number of job descriptions marked failed
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.question_generation_timeout_seconds
+        )
+
+        db = SessionLocal()
+        try:
+            job_descriptions = (
+                db.query(JobDescription)
+                .filter(
+                    JobDescription.status == JobDescriptionStatus.PENDING,
+                    JobDescription.created_at < cutoff,
+                )
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            for job_description in job_descriptions:
+                db.query(Question).filter(
+                    Question.job_description_id == job_description.id
+                ).delete(synchronize_session=False)
+                job_description.status = JobDescriptionStatus.ERROR  # type: ignore
+                job_description.error_message = INTERRUPTED_MESSAGE  # type: ignore
+                logger.warning(
+                    f'Question generation for job description {job_description.id} was abandoned'
+                )
+            db.commit()
+            return len(job_descriptions)
+        finally:
+            db.close()
+
+
+# Global sweeper instance
+question_generation_sweeper = QuestionGenerationSweeper()
@@ -7,10 +7,14 @@ from typing import BinaryIO
 
 import boto3
 from app.core.config import settings
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
 
 class R2StorageService:
     """Service for Cloudflare R2 storage operations using S3-compatible API."""
@@ -29,14 +33,26 @@ class R2StorageService:
             region_name='auto',  # R2 uses 'auto' for region
         )
 
+        # Uploads above the threshold are split into parts sent in parallel
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.r2_multipart_threshold_mb * MB,
+            multipart_chunksize=settings.r2_multipart_part_size_mb * MB,
+            max_concurrency=settings.r2_multipart_concurrency,
+        )
+
         logger.info(f'R2 storage initialized with bucket: {self.bucket_name}')
 
     def save_audio(self, file: BinaryIO, filename: str) -> str:
         """
         Save audio file to R2.
 
+        Files larger than settings.r2_multipart_threshold_mb are uploaded as
+        a multipart upload whose parts are sent in parallel, so a failed part
+        is retried on its own instead of restarting the whole file. A
+        multipart upload that fails is aborted, leaving no orphaned parts.
+
         Args:
-            file: File object to save
+            file: File object to save, streamed from its current position
             filename: Original filename
 
         Returns:
@@ -51,9 +67,6 @@ class R2StorageService:
             unique_filename = f'{uuid.uuid4()}{file_ext}'
             r2_key = f'audio/{unique_filename}'
 
-            # Read file content
-            content = file.read()
-
             # Determine content type
             content_type = 'audio/webm'
             if file_ext == '.ogg':
@@ -62,17 +75,18 @@ class R2StorageService:
                 content_type = 'audio/wav'
 
             # Upload to R2
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=r2_key,
-                Body=content,
-                ContentType=content_type,
+            self.s3_client.upload_fileobj(
+                file,
+                self.bucket_name,
+                r2_key,
+                ExtraArgs={'ContentType': content_type},
+                Config=self.transfer_config,
             )
 
             logger.info(f'Audio saved to R2: {r2_key}')
             return r2_key
 
-        except ClientError as e:
+        except (ClientError, S3UploadFailedError) as e:
             logger.error(f'Error saving audio to R2: {e}')
             raise Exception(f'Failed to save audio to R2: {str(e)}')
         except Exception as e:
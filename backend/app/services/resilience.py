@@ -0,0 +1,355 @@
+"""Retries, hedged requests and circuit breaking for calls to upstream APIs."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+import anthropic
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Status codes worth retrying: rate limits, timeouts and server-side failures
+# (529 is Anthropic's "overloaded")
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+# Error types that are transient even when reported mid-stream with a 200 status
+RETRYABLE_ERROR_TYPES = {'overloaded_error', 'rate_limit_error', 'api_error'}
+
+
+class UpstreamUnavailableError(Exception):
+    """Raised when an upstream API cannot be reached or keeps failing."""
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """Raised without calling upstream while the circuit breaker is open."""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an error is a transient upstream failure worth retrying."""
+    if isinstance(error, anthropic.APIStatusError):
+        if error.status_code in RETRYABLE_STATUS_CODES:
+            return True
+        body = error.body if isinstance(error.body, dict) else {}
+        details = body.get('error') if isinstance(body.get('error'), dict) else body
+        return details.get('type') in RETRYABLE_ERROR_TYPES
+    return isinstance(
+        error, (anthropic.APIConnectionError, asyncio.TimeoutError, TimeoutError)
+    )
+
+
+def _retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Return the delay requested by the server's Retry-After header, if any."""
+    if not isinstance(error, anthropic.APIStatusError):
+        return None
+    try:
+        return float(error.response.headers.get('retry-after', ''))
+    except ValueError:
+        return None
+
+
+def backoff_delay(
+    attempt: int, base_delay: float, max_delay: float, error: BaseException
+) -> float:
+    """
+    Return how long to wait before the next attempt.
+
+    Uses exponential backoff with full jitter, so clients that failed together
+    do not retry together, and never waits less than the server asked for.
+
+    Args:
+        attempt: Number of the attempt that just failed, starting at 0
+        base_delay: Delay cap for the first retry in seconds
+        max_delay: Upper bound for the exponential delay cap in seconds
+        error: Error raised by the failed attempt
+    """
+    delay = random.uniform(0, min(max_delay, base_delay * 2**attempt))
+    retry_after = _retry_after_seconds(error)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class CircuitBreaker:
+    """
+    Stops calling an upstream API after repeated failures.
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    fail fast with CircuitOpenError. Once reset_timeout_seconds have passed a
+    single trial call is let through; its success closes the circuit and its
+    failure keeps it open for another timeout.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout_seconds: float):
+        """Initialize a closed circuit."""
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        return self._opened_at is not None
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the next trial call is allowed (0 when closed)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout_seconds - time.monotonic())
+
+    def before_call(self) -> None:
+        """
+        Check that a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and no trial call is due
+        """
+        if self._opened_at is None:
+            return
+        if self.retry_after > 0:
+            raise CircuitOpenError(
+                f'{self.name} is unavailable; retrying in {self.retry_after:.0f}s'
+            )
+        # Let this call through as the trial and hold back the others
+        self._opened_at = time.monotonic()
+        logger.info(f'{self.name} circuit half-open, sending a trial request')
+
+    def record_success(self) -> None:
+        """Record a call that reached upstream and close the circuit."""
+        if self._opened_at is not None:
+            logger.info(f'{self.name} circuit closed')
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            if self._opened_at is None:
+                logger.warning(
+                    f'{self.name} circuit opened after {self._failures} consecutive failures'
+                )
+            self._opened_at = time.monotonic()
+
+
+class ResilientCaller:
+    """
+    Runs upstream calls with retries, hedging and a circuit breaker.
+
+    Each call gets an overall deadline. Within it, an attempt that has not
+    finished after hedge_after_seconds is raced against a second identical
+    request, as long as enough of the deadline is left for the hedge to be
+    useful. Transient failures are retried with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        max_attempts: int,
+        base_delay_seconds: float,
+        max_delay_seconds: float,
+        hedge_after_seconds: float,
+        deadline_seconds: float,
+    ):
+        """
+        Initialize the caller.
+
+        Args:
+            breaker: Circuit breaker shared by every call to this upstream
+            max_attempts: Attempts per call, including the first
+            base_delay_seconds: Backoff delay cap for the first retry
+            max_delay_seconds: Upper bound for backoff delays
+            hedge_after_seconds: Start a hedged request after this long (0 disables)
+            deadline_seconds: Time budget for a call across all attempts
+        """
+        self.breaker = breaker
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.hedge_after_seconds = hedge_after_seconds
+        self.deadline_seconds = deadline_seconds
+
+    async def call(
+        self,
+        make_call: Callable[[], Awaitable[T]],
+        can_hedge: Callable[[], bool] = lambda: True,
+    ) -> T:
+        """
+        Run a call with retries and hedging.
+
+        Args:
+            make_call: Starts one request; called again for every retry and hedge
+            can_hedge: Whether there is spare capacity for a hedged request
+
+        Returns:
+            Result of the first successful request
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            UpstreamUnavailableError: If every attempt failed with a transient error
+            Exception: Non-transient errors from the request, unchanged
+        """
+        self.breaker.before_call()
+        deadline = time.monotonic() + self.deadline_seconds
+
+        for attempt in range(self.max_attempts):
+            try:
+                result = await self._attempt(make_call, deadline, can_hedge)
+            except Exception as e:
+                if not is_retryable(e):
+                    # Upstream answered; the request itself was at fault
+                    self.breaker.record_success()
+                    raise
+
+                remaining = deadline - time.monotonic()
+                if attempt + 1 >= self.max_attempts or remaining <= 0:
+                    self.breaker.record_failure()
+                    raise UpstreamUnavailableError(
+                        f'{self.breaker.name} failed after {attempt + 1} attempt(s): {e}'
+                    ) from e
+
+                delay = min(
+                    backoff_delay(
+                        attempt, self.base_delay_seconds, self.max_delay_seconds, e
+                    ),
+                    remaining,
+                )
+                logger.warning(
+                    f'{self.breaker.name} attempt {attempt + 1} failed ({e}); '
+                    f'retrying in {delay:.1f}s'
+                )
+                await asyncio.sleep(delay)
+                # Fail fast if other calls opened the circuit during the backoff
+                self.breaker.before_call()
+                continue
+
+            self.breaker.record_success()
+            return result
+
+        raise AssertionError('unreachable')
+
+    async def stream(
+        self, make_stream: Callable[[], AsyncGenerator[T, None]]
+    ) -> AsyncIterator[T]:
+        """
+        Run a streaming call, retrying transient failures until it yields.
+
+        Items already passed on cannot be taken back, so a stream is only
+        retried while it has not yielded anything; later failures are raised.
+        The deadline covers the whole stream, including waits between items,
+        so a stalled stream gives up its connection once the deadline passes.
+        Streams are not hedged.
+
+        Args:
+            make_stream: Starts one streaming request; called again for every retry
+
+        Yields:
+            Items of the first stream that got going
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            UpstreamUnavailableError: If the stream failed with a transient error
+                or ran past the deadline after yielding, or every attempt did
+                before yielding
+            Exception: Non-transient errors from the request, unchanged
+        """
+        self.breaker.before_call()
+        deadline = time.monotonic() + self.deadline_seconds
+
+        for attempt in range(self.max_attempts):
+            yielded = False
+            stream = make_stream()
+            try:
+                while True:
+                    # Waits in this task, which the stream's HTTP connection belongs to
+                    timeout = asyncio.timeout(deadline - time.monotonic())
+                    try:
+                        async with timeout:
+                            item = await anext(stream)
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError as e:
+                        if not timeout.expired():
+                            raise
+                        raise asyncio.TimeoutError(
+                            f'{self.breaker.name} stream exceeded its {self.deadline_seconds:.0f}s deadline'
+                        ) from e
+                    yielded = True
+                    yield item
+            except Exception as e:
+                if not is_retryable(e):
+                    self.breaker.record_success()
+                    raise
+
+                remaining = deadline - time.monotonic()
+                if yielded or attempt + 1 >= self.max_attempts or remaining <= 0:
+                    self.breaker.record_failure()
+                    raise UpstreamUnavailableError(
+                        f'{self.breaker.name} stream failed after {attempt + 1} attempt(s): {e}'
+                    ) from e
+
+                delay = min(
+                    backoff_delay(
+                        attempt, self.base_delay_seconds, self.max_delay_seconds, e
+                    ),
+                    remaining,
+                )
+                logger.warning(
+                    f'{self.breaker.name} stream attempt {attempt + 1} failed ({e}); '
+                    f'retrying in {delay:.1f}s'
+                )
+                await asyncio.sleep(delay)
+                # Fail fast if other calls opened the circuit during the backoff
+                self.breaker.before_call()
+                continue
+            finally:
+                await stream.aclose()
+
+            self.breaker.record_success()
+            return
+
+    async def _attempt(
+        self,
+        make_call: Callable[[], Awaitable[T]],
+        deadline: float,
+        can_hedge: Callable[[], bool],
+    ) -> T:
+        """Run one attempt, hedging it if it is slow, and return the first success."""
+        tasks = {asyncio.ensure_future(make_call())}
+        hedged = self.hedge_after_seconds <= 0
+        error: Optional[BaseException] = None
+
+        try:
+            while tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(
+                        f'{self.breaker.name} call exceeded its {self.deadline_seconds:.0f}s deadline'
+                    )
+
+                timeout = remaining if hedged else min(remaining, self.hedge_after_seconds)
+                done, tasks = await asyncio.wait(
+                    tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+
+                if not done and not hedged:
+                    hedged = True
+                    # Only hedge when the hedge could still finish within the deadline
+                    if can_hedge() and remaining - timeout > self.hedge_after_seconds:
+                        logger.info(f'{self.breaker.name} request is slow, sending a hedge')
+                        tasks.add(asyncio.ensure_future(make_call()))
+
+            raise error  # type: ignore[misc]
+        finally:
+            for task in tasks:
+                task.cancel()
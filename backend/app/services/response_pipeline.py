@@ -0,0 +1,234 @@
+"""Background processing of submitted responses: transcription and evaluation."""
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Set
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.processing_job import ProcessingJob
+from app.models.response import EvaluationStatus, ProcessingStage, Response
+from app.services.evaluation_service import evaluation_service
+from app.services.job_queue import job_queue
+from app.services.storage_service import storage_service
+from app.services.whisper_service import TranscriptionQueueFullError, whisper_service
+from sqlalchemy.orm import Session, joinedload
+
+logger = logging.getLogger(__name__)
+
+
+class ResponsePipeline:
+    """
+    Works through queued processing jobs, moving each response through
+    received → transcribed → stored → evaluated.
+
+    The API stores the audio in R2 and queues a job when it accepts a
+    response, so any worker can pick the job up. Every stage is committed on
+    the response row, so a retried job resumes from the last completed stage.
+    Runs inside the API process when settings.pipeline_worker_enabled, and on
+    dedicated machines with ``python -m app.worker``. A failed first
+    evaluation is left to the evaluation worker.
+    """
+
+    def __init__(self):
+        """Initialize a stopped pipeline."""
+        self.worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start claiming jobs on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f'Response pipeline worker {self.worker_id} started')
+
+    async def stop(self) -> None:
+        """Stop claiming jobs and return in-flight jobs to the queue."""
+        tasks = list(self._in_flight)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self) -> None:
+        """Claim and process jobs until stopped."""
+        concurrency = max(1, settings.pipeline_concurrency)
+        while True:
+            free = concurrency - len(self._in_flight)
+            if free > 0:
+                try:
+                    job_ids = await asyncio.to_thread(self._claim, free)
+                except Exception as e:
+                    logger.error(f'Response pipeline failed to claim jobs: {e}')
+                    job_ids = []
+
+                for job_id in job_ids:
+                    task = asyncio.create_task(self._process(job_id))
+                    self._in_flight.add(task)
+                    task.add_done_callback(self._in_flight.discard)
+
+            # Poll again after the interval, or as soon as a slot frees up
+            if self._in_flight:
+                await asyncio.wait(
+                    set(self._in_flight),
+                    timeout=settings.pipeline_poll_seconds,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            else:
+                await asyncio.sleep(settings.pipeline_poll_seconds)
+
+    def _claim(self, limit: int) -> List[UUID]:
+        """Claim up to limit jobs with a short-lived session."""
+        db = SessionLocal()
+        try:
+            return job_queue.claim(db, self.worker_id, limit)
+        finally:
+            db.close()
+
+    def _renew(self, job_id: UUID) -> bool:
+        """Renew the lease of a running job with a short-lived session."""
+        db = SessionLocal()
+        try:
+            return job_queue.renew(db, job_id, self.worker_id)
+        finally:
+            db.close()
+
+    async def _keep_lease(self, job_id: UUID) -> None:
+        """Renew a job's lease until cancelled, so long transcriptions are not reclaimed."""
+        while True:
+            await asyncio.sleep(settings.pipeline_lease_seconds / 3)
+            try:
+                if not await asyncio.to_thread(self._renew, job_id):
+                    logger.warning(f'Job {job_id} is no longer leased by {self.worker_id}')
+                    return
+            except Exception as e:
+                logger.error(f'Failed to renew the lease of job {job_id}: {e}')
+
+    async def _process(self, job_id: UUID) -> None:
+        """
+        Run one claimed job with its own database session.
+
+        Session work runs in threads so the event loop, which may be serving
+        API requests, only waits on transcription and Claude. Objects keep
+        their state across commits, so reading them here never queries.
+        """
+        db = SessionLocal(expire_on_commit=False)
+        try:
+            job = await asyncio.to_thread(self._load, db, job_id)
+            if job is None:
+                return
+            response = job.response
+
+            lease = asyncio.create_task(self._keep_lease(job_id))
+            try:
+                if job.attempts > settings.pipeline_max_attempts:
+                    # The previous attempts died with their workers
+                    raise RuntimeError('Processing was interrupted too many times')
+                if response.processing_stage == ProcessingStage.RECEIVED:
+                    await self._transcribe(db, response)
+                if response.processing_stage == ProcessingStage.TRANSCRIBED:
+                    await asyncio.to_thread(self._mark_stored, db, response)
+            except asyncio.CancelledError:
+                await asyncio.to_thread(self._release, db, job)
+                raise
+            except TranscriptionQueueFullError:
+                # Not the job's fault; try again once the pool has drained a little
+                await asyncio.to_thread(
+                    self._release, db, job, settings.pipeline_poll_seconds
+                )
+                logger.info(f'Transcription pool is full, requeued job {job_id}')
+                return
+            except Exception as e:
+                await asyncio.to_thread(self._fail_job, db, job, response, e)
+                return
+            finally:
+                lease.cancel()
+
+            await asyncio.to_thread(job_queue.complete, db, job)
+
+            if (
+                response.processing_stage == ProcessingStage.STORED
+                and response.evaluation_status == EvaluationStatus.PENDING
+            ):
+                try:
+                    await evaluation_service.evaluate(db, response)
+                except Exception:
+                    # Recorded on the response; the evaluation worker retries it
+                    pass
+        finally:
+            db.close()
+
+    @staticmethod
+    def _load(db: Session, job_id: UUID) -> Optional[ProcessingJob]:
+        """Load a claimed job together with its response."""
+        return (
+            db.query(ProcessingJob)
+            .options(joinedload(ProcessingJob.response))
+            .filter(ProcessingJob.id == job_id)
+            .first()
+        )
+
+    @staticmethod
+    def _release(db: Session, job: ProcessingJob, delay_seconds: float = 0.0) -> None:
+        """Discard the interrupted attempt and return its job to the queue."""
+        db.rollback()
+        job_queue.release(db, job, delay_seconds=delay_seconds)
+
+    @classmethod
+    def _fail_job(
+        cls, db: Session, job: ProcessingJob, response: Response, error: Exception
+    ) -> None:
+        """Discard the failed attempt and record it, failing the response once dead-lettered."""
+        db.rollback()
+        if job_queue.fail(db, job, error):
+            cls._fail(db, response, error)
+
+    async def _transcribe(self, db: Session, response: Response) -> None:
+        """Download the received audio from R2 and transcribe it."""
+        audio = await asyncio.to_thread(storage_service.download_file, response.audio_path)
+
+        # Decode faster under load, as for synchronous submissions
+        profile = whisper_service.select_profile(response.duration_seconds)
+        logger.info(f'Transcribing response {response.id} ({profile.name} profile)')
+        response.transcript = await whisper_service.transcribe_async(audio, profile)
+        response.transcription_profile = profile.name
+        await asyncio.to_thread(
+            self._advance, db, response, ProcessingStage.TRANSCRIBED
+        )
+
+    def _mark_stored(self, db: Session, response: Response) -> None:
+        """Hand a transcribed response over for evaluation; its audio is already in R2."""
+        # This worker evaluates it next, so keep the evaluation worker off it for a lease
+        response.evaluation_next_attempt_at = datetime.now(timezone.utc) + timedelta(
+            seconds=settings.evaluation_lease_seconds
+        )
+        self._advance(db, response, ProcessingStage.STORED)
+
+    @staticmethod
+    def _advance(db: Session, response: Response, stage: ProcessingStage) -> None:
+        """Commit a completed stage."""
+        response.processing_stage = stage
+        response.processing_error = None
+        response.processing_updated_at = datetime.now(timezone.utc)
+        db.commit()
+        logger.info(f'Response {response.id} {stage.value}')
+
+    @staticmethod
+    def _fail(db: Session, response: Response, error: Exception) -> None:
+        """Mark a response whose job was dead-lettered as failed."""
+        response.processing_stage = ProcessingStage.FAILED
+        response.processing_error = str(error)
+        response.processing_updated_at = datetime.now(timezone.utc)
+        # A response without a transcript can never be evaluated
+        response.evaluation_status = EvaluationStatus.FAILED
+        db.commit()
+
+
+# Global pipeline instance
+response_pipeline = ResponsePipeline()
@@ -0,0 +1,105 @@
+"""Two-tier cache for Whisper transcripts."""
+
+import hashlib
+import logging
+from typing import BinaryIO, Optional, Union
+
+import numpy as np
+from app.core.cache import LRUCache
+from app.core.database import SessionLocal
+from app.models.transcript_cache_entry import TranscriptCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptCache:
+    """
+    Cache of transcripts keyed by audio content and decoding parameters.
+
+    Lookups hit an in-memory LRU first and, when enabled, fall back to the
+    transcript_cache table so entries survive restarts and are shared between
+    processes.
+    """
+
+    def __init__(self, maxsize: int, persistent: bool):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Number of transcripts kept in memory (0 disables the memory tier)
+            persistent: Whether to also store transcripts in Postgres
+        """
+        self._memory: LRUCache[str] = LRUCache(maxsize)
+        self.persistent = persistent
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any tier is active."""
+        return self._memory.maxsize > 0 or self.persistent
+
+    @staticmethod
+    def make_key(
+        audio: Union[bytes, np.ndarray, BinaryIO], decoding_params: str
+    ) -> str:
+        """
+        Build a cache key from audio content and the parameters used to decode it.
+
+        Args:
+            audio: Encoded audio bytes, a readable file object, or decoded samples
+            decoding_params: Model name and decoding options affecting the output
+
+        Returns:
+            Hex digest identifying this audio/parameter combination
+        """
+        digest = hashlib.sha256()
+        if hasattr(audio, 'read'):
+            # Hash file objects in chunks and leave them where they were
+            position = audio.tell()
+            for chunk in iter(lambda: audio.read(1024 * 1024), b''):
+                digest.update(chunk)
+            audio.seek(position)
+        elif isinstance(audio, np.ndarray):
+            digest.update(np.ascontiguousarray(audio))
+        else:
+            digest.update(audio)
+        digest.update(b'\0')
+        digest.update(decoding_params.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached transcript for key, or None on a miss."""
+        transcript = self._memory.get(key)
+        if transcript is not None or not self.persistent:
+            return transcript
+
+        db = SessionLocal()
+        try:
+            entry = db.get(TranscriptCacheEntry, key)
+            if entry is None:
+                return None
+            transcript = str(entry.transcript)
+        except Exception as e:
+            logger.error(f'Error reading transcript cache: {e}')
+            return None
+        finally:
+            db.close()
+
+        # Promote into the memory tier for subsequent hits
+        self._memory.set(key, transcript)
+        return transcript
+
+    def set(self, key: str, transcript: str) -> None:
+        """Store a transcript in every enabled tier."""
+        self._memory.set(key, transcript)
+        if not self.persistent:
+            return
+
+        db = SessionLocal()
+        try:
+            db.merge(TranscriptCacheEntry(cache_key=key, transcript=transcript))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f'Error writing transcript cache: {e}')
+        finally:
+            db.close()
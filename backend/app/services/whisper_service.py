@@ -1,89 +1,662 @@
 """Faster-whisper service for audio transcription."""
 
+import asyncio
+import io
 import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
 from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Optional, Union
 
+import numpy as np
 from app.core.config import settings
+from app.services.transcript_cache import TranscriptCache
+from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Whisper models expect 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+# Transcript returned when no speech is found
+NO_SPEECH_TRANSCRIPT = 'No speech detected in audio.'
+
+# VAD parameters shared by the sequential and batched paths
+VAD_MIN_SILENCE_DURATION_MS = 500
+
+# Pending transcriptions per worker at which adaptive decoding steps down
+BALANCED_PROFILE_LOAD = 1.0
+FAST_PROFILE_LOAD = 2.0
+
+# Clips at least this long step down one more profile when workers are busy
+LONG_CLIP_SECONDS = 300
+
+# Models owned by the current pool worker (one set per thread, or per process)
+_worker_state = threading.local()
+
+# Models shared by every worker in this process (shared-model and batching modes)
+_shared_models: Dict[str, object] = {}
+_shared_models_lock = threading.Lock()
+
+# Batch schedulers shared by all workers in this process, one per profile
+_batch_schedulers: Dict[str, 'BatchScheduler'] = {}
+_batch_schedulers_lock = threading.Lock()
+
+
+# Anything the service can transcribe: a file path, encoded bytes, or decoded samples
+AudioInput = Union[str, bytes, np.ndarray]
+
+
+class TranscriptionQueueFullError(Exception):
+    """Raised when every transcription worker is busy and the queue is full."""
+
+
+class DecodingProfile(BaseModel):
+    """Whisper model and beam width used for a transcription."""
+
+    name: str
+    model: str
+    beam_size: int
+
+
+# Profiles ordered from most accurate to fastest
+DECODING_PROFILES: Dict[str, DecodingProfile] = {
+    'accurate': DecodingProfile(
+        name='accurate', model=settings.whisper_model, beam_size=5
+    ),
+    'balanced': DecodingProfile(
+        name='balanced', model=settings.whisper_model, beam_size=2
+    ),
+    'fast': DecodingProfile(
+        name='fast', model=settings.whisper_fast_model, beam_size=1
+    ),
+}
+
+
+def get_profile(name: Optional[str] = None) -> DecodingProfile:
+    """
+    Look up a decoding profile by name.
+
+    Args:
+        name: Profile name, or None for the configured default profile
+
+    Raises:
+        ValueError: If no profile has that name
+    """
+    name = name or settings.whisper_default_profile
+    if name not in DECODING_PROFILES:
+        raise ValueError(
+            f'Unknown Whisper decoding profile: {name} '
+            f'(expected one of {", ".join(DECODING_PROFILES)})'
+        )
+    return DECODING_PROFILES[name]
+
+
+def select_profile(
+    queue_depth: int, workers: int, duration_seconds: Optional[float] = None
+) -> DecodingProfile:
+    """
+    Pick a decoding profile for the current load and clip length.
+
+    The default profile is used while workers keep up. As transcriptions pile
+    up, decoding steps down to cheaper profiles so latency stays bounded; long
+    clips step down one more level since they hold a worker the longest.
+
+    Args:
+        queue_depth: Transcriptions running or waiting in the pool
+        workers: Number of pool workers
+        duration_seconds: Length of the clip to transcribe, if known
+
+    Returns:
+        Decoding profile to transcribe with
+    """
+    default = get_profile()
+    if not settings.whisper_adaptive_profiles:
+        return default
+
+    names = list(DECODING_PROFILES)
+    level = names.index(default.name)
+
+    load = queue_depth / max(1, workers)
+    if load >= FAST_PROFILE_LOAD:
+        level = max(level, names.index('fast'))
+    elif load >= BALANCED_PROFILE_LOAD:
+        level = max(level, names.index('balanced'))
+
+    if load > 0 and duration_seconds and duration_seconds >= LONG_CLIP_SECONDS:
+        level += 1
+
+    return DECODING_PROFILES[names[min(level, len(names) - 1)]]
+
+
+def decode_audio_input(audio: Union[AudioInput, BinaryIO]) -> np.ndarray:
+    """
+    Decode audio into a 16 kHz mono float32 array without touching the disk.
+
+    Args:
+        audio: File path, encoded audio bytes, file object, or an already decoded array
+
+    Returns:
+        Float32 NumPy array of samples at SAMPLE_RATE
+
+    Raises:
+        FileNotFoundError: If a path is given and the file does not exist
+    """
+    from faster_whisper.audio import decode_audio
+
+    if isinstance(audio, np.ndarray):
+        return audio.astype(np.float32, copy=False)
+
+    if isinstance(audio, str):
+        if not Path(audio).exists():
+            raise FileNotFoundError(f'Audio file not found: {audio}')
+    elif isinstance(audio, (bytes, bytearray, memoryview)):
+        audio = io.BytesIO(audio)
+
+    return decode_audio(audio, sampling_rate=SAMPLE_RATE)
+
+
+def _available_cores() -> int:
+    """Return the number of CPU cores this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _cpu_threads() -> int:
+    """
+    Return the intra-op thread count for each model.
+
+    In auto mode the available cores are divided across every transcription
+    that can run at once on this machine: uvicorn processes times pool
+    workers. With batching, each process runs one batch at a time.
+    """
+    if settings.whisper_cpu_threads > 0:
+        return settings.whisper_cpu_threads
+
+    concurrent = max(1, settings.web_concurrency)
+    if not settings.whisper_batching:
+        concurrent *= max(1, settings.whisper_workers)
+    return max(1, _available_cores() // concurrent)
+
+
+def _num_workers(shared: bool) -> int:
+    """Return how many transcriptions a model may run in parallel (inter-op)."""
+    if settings.whisper_num_workers > 0:
+        return settings.whisper_num_workers
+    return max(1, settings.whisper_workers) if shared else 1
+
+
+def _load_model(model_name: str, shared: bool = False):
+    """
+    Load a new Whisper model instance using the configured settings.
+
+    Args:
+        model_name: Whisper model size or path, e.g. base.en
+        shared: Whether every pool worker runs transcriptions on this instance
+    """
+    from faster_whisper import WhisperModel
+
+    cpu_threads = _cpu_threads()
+    num_workers = _num_workers(shared)
+    compute_type = settings.whisper_compute_type or (
+        'int8' if settings.whisper_device == 'cpu' else 'float16'
+    )
+    logger.info(
+        f'Loading Whisper model: {model_name} on {settings.whisper_device} '
+        f'(cpu_threads={cpu_threads}, num_workers={num_workers})'
+    )
+    model = WhisperModel(
+        model_name,
+        device=settings.whisper_device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+        download_root=settings.whisper_download_root,
+        local_files_only=settings.whisper_local_files_only,
+    )
+    logger.info('Whisper model loaded successfully')
+    return model
+
+
+def _get_shared_model(model_name: str):
+    """Return the model instance shared by all workers in this process."""
+    with _shared_models_lock:
+        if model_name not in _shared_models:
+            _shared_models[model_name] = _load_model(model_name, shared=True)
+        return _shared_models[model_name]
+
+
+def _get_worker_model(model_name: str):
+    """Return the model belonging to the calling worker, loading it on first use."""
+    if settings.whisper_share_model:
+        return _get_shared_model(model_name)
+
+    if not hasattr(_worker_state, 'models'):
+        _worker_state.models = {}
+    if model_name not in _worker_state.models:
+        _worker_state.models[model_name] = _load_model(model_name)
+    return _worker_state.models[model_name]
+
+
+class BatchScheduler:
+    """
+    Groups VAD segments from concurrent transcriptions into batched inference.
+
+    Callers decode audio and extract features in their own thread, then hand the
+    segments to a single scheduler thread. The scheduler waits up to max_wait_ms
+    for other requests to arrive, and runs their segments together through
+    faster-whisper's batched pipeline in batches of at most max_batch_size.
+    """
+
+    def __init__(self, model, beam_size: int, max_batch_size: int, max_wait_ms: int):
+        """Build the batched pipeline and start the scheduler thread."""
+        from faster_whisper import BatchedInferencePipeline
+        from faster_whisper.tokenizer import Tokenizer
+        from faster_whisper.transcribe import (
+            TranscriptionOptions,
+            get_suppressed_tokens,
+        )
+
+        self._model = model
+        self._pipeline = BatchedInferencePipeline(model)
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max(0, max_wait_ms) / 1000
+        self._queue: queue.Queue = queue.Queue()
+
+        self._tokenizer = Tokenizer(
+            model.hf_tokenizer,
+            model.model.is_multilingual,
+            task='transcribe',
+            language='en',
+        )
+        # Mirrors the defaults of BatchedInferencePipeline.transcribe()
+        self._options = TranscriptionOptions(
+            beam_size=beam_size,
+            best_of=5,
+            patience=1,
+            length_penalty=1,
+            repetition_penalty=1,
+            no_repeat_ngram_size=0,
+            log_prob_threshold=-1.0,
+            no_speech_threshold=0.6,
+            compression_ratio_threshold=2.4,
+            condition_on_previous_text=False,
+            prompt_reset_on_temperature=0.5,
+            temperatures=[0.0],
+            initial_prompt=None,
+            prefix=None,
+            suppress_blank=True,
+            suppress_tokens=get_suppressed_tokens(self._tokenizer, [-1]),
+            without_timestamps=True,
+            max_initial_timestamp=0.0,
+            word_timestamps=False,
+            prepend_punctuations='"\'“¿([{-',
+            append_punctuations='"\'.。,，!！?？:：”)]}、',
+            multilingual=False,
+            max_new_tokens=None,
+            clip_timestamps=[],
+            hallucination_silence_threshold=None,
+            hotwords=None,
+        )
+
+        thread = threading.Thread(
+            target=self._run, name='whisper-batcher', daemon=True
+        )
+        thread.start()
+        logger.info(
+            f'Whisper batch scheduler started '
+            f'(max_batch_size={self._max_batch_size}, max_wait_ms={max_wait_ms})'
+        )
+
+    def _extract_features(self, audio: np.ndarray):
+        """Split decoded audio on VAD boundaries and compute per-chunk features."""
+        from faster_whisper.audio import pad_or_trim
+        from faster_whisper.vad import VadOptions, collect_chunks, get_speech_timestamps
+
+        feature_extractor = self._model.feature_extractor
+        chunk_length = feature_extractor.chunk_length
+
+        vad_options = VadOptions(
+            min_silence_duration_ms=VAD_MIN_SILENCE_DURATION_MS,
+            max_speech_duration_s=chunk_length,
+        )
+        clip_timestamps = get_speech_timestamps(audio, vad_options)
+        if not clip_timestamps:
+            return [], []
+
+        audio_chunks, chunks_metadata = collect_chunks(
+            audio, clip_timestamps, max_duration=chunk_length
+        )
+        features = [
+            pad_or_trim(feature_extractor(chunk)[..., :-1]) for chunk in audio_chunks
+        ]
+        return features, chunks_metadata
+
+    def transcribe(self, audio: np.ndarray) -> List[str]:
+        """
+        Transcribe decoded audio as part of the next batch.
+
+        Args:
+            audio: 16 kHz mono float32 samples
+
+        Returns:
+            Text of each transcribed segment, in order
+        """
+        features, chunks_metadata = self._extract_features(audio)
+        if not features:
+            return []
+
+        future: Future = Future()
+        self._queue.put((features, chunks_metadata, future))
+        return future.result()
+
+    def _run(self) -> None:
+        """Scheduler loop: collect pending requests into batches and run them."""
+        while True:
+            batch = [self._queue.get()]
+            segment_count = len(batch[0][0])
+            deadline = time.monotonic() + self._max_wait
+
+            while segment_count < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                segment_count += len(item[0])
+
+            self._process(batch)
+
+    def _process(self, batch) -> None:
+        """Run every segment in the batch through the model and resolve the futures."""
+        features = []
+        chunks_metadata = []
+        owners = []
+        for index, (item_features, item_metadata, _) in enumerate(batch):
+            features.extend(item_features)
+            chunks_metadata.extend(item_metadata)
+            owners.extend([index] * len(item_features))
+
+        results: List[List[str]] = [[] for _ in batch]
+        try:
+            for start in range(0, len(features), self._max_batch_size):
+                end = start + self._max_batch_size
+                outputs = self._pipeline.forward(
+                    np.stack(features[start:end]),
+                    self._tokenizer,
+                    chunks_metadata[start:end],
+                    self._options,
+                )
+                for owner, subsegments in zip(owners[start:end], outputs):
+                    results[owner].extend(s['text'] for s in subsegments)
+        except Exception as e:
+            logger.error(f'Batched transcription failed: {e}')
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        logger.info(
+            f'Transcribed batch of {len(features)} segments from {len(batch)} request(s)'
+        )
+        for (_, _, future), texts in zip(batch, results):
+            future.set_result(texts)
+
+
+def _get_batch_scheduler(profile: DecodingProfile) -> BatchScheduler:
+    """Return this process's batch scheduler for a profile, creating it on first use."""
+    with _batch_schedulers_lock:
+        if profile.name not in _batch_schedulers:
+            _batch_schedulers[profile.name] = BatchScheduler(
+                _get_shared_model(profile.model),
+                beam_size=profile.beam_size,
+                max_batch_size=settings.whisper_batch_size,
+                max_wait_ms=settings.whisper_batch_max_wait_ms,
+            )
+        return _batch_schedulers[profile.name]
+
+
+def _transcribe_segments(model, beam_size: int, audio: np.ndarray) -> List[str]:
+    """Transcribe decoded audio sequentially and return the segment texts."""
+    segments, info = model.transcribe(
+        audio,
+        language='en',
+        beam_size=beam_size,
+        vad_filter=True,  # Voice activity detection
+        vad_parameters=dict(min_silence_duration_ms=VAD_MIN_SILENCE_DURATION_MS),
+    )
+    return [segment.text for segment in segments]
+
+
+def _run_transcription(
+    audio: Union[AudioInput, BinaryIO],
+    transcribe_segments: Callable[[np.ndarray], List[str]],
+) -> str:
+    """
+    Decode audio, transcribe it and join the segments into a transcript.
+
+    Args:
+        audio: File path, encoded audio bytes, file object, or decoded samples
+        transcribe_segments: Callable returning the segment texts for decoded audio
+
+    Returns:
+        Transcribed text as string
+
+    Raises:
+        Exception: If transcription fails
+    """
+    try:
+        samples = decode_audio_input(audio)
+        logger.info(f'Transcribing {len(samples) / SAMPLE_RATE:.1f}s of audio')
+
+        # Transcribe with faster-whisper and combine segments into full transcript
+        transcript_parts = transcribe_segments(samples)
+        transcript = ' '.join(transcript_parts).strip()
+
+        logger.info(f'Transcription completed. Length: {len(transcript)} characters')
+
+        if not transcript:
+            logger.warning('Transcription resulted in empty text')
+            return NO_SPEECH_TRANSCRIPT
+
+        return transcript
+
+    except Exception as e:
+        logger.error(f'Transcription error: {e}')
+        raise Exception(f'Failed to transcribe audio: {str(e)}')
+
+
+def _decoding_params(profile: DecodingProfile) -> str:
+    """Describe the model and options that determine a transcript, for cache keys."""
+    return (
+        f'{profile.model}:beam={profile.beam_size}'
+        f':vad_silence_ms={VAD_MIN_SILENCE_DURATION_MS}:batched={settings.whisper_batching}'
+    )
+
+
+def _selectable_profiles() -> List[DecodingProfile]:
+    """Return the profiles the service may transcribe with under the current settings."""
+    if settings.whisper_adaptive_profiles:
+        return list(DECODING_PROFILES.values())
+    return [get_profile()]
+
+
+def _warm_up(model, beam_size: int) -> None:
+    """Run a short dummy clip through the VAD and the model so later calls start fast."""
+    from faster_whisper.vad import get_speech_timestamps
+
+    clip = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    get_speech_timestamps(clip)
+    segments, info = model.transcribe(
+        clip, language='en', beam_size=beam_size, vad_filter=False
+    )
+    list(segments)
+
+
+def _preload_worker() -> None:
+    """Pool task: load and warm up every model this worker may transcribe with."""
+    for profile in _selectable_profiles():
+        if settings.whisper_batching:
+            _get_batch_scheduler(profile)
+            _warm_up(_get_shared_model(profile.model), profile.beam_size)
+        else:
+            _warm_up(_get_worker_model(profile.model), profile.beam_size)
+
+
+def _transcribe_in_worker(audio: AudioInput, profile_name: str) -> str:
+    """Pool entry point: transcribe using the worker's own model or the batcher."""
+    profile = get_profile(profile_name)
+    if settings.whisper_batching:
+        return _run_transcription(audio, _get_batch_scheduler(profile).transcribe)
+    return _run_transcription(
+        audio,
+        partial(
+            _transcribe_segments,
+            _get_worker_model(profile.model),
+            profile.beam_size,
+        ),
+    )
+
 
 class WhisperService:
     """Service for audio transcription using faster-whisper with lazy loading."""
 
     def __init__(self):
-        """Initialize Whisper service without loading the model yet."""
-        self._model = None
+        """Initialize Whisper service without loading the models or the pool yet."""
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        self._pending = 0
+        self._max_pending = settings.whisper_workers + settings.whisper_max_queue_size
+        self._cache = TranscriptCache(
+            maxsize=settings.transcript_cache_size,
+            persistent=settings.transcript_cache_persistent,
+        )
         logger.info('Whisper service initialized (lazy loading enabled)')
-    
-    def _ensure_model_loaded(self):
-        """Load the Whisper model if not already loaded (lazy loading)."""
-        if self._model is None:
-            from faster_whisper import WhisperModel
-            
-            logger.info(
-                f'Loading Whisper model: {settings.whisper_model} on {settings.whisper_device}'
-            )
-            self._model = WhisperModel(
-                settings.whisper_model,
-                device=settings.whisper_device,
-                compute_type='int8' if settings.whisper_device == 'cpu' else 'float16',
-            )
-            logger.info('Whisper model loaded successfully')
 
-    def transcribe(self, audio_path: str) -> str:
+    def _get_executor(self) -> Executor:
+        """Create the transcription worker pool on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                workers = max(1, settings.whisper_workers)
+                if settings.whisper_executor == 'process':
+                    self._executor = ProcessPoolExecutor(max_workers=workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix='whisper'
+                    )
+                logger.info(
+                    f'Started Whisper {settings.whisper_executor} pool with {workers} worker(s)'
+                )
+            return self._executor
+
+    def preload(self) -> None:
+        """
+        Load and warm up the model of every pool worker ahead of the first request.
+
+        Blocks until all workers are ready, so the first user after a deploy does
+        not pay for model loading.
+        """
+        workers = max(1, settings.whisper_workers)
+        executor = self._get_executor()
+        futures = [executor.submit(_preload_worker) for _ in range(workers)]
+        for future in futures:
+            future.result()
+        logger.info(f'Whisper models preloaded and warmed up on {workers} worker(s)')
+
+    @property
+    def pending(self) -> int:
+        """Number of transcriptions running or waiting in the pool."""
+        return self._pending
+
+    def select_profile(self, duration_seconds: Optional[float] = None) -> DecodingProfile:
+        """
+        Pick the decoding profile for a new transcription from the current load.
+
+        Args:
+            duration_seconds: Length of the clip to transcribe, if known
+
+        Returns:
+            Decoding profile to pass to transcribe_async()
+        """
+        return select_profile(
+            self._pending, settings.whisper_workers, duration_seconds
+        )
+
+    def _cache_key(
+        self, audio: Union[AudioInput, BinaryIO], profile: DecodingProfile
+    ) -> Optional[str]:
+        """Return the transcript cache key for audio, or None if it cannot be read."""
+        if isinstance(audio, str):
+            if not Path(audio).exists():
+                return None
+            with open(audio, 'rb') as audio_file:
+                return TranscriptCache.make_key(audio_file, _decoding_params(profile))
+        return TranscriptCache.make_key(audio, _decoding_params(profile))
+
+    async def transcribe_async(
+        self, audio: AudioInput, profile: Optional[DecodingProfile] = None
+    ) -> str:
         """
-        Transcribe audio file to text.
+        Transcribe audio to text on the worker pool without blocking the event loop.
 
         Args:
-            audio_path: Path to audio file
+            audio: File path, encoded audio bytes, or 16 kHz float32 samples
+            profile: Decoding profile from select_profile(); defaults to the
+                configured default profile
 
         Returns:
             Transcribed text as string
 
         Raises:
+            TranscriptionQueueFullError: If the pool queue is full
             Exception: If transcription fails
         """
-        try:
-            # Load model on first use (lazy loading)
-            self._ensure_model_loaded()
-            
-            # Verify file exists
-            audio_file = Path(audio_path)
-            if not audio_file.exists():
-                raise FileNotFoundError(f'Audio file not found: {audio_path}')
-
-            logger.info(f'Transcribing audio file: {audio_path}')
-
-            # Transcribe with faster-whisper
-            segments, info = self._model.transcribe(
-                audio_path,
-                language='en',
-                beam_size=5,
-                vad_filter=True,  # Voice activity detection
-                vad_parameters=dict(min_silence_duration_ms=500),
-            )
-
-            # Combine all segments into full transcript
-            transcript_parts = []
-            for segment in segments:
-                transcript_parts.append(segment.text)
+        profile = profile or get_profile()
+        cache_key = None
+        if self._cache.enabled:
+            cache_key = await asyncio.to_thread(self._cache_key, audio, profile)
+            if cache_key:
+                cached = await asyncio.to_thread(self._cache.get, cache_key)
+                if cached is not None:
+                    logger.info('Transcript cache hit, skipping Whisper')
+                    return cached
 
-            transcript = ' '.join(transcript_parts).strip()
-
-            logger.info(
-                f'Transcription completed. Length: {len(transcript)} characters'
+        if self._pending >= self._max_pending:
+            raise TranscriptionQueueFullError(
+                f'Transcription queue is full ({self._pending} pending)'
             )
 
-            if not transcript:
-                logger.warning('Transcription resulted in empty text')
-                return 'No speech detected in audio.'
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            transcript = await loop.run_in_executor(
+                self._get_executor(), _transcribe_in_worker, audio, profile.name
+            )
+        finally:
+            self._pending -= 1
 
-            return transcript
+        if cache_key:
+            await asyncio.to_thread(self._cache.set, cache_key, transcript)
+        return transcript
 
-        except Exception as e:
-            logger.error(f'Transcription error: {e}')
-            raise Exception(f'Failed to transcribe audio: {str(e)}')
+    def shutdown(self) -> None:
+        """Stop the worker pool, waiting for running transcriptions to finish."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
 
 
 # Global service instance
@@ -0,0 +1,62 @@
+"""
+Standalone worker for queued response processing and evaluation.
+
+Runs the response pipeline, and the evaluation worker when enabled, without
+serving the API, so transcription can run on dedicated machines that scale
+separately from the web processes. Workers share the job queue through
+Postgres; start as many as needed and set PIPELINE_WORKER_ENABLED=False on
+the web processes.
+
+Usage (from the backend directory):
+    python -m app.worker
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.core.config import settings
+from app.services.claude_service import claude_service
+from app.services.evaluation_worker import evaluation_worker
+from app.services.response_pipeline import response_pipeline
+from app.services.whisper_service import whisper_service
+
+logger = logging.getLogger(__name__)
+
+
+async def run() -> None:
+    """Process jobs until SIGINT or SIGTERM, then hand in-flight jobs back to the queue."""
+    if settings.whisper_preload:
+        # Load and warm up Whisper before claiming jobs
+        logger.info('Preloading Whisper models')
+        await asyncio.to_thread(whisper_service.preload)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    response_pipeline.start()
+    if settings.evaluation_worker_enabled:
+        evaluation_worker.start()
+
+    await stop.wait()
+    logger.info('Shutting down worker')
+
+    await response_pipeline.stop()
+    await evaluation_worker.stop()
+    whisper_service.shutdown()
+    await claude_service.aclose()
+
+
+def main() -> None:
+    """Configure logging and run the worker."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    )
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,473 @@
+"""
+Local stand-in for the Claude Messages API.
+
+Serves schema-valid structured outputs for whatever ``output_format`` a
+request asks for (QuestionsList, EvaluationResult, ...), with configurable
+latency, error rates and streaming behaviour, so question generation and
+evaluation can be load-tested offline and without cost. Prompt caching is
+simulated so the usage numbers exercise PromptCacheStats, and the Message
+Batches endpoints are supported for the re-scoring command.
+
+Point the backend at it with CLAUDE_BASE_URL:
+    python -m benchmarks.fake_claude --port 8100 --latency lognormal:4,0.5 \\
+        --errors 529=0.02,429=0.01 --stream-chunk-delay 0.05
+    CLAUDE_BASE_URL=http://localhost:8100 uvicorn app.main:app
+
+Latency specs (seconds): ``fixed:S``, ``uniform:LOW,HIGH``,
+``lognormal:MEDIAN,SIGMA`` and ``exponential:MEAN``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+
+# Error type names the API uses for each status code
+ERROR_TYPES = {
+    400: 'invalid_request_error',
+    429: 'rate_limit_error',
+    500: 'api_error',
+    503: 'api_error',
+    529: 'overloaded_error',
+}
+
+WORDS = (
+    'candidate team project delivered improved stakeholders clear structured '
+    'result impact example ownership situation task action metrics feedback '
+    'communication technical decision tradeoff customer deadline'
+).split()
+
+# transform_schema() moves unsupported constraints into the description
+DESCRIBED_CONSTRAINT = re.compile(r'(minimum|maximum|minItems|maxItems): (-?\d+)')
+
+
+class LatencyDistribution(BaseModel):
+    """Distribution that request latencies are drawn from."""
+
+    kind: str = 'fixed'
+    params: List[float] = [0.0]
+
+    @classmethod
+    def parse(cls, spec: str) -> 'LatencyDistribution':
+        """Parse a spec such as ``lognormal:4,0.5``."""
+        kind, _, values = spec.partition(':')
+        params = [float(value) for value in values.split(',') if value]
+        expected = {'fixed': 1, 'uniform': 2, 'lognormal': 2, 'exponential': 1}
+        if expected.get(kind) != len(params):
+            raise ValueError(f'Invalid latency spec: {spec}')
+        return cls(kind=kind, params=params)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.kind == 'uniform':
+            return rng.uniform(*self.params)
+        if self.kind == 'lognormal':
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+        if self.kind == 'exponential':
+            return rng.expovariate(1 / self.params[0]) if self.params[0] > 0 else 0.0
+        return self.params[0]
+
+
+class FakeClaudeConfig(BaseModel):
+    """Behaviour of the fake server."""
+
+    latency: LatencyDistribution = LatencyDistribution()
+    # Probability of answering with each error status instead of a message
+    errors: Dict[int, float] = {}
+    retry_after_seconds: Optional[float] = None
+    stream_chunk_chars: int = 40
+    stream_chunk_delay_seconds: float = 0.02
+    # Probability of an overloaded error event part-way through a stream
+    stream_error_rate: float = 0.0
+    batch_processing_seconds: float = 5.0
+    seed: Optional[int] = None
+
+
+def _constraints(schema: Dict[str, Any]) -> Dict[str, int]:
+    """Return numeric constraints given as keywords or moved into the description."""
+    found = {
+        name: int(value)
+        for name, value in DESCRIBED_CONSTRAINT.findall(schema.get('description', ''))
+    }
+    for name in ('minimum', 'maximum', 'minItems', 'maxItems'):
+        if name in schema:
+            found[name] = int(schema[name])
+    return found
+
+
+def generate_value(schema: Dict[str, Any], rng: random.Random, defs: Dict[str, Any]) -> Any:
+    """Generate a random value that satisfies a JSON schema."""
+    if '$ref' in schema:
+        return generate_value(defs[schema['$ref'].split('/')[-1]], rng, defs)
+    if 'anyOf' in schema:
+        return generate_value(schema['anyOf'][0], rng, defs)
+    if 'enum' in schema:
+        return rng.choice(schema['enum'])
+
+    kind = schema.get('type')
+    limits = _constraints(schema)
+    if kind == 'object':
+        return {
+            name: generate_value(prop, rng, defs)
+            for name, prop in schema.get('properties', {}).items()
+        }
+    if kind == 'array':
+        low = limits.get('minItems', 1)
+        count = rng.randint(low, max(low, limits.get('maxItems', low + 2)))
+        return [generate_value(schema.get('items', {}), rng, defs) for _ in range(count)]
+    if kind == 'integer':
+        return rng.randint(limits.get('minimum', 0), limits.get('maximum', 100))
+    if kind == 'number':
+        return rng.uniform(limits.get('minimum', 0), limits.get('maximum', 100))
+    if kind == 'boolean':
+        return rng.random() < 0.5
+    sentence = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 20)))
+    return sentence.capitalize() + '.'
+
+
+def _token_count(value: Any) -> int:
+    """Rough token count of a request or response fragment."""
+    return max(1, len(json.dumps(value)) // 4)
+
+
+class FakeClaude:
+    """State shared by the fake endpoints: RNG, prompt cache and batches."""
+
+    def __init__(self, config: FakeClaudeConfig):
+        """Initialize the fake with its configuration."""
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self._cached_prefixes: set = set()
+        self._batches: Dict[str, Dict[str, Any]] = {}
+
+    def pick_error(self) -> Optional[int]:
+        """Return an error status to fail the request with, or None."""
+        roll = self.rng.random()
+        for status_code, rate in self.config.errors.items():
+            if roll < rate:
+                return status_code
+            roll -= rate
+        return None
+
+    def error_response(self, status_code: int) -> JSONResponse:
+        """Build an API error response."""
+        headers = {}
+        if self.config.retry_after_seconds is not None and status_code in (429, 529):
+            headers['retry-after'] = f'{self.config.retry_after_seconds:g}'
+        return JSONResponse(
+            {
+                'type': 'error',
+                'error': {
+                    'type': ERROR_TYPES.get(status_code, 'api_error'),
+                    'message': f'Simulated {status_code} error',
+                },
+            },
+            status_code=status_code,
+            headers=headers,
+        )
+
+    def usage(self, params: Dict[str, Any]) -> Dict[str, int]:
+        """Simulate input token usage, including prompt caching of the system prompt."""
+        system = params.get('system')
+        cached_tokens = 0
+        key = None
+        if isinstance(system, list) and any('cache_control' in block for block in system):
+            cached_tokens = _token_count(system)
+            key = hashlib.sha256(
+                json.dumps([params.get('model'), system]).encode('utf-8')
+            ).hexdigest()
+
+        usage = {
+            'input_tokens': _token_count(params.get('messages', [])),
+            'cache_creation_input_tokens': 0,
+            'cache_read_input_tokens': 0,
+        }
+        if key is None:
+            usage['input_tokens'] += _token_count(system or '')
+        elif key in self._cached_prefixes:
+            usage['cache_read_input_tokens'] = cached_tokens
+        else:
+            self._cached_prefixes.add(key)
+            usage['cache_creation_input_tokens'] = cached_tokens
+        return usage
+
+    def output_text(self, params: Dict[str, Any]) -> str:
+        """Generate the text of a reply, valid against the requested output schema."""
+        output_format = params.get('output_format') or {}
+        schema = output_format.get('schema')
+        if schema is None:
+            return ' '.join(self.rng.choice(WORDS) for _ in range(30))
+        return json.dumps(generate_value(schema, self.rng, schema.get('$defs', {})))
+
+    def message(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a complete Messages API reply."""
+        text = self.output_text(params)
+        return {
+            'id': f'msg_{uuid.uuid4().hex}',
+            'type': 'message',
+            'role': 'assistant',
+            'model': params.get('model', 'fake'),
+            'content': [{'type': 'text', 'text': text}],
+            'stop_reason': 'end_turn',
+            'stop_sequence': None,
+            'usage': {**self.usage(params), 'output_tokens': _token_count(text)},
+        }
+
+    async def stream(self, params: Dict[str, Any], first_token_delay: float):
+        """Yield a reply as Messages API Server-Sent Events."""
+
+        def event(name: str, data: Dict[str, Any]) -> str:
+            return f'event: {name}\ndata: {json.dumps({"type": name, **data})}\n\n'
+
+        message = self.message(params)
+        text = message['content'][0]['text']
+        usage = message['usage']
+
+        yield event(
+            'message_start',
+            {
+                'message': {
+                    **message,
+                    'content': [],
+                    'stop_reason': None,
+                    'usage': {**usage, 'output_tokens': 1},
+                }
+            },
+        )
+        yield event(
+            'content_block_start',
+            {'index': 0, 'content_block': {'type': 'text', 'text': ''}},
+        )
+        await asyncio.sleep(first_token_delay)
+
+        size = max(1, self.config.stream_chunk_chars)
+        fail_at = None
+        if self.rng.random() < self.config.stream_error_rate:
+            fail_at = self.rng.randrange(0, len(text), size)
+        for start in range(0, len(text), size):
+            if start == fail_at:
+                yield event(
+                    'error',
+                    {'error': {'type': 'overloaded_error', 'message': 'Simulated stream error'}},
+                )
+                return
+            yield event(
+                'content_block_delta',
+                {'index': 0, 'delta': {'type': 'text_delta', 'text': text[start:start + size]}},
+            )
+            await asyncio.sleep(self.config.stream_chunk_delay_seconds)
+
+        yield event('content_block_stop', {'index': 0})
+        yield event(
+            'message_delta',
+            {
+                'delta': {'stop_reason': 'end_turn', 'stop_sequence': None},
+                'usage': {'output_tokens': usage['output_tokens']},
+            },
+        )
+        yield event('message_stop', {})
+
+    def create_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Accept a message batch; its results are generated when it is created."""
+        batch_id = f'msgbatch_{uuid.uuid4().hex}'
+        results = []
+        for request in requests:
+            status_code = self.pick_error()
+            if status_code is None:
+                result = {'type': 'succeeded', 'message': self.message(request['params'])}
+            else:
+                result = {
+                    'type': 'errored',
+                    'error': {
+                        'type': 'error',
+                        'error': {
+                            'type': ERROR_TYPES.get(status_code, 'api_error'),
+                            'message': f'Simulated {status_code} error',
+                        },
+                    },
+                }
+            results.append({'custom_id': request['custom_id'], 'result': result})
+
+        self._batches[batch_id] = {
+            'created_at': datetime.now(timezone.utc),
+            'ends_at': time.monotonic() + self.config.batch_processing_seconds,
+            'results': results,
+        }
+        return self.batch(batch_id)
+
+    def batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Return a batch in the Message Batches API format, or None if unknown."""
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            return None
+
+        ended = time.monotonic() >= batch['ends_at']
+        results = batch['results']
+        succeeded = sum(1 for entry in results if entry['result']['type'] == 'succeeded')
+        created_at = batch['created_at']
+        return {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': 'ended' if ended else 'in_progress',
+            'request_counts': {
+                'processing': 0 if ended else len(results),
+                'succeeded': succeeded if ended else 0,
+                'errored': len(results) - succeeded if ended else 0,
+                'canceled': 0,
+                'expired': 0,
+            },
+            'created_at': created_at.isoformat(),
+            'expires_at': (created_at + timedelta(days=1)).isoformat(),
+            'ended_at': datetime.now(timezone.utc).isoformat() if ended else None,
+            'archived_at': None,
+            'cancel_initiated_at': None,
+            'results_url': f'/v1/messages/batches/{batch_id}/results' if ended else None,
+        }
+
+    def batch_results(self, batch_id: str) -> str:
+        """Return a batch's results as JSON lines."""
+        return '\n'.join(json.dumps(entry) for entry in self._batches[batch_id]['results'])
+
+
+def create_app(config: FakeClaudeConfig) -> FastAPI:
+    """Create the fake Messages API application."""
+    app = FastAPI(title='Fake Claude API')
+    fake = FakeClaude(config)
+
+    def not_found(batch_id: str) -> JSONResponse:
+        return JSONResponse(
+            {
+                'type': 'error',
+                'error': {'type': 'not_found_error', 'message': f'No batch {batch_id}'},
+            },
+            status_code=404,
+        )
+
+    @app.post('/v1/messages')
+    async def create_message(request: Request):
+        params = await request.json()
+        latency = config.latency.sample(fake.rng)
+
+        status_code = fake.pick_error()
+        if status_code is not None:
+            # Errors come back after part of the latency, like a saturated upstream
+            await asyncio.sleep(latency * fake.rng.random())
+            return fake.error_response(status_code)
+
+        if params.get('stream'):
+            return StreamingResponse(
+                fake.stream(params, latency), media_type='text/event-stream'
+            )
+
+        await asyncio.sleep(latency)
+        return fake.message(params)
+
+    @app.post('/v1/messages/batches')
+    async def create_batch(request: Request):
+        body = await request.json()
+        return fake.create_batch(body['requests'])
+
+    @app.get('/v1/messages/batches/{batch_id}')
+    async def get_batch(batch_id: str):
+        batch = fake.batch(batch_id)
+        return batch if batch is not None else not_found(batch_id)
+
+    @app.get('/v1/messages/batches/{batch_id}/results')
+    async def get_batch_results(batch_id: str):
+        batch = fake.batch(batch_id)
+        if batch is None:
+            return not_found(batch_id)
+        if batch['processing_status'] != 'ended':
+            return JSONResponse(
+                {
+                    'type': 'error',
+                    'error': {
+                        'type': 'invalid_request_error',
+                        'message': 'Batch is still processing',
+                    },
+                },
+                status_code=400,
+            )
+        return Response(fake.batch_results(batch_id), media_type='application/x-jsonl')
+
+    return app
+
+
+def _parse_errors(value: str) -> Dict[int, float]:
+    """Parse ``STATUS=RATE`` pairs such as ``529=0.02,429=0.01``."""
+    errors = {}
+    for item in value.split(','):
+        if item.strip():
+            status_code, _, rate = item.partition('=')
+            errors[int(status_code)] = float(rate)
+    if sum(errors.values()) > 1:
+        raise ValueError('Error rates must add up to at most 1')
+    return errors
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the fake server from the command line."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description='Run a local fake Claude Messages API.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8100)
+    parser.add_argument(
+        '--latency',
+        type=LatencyDistribution.parse,
+        default=LatencyDistribution(),
+        help='Latency distribution, e.g. fixed:1 or lognormal:4,0.5',
+    )
+    parser.add_argument(
+        '--errors',
+        type=_parse_errors,
+        default={},
+        help='Error statuses and their rates, e.g. 529=0.02,429=0.01',
+    )
+    parser.add_argument(
+        '--retry-after', type=float, help='Retry-After seconds sent with 429 and 529'
+    )
+    parser.add_argument('--stream-chunk-chars', type=int, default=40)
+    parser.add_argument('--stream-chunk-delay', type=float, default=0.02)
+    parser.add_argument(
+        '--stream-error-rate',
+        type=float,
+        default=0.0,
+        help='Probability of an error event part-way through a stream',
+    )
+    parser.add_argument(
+        '--batch-seconds',
+        type=float,
+        default=5.0,
+        help='How long message batches take to end',
+    )
+    parser.add_argument('--seed', type=int, help='Seed for reproducible runs')
+    args = parser.parse_args(argv)
+
+    config = FakeClaudeConfig(
+        latency=args.latency,
+        errors=args.errors,
+        retry_after_seconds=args.retry_after,
+        stream_chunk_chars=args.stream_chunk_chars,
+        stream_chunk_delay_seconds=args.stream_chunk_delay,
+        stream_error_rate=args.stream_error_rate,
+        batch_processing_seconds=args.batch_seconds,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,279 @@
+"""
+Local stand-in for the S3-compatible R2 API.
+
+Implements the object and multipart upload operations the storage service
+uses (PutObject, CreateMultipartUpload, UploadPart, CompleteMultipartUpload,
+AbortMultipartUpload, GetObject, DeleteObject) with path-style addressing,
+and enforces R2's multipart rules: every part but the last must have the
+same size of at least 5 MiB. A simulated link bandwidth and a part error
+rate make it possible to compare single and multipart uploads and to check
+that failed multipart uploads are aborted. Objects are kept in memory.
+
+Point the backend at it with R2_ENDPOINT_URL:
+    python -m benchmarks.fake_s3 --port 8200 --bandwidth-mbps 40 --part-error-rate 0.1
+    R2_ENDPOINT_URL=http://localhost:8200 uvicorn app.main:app
+
+GET /_stats returns stored objects, open and aborted uploads and injected errors.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import uuid
+from typing import Dict, List, Optional
+from xml.etree import ElementTree
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+# R2 rejects multipart uploads whose non-final parts are smaller than this
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+S3_NAMESPACE = 'http://s3.amazonaws.com/doc/2006-03-01/'
+
+
+class FakeS3Config(BaseModel):
+    """Behaviour of the fake server."""
+
+    # Simulated link speed in megabits per second (0 is unlimited)
+    bandwidth_mbps: float = 0.0
+    # Probability of an UploadPart answering 500 instead of storing the part
+    part_error_rate: float = 0.0
+    min_part_size: int = MIN_PART_SIZE
+    seed: Optional[int] = None
+
+
+class StoredObject(BaseModel):
+    """An object and the way it was uploaded."""
+
+    data: bytes
+    content_type: Optional[str] = None
+    etag: str
+    parts: int = 0
+
+
+class MultipartUpload(BaseModel):
+    """An upload between CreateMultipartUpload and Complete or Abort."""
+
+    bucket: str
+    key: str
+    content_type: Optional[str] = None
+    parts: Dict[int, bytes] = {}
+
+
+def _etag(data: bytes) -> str:
+    """Return the quoted MD5 ETag of a single-part body."""
+    return f'"{hashlib.md5(data).hexdigest()}"'
+
+
+def _decode_aws_chunked(body: bytes) -> bytes:
+    """Strip aws-chunked framing (``SIZE;...\\r\\nDATA\\r\\n ... 0\\r\\ntrailers``)."""
+    data = bytearray()
+    position = 0
+    while True:
+        line_end = body.index(b'\r\n', position)
+        size = int(body[position:line_end].split(b';')[0], 16)
+        if size == 0:
+            return bytes(data)
+        start = line_end + 2
+        data += body[start : start + size]
+        position = start + size + 2
+
+
+def _xml(root: str, namespace: Optional[str] = S3_NAMESPACE, **fields: str) -> Response:
+    """Return a simple S3 XML document."""
+    body = ''.join(f'<{name}>{value}</{name}>' for name, value in fields.items())
+    xmlns = f' xmlns="{namespace}"' if namespace else ''
+    return Response(
+        f'<?xml version="1.0" encoding="UTF-8"?><{root}{xmlns}>{body}</{root}>',
+        media_type='application/xml',
+    )
+
+
+def _error(status_code: int, code: str, message: str) -> Response:
+    """Return an S3 error document; unlike results, errors have no namespace."""
+    response = _xml('Error', namespace=None, Code=code, Message=message)
+    response.status_code = status_code
+    return response
+
+
+class FakeS3:
+    """In-memory buckets, uploads and statistics."""
+
+    def __init__(self, config: FakeS3Config):
+        """Initialize an empty store."""
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.objects: Dict[str, StoredObject] = {}
+        self.uploads: Dict[str, MultipartUpload] = {}
+        self.aborted: List[str] = []
+        self.part_errors = 0
+
+    async def transfer(self, size: int) -> None:
+        """Wait as long as sending size bytes over the simulated link takes."""
+        if self.config.bandwidth_mbps > 0:
+            await asyncio.sleep(size * 8 / (self.config.bandwidth_mbps * 1_000_000))
+
+    def complete(self, upload_id: str, part_numbers: List[int]) -> Response:
+        """Assemble the listed parts into an object, applying R2's part size rules."""
+        upload = self.uploads.get(upload_id)
+        if upload is None:
+            return _error(404, 'NoSuchUpload', f'No upload {upload_id}')
+        if not part_numbers or any(n not in upload.parts for n in part_numbers):
+            return _error(400, 'InvalidPart', 'A listed part was not uploaded')
+
+        sizes = [len(upload.parts[n]) for n in part_numbers]
+        if any(size < self.config.min_part_size for size in sizes[:-1]):
+            return _error(400, 'EntityTooSmall', 'A part other than the last is too small')
+        if len(set(sizes[:-1])) > 1 or (len(sizes) > 1 and sizes[-1] > sizes[0]):
+            return _error(400, 'InvalidPart', 'All non-trailing parts must have the same length')
+
+        data = b''.join(upload.parts[n] for n in part_numbers)
+        digest = hashlib.md5(b''.join(hashlib.md5(upload.parts[n]).digest() for n in part_numbers))
+        etag = f'"{digest.hexdigest()}-{len(part_numbers)}"'
+        self.objects[f'{upload.bucket}/{upload.key}'] = StoredObject(
+            data=data, content_type=upload.content_type, etag=etag, parts=len(part_numbers)
+        )
+        del self.uploads[upload_id]
+        return _xml(
+            'CompleteMultipartUploadResult',
+            Bucket=upload.bucket,
+            Key=upload.key,
+            ETag=etag.replace('"', '&quot;'),
+        )
+
+    def stats(self) -> dict:
+        """Summarize stored objects and uploads."""
+        return {
+            'objects': {
+                name: {'size': len(stored.data), 'parts': stored.parts, 'content_type': stored.content_type}
+                for name, stored in self.objects.items()
+            },
+            'open_uploads': [
+                {'upload_id': upload_id, 'key': upload.key, 'parts': sorted(upload.parts)}
+                for upload_id, upload in self.uploads.items()
+            ],
+            'aborted_uploads': len(self.aborted),
+            'part_errors': self.part_errors,
+        }
+
+
+def create_app(config: FakeS3Config) -> FastAPI:
+    """Create the fake S3 application."""
+    app = FastAPI(title='Fake S3 API')
+    fake = FakeS3(config)
+
+    async def read_body(request: Request) -> bytes:
+        body = await request.body()
+        if 'STREAMING' in request.headers.get('x-amz-content-sha256', ''):
+            body = _decode_aws_chunked(body)
+        await fake.transfer(len(body))
+        return body
+
+    @app.get('/_stats')
+    async def stats():
+        return JSONResponse(fake.stats())
+
+    @app.put('/{bucket}/{key:path}')
+    async def put(bucket: str, key: str, request: Request):
+        params = request.query_params
+        body = await read_body(request)
+
+        if 'uploadId' in params:
+            upload = fake.uploads.get(params['uploadId'])
+            if upload is None:
+                return _error(404, 'NoSuchUpload', f'No upload {params["uploadId"]}')
+            if fake.rng.random() < config.part_error_rate:
+                fake.part_errors += 1
+                return _error(500, 'InternalError', 'Injected part failure')
+            upload.parts[int(params['partNumber'])] = body
+            return Response(headers={'ETag': _etag(body)})
+
+        fake.objects[f'{bucket}/{key}'] = StoredObject(
+            data=body, content_type=request.headers.get('content-type'), etag=_etag(body)
+        )
+        return Response(headers={'ETag': _etag(body)})
+
+    @app.post('/{bucket}/{key:path}')
+    async def post(bucket: str, key: str, request: Request):
+        params = request.query_params
+        if 'uploads' in params:
+            upload_id = uuid.uuid4().hex
+            fake.uploads[upload_id] = MultipartUpload(
+                bucket=bucket, key=key, content_type=request.headers.get('content-type')
+            )
+            return _xml(
+                'InitiateMultipartUploadResult', Bucket=bucket, Key=key, UploadId=upload_id
+            )
+
+        if 'uploadId' in params:
+            document = ElementTree.fromstring(await request.body())
+            part_numbers = [
+                int(element.text)
+                for element in document.iter()
+                if element.tag.endswith('PartNumber') and element.text
+            ]
+            return fake.complete(params['uploadId'], part_numbers)
+
+        return _error(400, 'InvalidRequest', 'Unsupported POST')
+
+    @app.delete('/{bucket}/{key:path}')
+    async def delete(bucket: str, key: str, request: Request):
+        upload_id = request.query_params.get('uploadId')
+        if upload_id is not None:
+            if fake.uploads.pop(upload_id, None) is None:
+                return _error(404, 'NoSuchUpload', f'No upload {upload_id}')
+            fake.aborted.append(upload_id)
+        else:
+            fake.objects.pop(f'{bucket}/{key}', None)
+        return Response(status_code=204)
+
+    @app.get('/{bucket}/{key:path}')
+    async def get(bucket: str, key: str):
+        stored = fake.objects.get(f'{bucket}/{key}')
+        if stored is None:
+            return _error(404, 'NoSuchKey', f'No object {key}')
+        await fake.transfer(len(stored.data))
+        return Response(
+            stored.data,
+            media_type=stored.content_type or 'application/octet-stream',
+            headers={'ETag': stored.etag},
+        )
+
+    return app
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the fake server from the command line."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description='Run a local fake S3-compatible API.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8200)
+    parser.add_argument(
+        '--bandwidth-mbps',
+        type=float,
+        default=0.0,
+        help='Simulated link speed per request in megabits per second (0 is unlimited)',
+    )
+    parser.add_argument(
+        '--part-error-rate',
+        type=float,
+        default=0.0,
+        help='Probability of an UploadPart request failing with 500',
+    )
+    parser.add_argument('--seed', type=int, help='Seed for reproducible runs')
+    args = parser.parse_args(argv)
+
+    config = FakeS3Config(
+        bandwidth_mbps=args.bandwidth_mbps,
+        part_error_rate=args.part_error_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,511 @@
+"""
+Transcription benchmark for the Whisper service.
+
+Transcribes a fixed corpus of audio fixtures through
+WhisperService.transcribe_async() for every combination of model, compute
+type, beam size and CPU thread count, and reports real-time factor, p50/p95
+latency, peak RSS and word error rate.
+
+The corpus is described by a JSON manifest; benchmarks/fixtures/manifest.json
+is used by default. Audio paths are relative to the manifest. Each fixture has
+a reference transcript, given inline as ``reference`` or in a text file as
+``reference_file``; an empty reference marks a clip without speech. The
+committed fixtures are short answers synthesized with espeak-ng (en-us, 150
+words per minute) and a silent clip. Synthetic clips of fixed lengths
+(``--clip-lengths``) are generated without any recording; they measure
+latency and RTF only, not WER.
+
+Each configuration runs in a fresh process so model memory and peak RSS are
+measured independently. Results can be saved with ``--output`` and compared
+against a previous run with ``--baseline`` to catch regressions.
+
+Usage (from the backend directory):
+    python -m benchmarks.transcription \\
+        --models tiny.en,base.en --beam-sizes 1,5 --cpu-threads 2,4 \\
+        --clip-lengths 30,120 --repeat 3 --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import re
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import product
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from app.services.whisper_service import WhisperService
+
+logger = logging.getLogger(__name__)
+
+# Metrics compared against a baseline run, all of which are better when lower
+REGRESSION_METRICS = ['rtf', 'p50_latency_seconds', 'p95_latency_seconds', 'wer']
+
+DEFAULT_MANIFEST = Path(__file__).parent / 'fixtures' / 'manifest.json'
+
+# Decoding profile registered with the service for the configuration under test
+BENCHMARK_PROFILE = 'benchmark'
+
+# Shape of the synthetic clips: syllables of one vowel each, grouped into
+# phrases separated by pauses
+SYLLABLE_SECONDS = 0.25
+PHRASE_SYLLABLES = 12
+PAUSE_SECONDS = 0.6
+
+# First and second formant frequencies in Hz of a few English vowels
+VOWEL_FORMANTS = [(730, 1090), (270, 2290), (300, 870), (530, 1840), (570, 840)]
+
+
+class Fixture(BaseModel):
+    """Decoded benchmark clip and its reference transcript."""
+
+    model_config = {'arbitrary_types_allowed': True}
+
+    name: str
+    audio: np.ndarray
+    reference: Optional[str] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        """Length of the clip in seconds."""
+        from app.services.whisper_service import SAMPLE_RATE
+
+        return len(self.audio) / SAMPLE_RATE
+
+
+class BenchmarkConfig(BaseModel):
+    """One point of the benchmark grid."""
+
+    model: str
+    compute_type: str
+    beam_size: int
+    cpu_threads: int
+    device: str
+
+    @property
+    def label(self) -> str:
+        """Short identifier used in reports and baselines."""
+        return (
+            f'{self.model}/{self.compute_type}/beam={self.beam_size}'
+            f'/threads={self.cpu_threads}'
+        )
+
+
+class BenchmarkResult(BaseModel):
+    """Measurements for one configuration."""
+
+    label: str
+    config: BenchmarkConfig
+    load_seconds: float
+    audio_seconds: float
+    rtf: float
+    p50_latency_seconds: float
+    p95_latency_seconds: float
+    peak_rss_mb: float
+    wer: Optional[float] = None
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase text and split it into words, ignoring punctuation."""
+    return re.findall(r"[a-z0-9']+", text.lower())
+
+
+def transcript_words(transcript: str) -> List[str]:
+    """Normalize a service transcript, scoring the no-speech placeholder as empty."""
+    from app.services.whisper_service import NO_SPEECH_TRANSCRIPT
+
+    if transcript == NO_SPEECH_TRANSCRIPT:
+        return []
+    return normalize_words(transcript)
+
+
+def word_edit_distance(reference: List[str], hypothesis: List[str]) -> int:
+    """Return the word-level Levenshtein distance between two word lists."""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, start=1):
+        current = [i]
+        for j, hyp_word in enumerate(hypothesis, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,  # Deletion
+                    current[j - 1] + 1,  # Insertion
+                    previous[j - 1] + (ref_word != hyp_word),  # Substitution
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Return the given percentile of values using linear interpolation."""
+    return float(np.percentile(values, fraction * 100))
+
+
+def synthetic_clip(duration_seconds: float, seed: int = 0) -> np.ndarray:
+    """
+    Generate a speech-like clip without any recording.
+
+    Each syllable is a harmonic series at a random pitch, shaped by the
+    formants of a random vowel and faded in and out. Phrases of syllables are
+    separated by pauses, so voice activity detection splits the clip into
+    segments as it would a spoken answer.
+
+    Args:
+        duration_seconds: Length of the clip
+        seed: Seed for the pitch and vowel sequence
+
+    Returns:
+        16 kHz float32 samples
+    """
+    from app.services.whisper_service import SAMPLE_RATE
+
+    rng = np.random.default_rng(seed)
+    sample_count = int(duration_seconds * SAMPLE_RATE)
+    syllable_times = np.arange(int(SYLLABLE_SECONDS * SAMPLE_RATE)) / SAMPLE_RATE
+    window = np.hanning(len(syllable_times))
+    pause = np.zeros(int(PAUSE_SECONDS * SAMPLE_RATE))
+
+    pieces = []
+    length = syllables = 0
+    while length < sample_count:
+        if syllables and syllables % PHRASE_SYLLABLES == 0:
+            pieces.append(pause)
+            length += len(pause)
+        pitch = rng.uniform(100, 180)
+        first, second = VOWEL_FORMANTS[rng.integers(len(VOWEL_FORMANTS))]
+        harmonics = np.arange(1, int(4000 // pitch) + 1) * pitch
+        gains = (
+            np.exp(-(((harmonics - first) / 150) ** 2))
+            + 0.5 * np.exp(-(((harmonics - second) / 200) ** 2))
+            + 0.05
+        )
+        syllable = gains @ np.sin(2 * np.pi * np.outer(harmonics, syllable_times))
+        pieces.append(0.3 * window * syllable / np.abs(syllable).max())
+        length += len(syllable_times)
+        syllables += 1
+
+    audio = np.concatenate(pieces)[:sample_count]
+    audio += rng.normal(0, 0.003, sample_count)
+    return audio.astype(np.float32)
+
+
+def load_fixtures(manifest_path: Path, clip_lengths: List[float]) -> List[Fixture]:
+    """
+    Decode the fixtures in a manifest and generate the synthetic clips.
+
+    Args:
+        manifest_path: Path to the JSON manifest
+        clip_lengths: Lengths in seconds of synthetic clips to add
+
+    Returns:
+        Manifest fixtures followed by synthetic clips
+    """
+    from app.services.whisper_service import decode_audio_input
+
+    manifest = json.loads(manifest_path.read_text())
+    base_dir = manifest_path.parent
+
+    fixtures = []
+    for entry in manifest['fixtures']:
+        reference = entry.get('reference')
+        if reference is None and entry.get('reference_file'):
+            reference = (base_dir / entry['reference_file']).read_text()
+        fixtures.append(
+            Fixture(
+                name=entry['name'],
+                audio=decode_audio_input(str(base_dir / entry['audio'])),
+                reference=reference,
+            )
+        )
+
+    for index, length in enumerate(clip_lengths):
+        fixtures.append(
+            Fixture(
+                name=f'synthetic-{length:g}s', audio=synthetic_clip(length, seed=index)
+            )
+        )
+
+    return fixtures
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in megabytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    if sys.platform == 'darwin':
+        return peak / 1024 / 1024
+    return peak / 1024
+
+
+@contextmanager
+def benchmark_service(config: BenchmarkConfig) -> Iterator['WhisperService']:
+    """
+    Yield a Whisper service that transcribes with one benchmark configuration.
+
+    The service runs a single worker thread without the transcript cache or
+    batching, so every call decodes its clip on its own. Settings and decoding
+    profiles are restored and the worker pool is shut down on exit.
+    """
+    from app.core.config import settings
+    from app.services.whisper_service import (
+        DECODING_PROFILES,
+        DecodingProfile,
+        WhisperService,
+    )
+
+    overrides = {
+        'whisper_device': config.device,
+        'whisper_compute_type': config.compute_type,
+        'whisper_cpu_threads': config.cpu_threads,
+        'whisper_executor': 'thread',
+        'whisper_workers': 1,
+        'whisper_share_model': False,
+        'whisper_batching': False,
+        'whisper_adaptive_profiles': False,
+        'whisper_default_profile': BENCHMARK_PROFILE,
+        'transcript_cache_size': 0,
+        'transcript_cache_persistent': False,
+    }
+    previous = {name: getattr(settings, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    DECODING_PROFILES[BENCHMARK_PROFILE] = DecodingProfile(
+        name=BENCHMARK_PROFILE, model=config.model, beam_size=config.beam_size
+    )
+
+    service = WhisperService()
+    try:
+        yield service
+    finally:
+        service.shutdown()
+        del DECODING_PROFILES[BENCHMARK_PROFILE]
+        for name, value in previous.items():
+            setattr(settings, name, value)
+
+
+async def _transcribe_fixtures(
+    service: 'WhisperService',
+    config: BenchmarkConfig,
+    fixtures: List[Fixture],
+    repeat: int,
+) -> Tuple[List[float], List[str]]:
+    """Time repeat transcriptions of every fixture; also return each fixture's last transcript."""
+    latencies = []
+    transcripts = []
+    for fixture in fixtures:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            transcript = await service.transcribe_async(fixture.audio)
+            latencies.append(time.perf_counter() - start)
+        transcripts.append(transcript)
+        logger.info(f'{config.label} {fixture.name}: {latencies[-1]:.2f}s')
+    return latencies, transcripts
+
+
+def run_config(
+    config: BenchmarkConfig,
+    manifest_path: Path,
+    clip_lengths: List[float],
+    repeat: int,
+) -> BenchmarkResult:
+    """
+    Benchmark a single configuration over the whole corpus.
+
+    Args:
+        config: Model and decoding settings to benchmark
+        manifest_path: Path to the fixtures manifest
+        clip_lengths: Lengths in seconds of synthetic clips to add
+        repeat: Number of timed transcriptions per clip
+
+    Returns:
+        Measurements for the configuration
+    """
+    fixtures = load_fixtures(manifest_path, clip_lengths)
+
+    with benchmark_service(config) as service:
+        # Model loading and warm-up, as at startup with WHISPER_PRELOAD
+        start = time.perf_counter()
+        service.preload()
+        load_seconds = time.perf_counter() - start
+
+        latencies, transcripts = asyncio.run(
+            _transcribe_fixtures(service, config, fixtures, repeat)
+        )
+
+    errors = 0
+    reference_words = 0
+    for fixture, transcript in zip(fixtures, transcripts):
+        if fixture.reference is not None:
+            reference = normalize_words(fixture.reference)
+            errors += word_edit_distance(reference, transcript_words(transcript))
+            reference_words += len(reference)
+
+    audio_seconds = sum(fixture.duration_seconds for fixture in fixtures) * repeat
+    return BenchmarkResult(
+        label=config.label,
+        config=config,
+        load_seconds=load_seconds,
+        audio_seconds=audio_seconds,
+        rtf=sum(latencies) / audio_seconds,
+        p50_latency_seconds=percentile(latencies, 0.50),
+        p95_latency_seconds=percentile(latencies, 0.95),
+        peak_rss_mb=peak_rss_mb(),
+        wer=errors / reference_words if reference_words else None,
+    )
+
+
+def print_report(results: List[BenchmarkResult]) -> None:
+    """Print a results table to stdout."""
+    header = f'{"configuration":<44} {"load s":>7} {"RTF":>7} {"p50 s":>7} {"p95 s":>7} {"RSS MB":>8} {"WER":>7}'
+    print(header)
+    print('-' * len(header))
+    for result in results:
+        wer = f'{result.wer:.1%}' if result.wer is not None else '-'
+        print(
+            f'{result.label:<44} {result.load_seconds:>7.2f} {result.rtf:>7.3f} '
+            f'{result.p50_latency_seconds:>7.2f} {result.p95_latency_seconds:>7.2f} '
+            f'{result.peak_rss_mb:>8.0f} {wer:>7}'
+        )
+
+
+def find_regressions(
+    results: List[BenchmarkResult], baseline: Dict[str, dict], tolerance: float
+) -> List[str]:
+    """
+    Compare results with a baseline run.
+
+    Args:
+        results: Results of this run
+        baseline: Baseline results keyed by configuration label
+        tolerance: Allowed relative increase of each metric, e.g. 0.1 for 10%
+
+    Returns:
+        Description of every metric that got worse than allowed
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.label)
+        if previous is None:
+            continue
+        for metric in REGRESSION_METRICS:
+            old, new = previous.get(metric), getattr(result, metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance) and new - old > 1e-9:
+                regressions.append(f'{result.label} {metric}: {old:.3f} -> {new:.3f}')
+    return regressions
+
+
+def _parse_list(value: str, cast=str) -> list:
+    """Parse a comma-separated command line list."""
+    return [cast(item.strip()) for item in value.split(',') if item.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line and return the exit code."""
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark Whisper transcription speed, memory and accuracy.'
+    )
+    parser.add_argument(
+        'manifest',
+        type=Path,
+        nargs='?',
+        default=DEFAULT_MANIFEST,
+        help='JSON manifest of audio fixtures',
+    )
+    parser.add_argument('--models', default=settings.whisper_model)
+    parser.add_argument(
+        '--compute-types',
+        default=settings.whisper_compute_type
+        or ('int8' if settings.whisper_device == 'cpu' else 'float16'),
+    )
+    parser.add_argument('--beam-sizes', default='5')
+    parser.add_argument(
+        '--cpu-threads', default='0', help='0 gives the single benchmark worker every core'
+    )
+    parser.add_argument('--device', default=settings.whisper_device)
+    parser.add_argument(
+        '--clip-lengths', default='', help='Synthetic clip lengths in seconds'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per clip')
+    parser.add_argument('--output', type=Path, help='Write results as JSON')
+    parser.add_argument('--baseline', type=Path, help='Results JSON to compare against')
+    parser.add_argument(
+        '--tolerance', type=float, default=0.1, help='Allowed relative regression'
+    )
+    parser.add_argument(
+        '--no-isolate',
+        action='store_true',
+        help='Run every configuration in this process (peak RSS becomes cumulative)',
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+
+    configs = [
+        BenchmarkConfig(
+            model=model,
+            compute_type=compute_type,
+            beam_size=beam_size,
+            cpu_threads=cpu_threads,
+            device=args.device,
+        )
+        for model, compute_type, beam_size, cpu_threads in product(
+            _parse_list(args.models),
+            _parse_list(args.compute_types),
+            _parse_list(args.beam_sizes, int),
+            _parse_list(args.cpu_threads, int),
+        )
+    ]
+    clip_lengths = _parse_list(args.clip_lengths, float)
+
+    results = []
+    for config in configs:
+        logger.info(f'Benchmarking {config.label}')
+        if args.no_isolate:
+            result = run_config(config, args.manifest, clip_lengths, args.repeat)
+        else:
+            # A fresh process per configuration keeps peak RSS per configuration
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context('spawn')
+            ) as executor:
+                result = executor.submit(
+                    run_config, config, args.manifest, clip_lengths, args.repeat
+                ).result()
+        results.append(result)
+
+    print_report(results)
+
+    if args.output:
+        args.output.write_text(
+            json.dumps([result.model_dump() for result in results], indent=2)
+        )
+
+    if args.baseline:
+        baseline = {
+            entry['label']: entry for entry in json.loads(args.baseline.read_text())
+        }
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print('\nRegressions against baseline:')
+            for regression in regressions:
+                print(f'  {regression}')
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
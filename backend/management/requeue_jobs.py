@@ -0,0 +1,108 @@
+"""
+List or requeue dead-lettered processing jobs.
+
+A job is dead-lettered once it has failed settings.pipeline_max_attempts
+times, and its response is marked failed. Requeuing resets the attempt count
+and returns the response to the stage its job got to, so workers pick it up
+again; its audio is still in R2.
+
+Usage (from the backend directory):
+    python -m management.requeue_jobs            # list dead jobs
+    python -m management.requeue_jobs --all      # requeue every dead job
+    python -m management.requeue_jobs JOB_ID ...  # requeue specific jobs
+"""
+
+import argparse
+import sys
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional
+
+
+def list_dead_jobs() -> List[tuple]:
+    """Return (job ID, response ID, attempts, last error, updated at) of every dead job."""
+    from app.core.database import SessionLocal
+    from app.models.processing_job import JobStatus, ProcessingJob
+
+    db = SessionLocal()
+    try:
+        return (
+            db.query(
+                ProcessingJob.id,
+                ProcessingJob.response_id,
+                ProcessingJob.attempts,
+                ProcessingJob.last_error,
+                ProcessingJob.updated_at,
+            )
+            .filter(ProcessingJob.status == JobStatus.DEAD)
+            .order_by(ProcessingJob.updated_at)
+            .all()
+        )
+    finally:
+        db.close()
+
+
+def requeue(job_ids: Optional[List[uuid.UUID]]) -> int:
+    """
+    Requeue dead jobs and reopen their responses.
+
+    Args:
+        job_ids: Jobs to requeue, or None for every dead job
+
+    Returns:
+        Number of requeued jobs
+    """
+    from app.core.database import SessionLocal
+    from app.models.processing_job import JobStatus, ProcessingJob
+    from app.models.response import EvaluationStatus, ProcessingStage
+
+    now = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        query = db.query(ProcessingJob).filter(ProcessingJob.status == JobStatus.DEAD)
+        if job_ids is not None:
+            query = query.filter(ProcessingJob.id.in_(job_ids))
+
+        jobs = query.with_for_update(skip_locked=True).all()
+        for job in jobs:
+            job.status = JobStatus.QUEUED
+            job.attempts = 0
+            job.run_after = now
+            job.updated_at = now
+
+            response = job.response
+            response.processing_stage = (
+                ProcessingStage.TRANSCRIBED
+                if response.transcript is not None
+                else ProcessingStage.RECEIVED
+            )
+            response.processing_error = None
+            response.processing_updated_at = now
+            response.evaluation_status = EvaluationStatus.PENDING
+        db.commit()
+        return len(jobs)
+    finally:
+        db.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse command line arguments and list or requeue dead jobs."""
+    parser = argparse.ArgumentParser(description='List or requeue dead-lettered processing jobs.')
+    parser.add_argument('job_ids', nargs='*', type=uuid.UUID, help='Dead jobs to requeue')
+    parser.add_argument('--all', action='store_true', help='Requeue every dead job')
+    args = parser.parse_args(argv)
+
+    if args.all or args.job_ids:
+        count = requeue(None if args.all else args.job_ids)
+        print(f'Requeued {count} jobs')
+        return 0
+
+    jobs = list_dead_jobs()
+    for job_id, response_id, attempts, last_error, updated_at in jobs:
+        print(f'{job_id}  response {response_id}  {attempts} attempts  {updated_at:%Y-%m-%d %H:%M}  {last_error}')
+    print(f'{len(jobs)} dead jobs')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
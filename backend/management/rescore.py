@@ -0,0 +1,339 @@
+"""
+Re-score stored responses with the Message Batches API.
+
+Selects responses that have no score, or whose score came from a different
+Claude model or evaluation rubric, and submits them as batch requests using
+the same prompt as live evaluations. Batches cost less than individual calls
+and are processed in parallel; responses to the same job description are
+submitted together so they share the cached rubric and job description
+prefix.
+
+Progress is saved to a checkpoint file after every submitted and collected
+batch. An interrupted run resumes from the checkpoint: recorded batches are
+collected rather than resubmitted, and selection continues after the last
+submitted response. The checkpoint is removed once every batch is collected.
+
+Set CLAUDE_BASE_URL to run against a local stub instead of the Anthropic API.
+
+Usage (from the backend directory):
+    python -m management.rescore --batch-size 1000 --checkpoint rescore.json
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Message Batches API limit on requests per batch
+MAX_BATCH_SIZE = 100_000
+
+# Evaluations written per bulk upsert
+WRITE_CHUNK_SIZE = 500
+
+
+class BatchRecord(BaseModel):
+    """A submitted batch and whether its results have been stored."""
+
+    id: str
+    request_count: int
+    collected: bool = False
+
+
+class Checkpoint(BaseModel):
+    """Resumable state of a re-scoring run."""
+
+    model: str
+    rubric_version: str
+    unscored_only: bool
+    # Sort key (job description ID, response ID) of the last submitted response
+    cursor: Optional[Tuple[str, str]] = None
+    exhausted: bool = False
+    submitted: int = 0
+    batches: List[BatchRecord] = []
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['Checkpoint']:
+        """Load a checkpoint, or return None if there is none."""
+        if not path.exists():
+            return None
+        return cls.model_validate_json(path.read_text())
+
+    def save(self, path: Path) -> None:
+        """Write the checkpoint atomically, so a crash never leaves a partial file."""
+        temporary = path.with_name(path.name + '.tmp')
+        temporary.write_text(self.model_dump_json(indent=2))
+        temporary.replace(path)
+
+
+def fetch_candidates(
+    model: str,
+    rubric_version: str,
+    unscored_only: bool,
+    cursor: Optional[Tuple[str, str]],
+    limit: int,
+) -> List[tuple]:
+    """
+    Return the next responses to re-score, in job description order.
+
+    Args:
+        model: Current Claude model
+        rubric_version: Current evaluation rubric version
+        unscored_only: Only select responses without a score
+        cursor: Sort key of the last response already submitted
+        limit: Maximum number of responses to return
+
+    Returns:
+        Rows of (job description ID, response ID, job description text,
+        question text, transcript)
+    """
+    from app.core.database import SessionLocal
+    from app.models.job_description import JobDescription
+    from app.models.question import Question
+    from app.models.response import ProcessingStage, Response
+    from app.models.response_score import ResponseScore
+    from sqlalchemy import or_, tuple_
+
+    db = SessionLocal()
+    try:
+        query = (
+            db.query(
+                JobDescription.id,
+                Response.id,
+                JobDescription.description_text,
+                Question.question_text,
+                Response.transcript,
+            )
+            .join(Question, Question.id == Response.question_id)
+            .join(JobDescription, JobDescription.id == Question.job_description_id)
+            .outerjoin(ResponseScore, ResponseScore.response_id == Response.id)
+            .filter(
+                Response.processing_stage.in_(
+                    [ProcessingStage.STORED, ProcessingStage.EVALUATED]
+                )
+            )
+        )
+
+        if unscored_only:
+            query = query.filter(ResponseScore.id.is_(None))
+        else:
+            query = query.filter(
+                or_(
+                    ResponseScore.id.is_(None),
+                    ResponseScore.evaluation_model.is_distinct_from(model),
+                    ResponseScore.rubric_version.is_distinct_from(rubric_version),
+                )
+            )
+
+        if cursor is not None:
+            query = query.filter(
+                tuple_(JobDescription.id, Response.id)
+                > tuple_(uuid.UUID(cursor[0]), uuid.UUID(cursor[1]))
+            )
+
+        return query.order_by(JobDescription.id, Response.id).limit(limit).all()
+    finally:
+        db.close()
+
+
+def store_evaluations(evaluations: Dict[uuid.UUID, dict]) -> None:
+    """Write evaluations to the database in bulk."""
+    from app.core.database import SessionLocal
+    from app.services.evaluation_service import evaluation_service
+
+    db = SessionLocal()
+    try:
+        evaluation_service.store_many(db, evaluations)
+    finally:
+        db.close()
+
+
+async def submit_batches(
+    checkpoint: Checkpoint, path: Path, batch_size: int, limit: Optional[int]
+) -> None:
+    """Submit batches of stale responses until none are left or the limit is reached."""
+    from app.services.claude_service import claude_service
+
+    while not checkpoint.exhausted:
+        size = batch_size
+        if limit is not None:
+            size = min(size, limit - checkpoint.submitted)
+        rows = []
+        if size > 0:
+            rows = await asyncio.to_thread(
+                fetch_candidates,
+                checkpoint.model,
+                checkpoint.rubric_version,
+                checkpoint.unscored_only,
+                checkpoint.cursor,
+                size,
+            )
+
+        if not rows:
+            checkpoint.exhausted = True
+            checkpoint.save(path)
+            break
+
+        requests = [
+            claude_service.evaluation_batch_request(
+                str(response_id), str(jd_text), str(question_text), str(transcript)
+            )
+            for _, response_id, jd_text, question_text, transcript in rows
+        ]
+        batch_id = await claude_service.create_batch(requests)
+
+        last = rows[-1]
+        checkpoint.cursor = (str(last[0]), str(last[1]))
+        checkpoint.submitted += len(rows)
+        checkpoint.batches.append(BatchRecord(id=batch_id, request_count=len(rows)))
+        checkpoint.save(path)
+        logger.info(f'Submitted batch {batch_id} with {len(rows)} responses')
+
+
+async def collect_batch(batch: BatchRecord, poll_seconds: float) -> Tuple[int, int]:
+    """
+    Wait for a batch to end and store its evaluations.
+
+    Returns:
+        Number of stored evaluations and number of failed requests
+    """
+    from app.services.claude_service import claude_service
+
+    while (status := await claude_service.batch_status(batch.id)) != 'ended':
+        logger.info(f'Batch {batch.id} is {status}, checking again in {poll_seconds:.0f}s')
+        await asyncio.sleep(poll_seconds)
+
+    stored = failed = 0
+    pending: Dict[uuid.UUID, dict] = {}
+    async for custom_id, evaluation, error in claude_service.evaluation_batch_results(
+        batch.id
+    ):
+        if evaluation is None:
+            failed += 1
+            logger.warning(f'Response {custom_id} was not re-scored: {error}')
+            continue
+
+        pending[uuid.UUID(custom_id)] = evaluation
+        if len(pending) >= WRITE_CHUNK_SIZE:
+            await asyncio.to_thread(store_evaluations, pending)
+            stored += len(pending)
+            pending = {}
+
+    await asyncio.to_thread(store_evaluations, pending)
+    stored += len(pending)
+    return stored, failed
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run or resume a re-scoring job and return the exit code."""
+    from app.services.claude_service import RUBRIC_VERSION, claude_service
+
+    checkpoint = None if args.restart else Checkpoint.load(args.checkpoint)
+    if checkpoint is None:
+        checkpoint = Checkpoint(
+            model=claude_service.model,
+            rubric_version=RUBRIC_VERSION,
+            unscored_only=args.unscored_only,
+        )
+    elif (checkpoint.model, checkpoint.rubric_version) != (
+        claude_service.model,
+        RUBRIC_VERSION,
+    ):
+        logger.error(
+            f'{args.checkpoint} was written for model {checkpoint.model} and rubric '
+            f'{checkpoint.rubric_version}; use --restart to start over'
+        )
+        return 1
+    else:
+        logger.info(
+            f'Resuming from {args.checkpoint}: {checkpoint.submitted} responses submitted'
+        )
+
+    if args.dry_run:
+        rows = fetch_candidates(
+            checkpoint.model,
+            checkpoint.rubric_version,
+            checkpoint.unscored_only,
+            checkpoint.cursor,
+            args.limit or MAX_BATCH_SIZE,
+        )
+        print(f'{len(rows)} responses would be re-scored')
+        return 0
+
+    try:
+        await submit_batches(checkpoint, args.checkpoint, args.batch_size, args.limit)
+
+        stored = failed = 0
+        for batch in checkpoint.batches:
+            if batch.collected:
+                continue
+            batch_stored, batch_failed = await collect_batch(batch, args.poll_seconds)
+            batch.collected = True
+            checkpoint.save(args.checkpoint)
+            stored += batch_stored
+            failed += batch_failed
+            logger.info(
+                f'Batch {batch.id}: {batch_stored} re-scored, {batch_failed} failed'
+            )
+    finally:
+        await claude_service.aclose()
+
+    args.checkpoint.unlink(missing_ok=True)
+    print(
+        f'Re-scored {stored} responses in {len(checkpoint.batches)} batches; '
+        f'{failed} failed and can be retried with another run'
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse command line arguments and run the re-scoring job."""
+    parser = argparse.ArgumentParser(
+        description='Re-score responses that are unscored or were scored by another model or rubric.'
+    )
+    parser.add_argument(
+        '--checkpoint',
+        type=Path,
+        default=Path('rescore_checkpoint.json'),
+        help='File used to resume an interrupted run',
+    )
+    parser.add_argument(
+        '--batch-size', type=int, default=1000, help='Responses per batch'
+    )
+    parser.add_argument(
+        '--limit', type=int, help='Stop after submitting this many responses'
+    )
+    parser.add_argument(
+        '--unscored-only',
+        action='store_true',
+        help='Only score responses that have no score yet',
+    )
+    parser.add_argument(
+        '--poll-seconds',
+        type=float,
+        default=60.0,
+        help='How often to check whether a batch has ended',
+    )
+    parser.add_argument(
+        '--restart', action='store_true', help='Ignore an existing checkpoint'
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true', help='Only count the responses to re-score'
+    )
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.batch_size <= MAX_BATCH_SIZE:
+        parser.error(f'--batch-size must be between 1 and {MAX_BATCH_SIZE}')
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+    return asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
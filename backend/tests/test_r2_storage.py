@@ -0,0 +1,81 @@
+"""R2 uploads against the fake S3 server in benchmarks/fake_s3.py."""
+
+import io
+import os
+from contextlib import ExitStack
+
+import httpx
+import pytest
+from app.core.config import settings
+from app.services.r2_storage_service import MB, R2StorageService
+from benchmarks.fake_s3 import FakeS3Config, create_app
+
+# Smallest part size R2 (and the fake) accept
+PART_SIZE_MB = 5
+
+
+@pytest.fixture
+def storage(serve, monkeypatch):
+    """Return a factory for a storage service uploading to a fresh fake S3 server, and its URL."""
+    with ExitStack() as stack:
+
+        def make(config: FakeS3Config = FakeS3Config()):
+            url = stack.enter_context(serve(create_app(config)))
+            monkeypatch.setattr(settings, 'r2_endpoint_url', url)
+            monkeypatch.setattr(settings, 'r2_multipart_threshold_mb', PART_SIZE_MB)
+            monkeypatch.setattr(settings, 'r2_multipart_part_size_mb', PART_SIZE_MB)
+            return R2StorageService(), url
+
+        yield make
+
+
+def _stats(url: str) -> dict:
+    return httpx.get(f'{url}/_stats').json()
+
+
+def test_large_upload_is_sent_in_parts(storage):
+    service, url = storage()
+    data = os.urandom(12 * MB)
+
+    r2_key = service.save_audio(io.BytesIO(data), 'answer.webm')
+
+    stored = _stats(url)['objects'][f'{settings.r2_bucket_name}/{r2_key}']
+    assert stored['parts'] == 3  # 5 MB + 5 MB + 2 MB
+    assert stored['content_type'] == 'audio/webm'
+    assert service.download_file(r2_key) == data
+
+
+def test_small_upload_is_a_single_put(storage):
+    service, url = storage()
+    data = os.urandom(1 * MB)
+
+    r2_key = service.save_audio(io.BytesIO(data), 'answer.ogg')
+
+    stored = _stats(url)['objects'][f'{settings.r2_bucket_name}/{r2_key}']
+    assert stored['parts'] == 0
+    assert stored['content_type'] == 'audio/ogg'
+    assert service.download_file(r2_key) == data
+
+
+def test_failed_parts_are_retried(storage):
+    service, url = storage(FakeS3Config(part_error_rate=0.3, seed=1))
+    data = os.urandom(12 * MB)
+
+    r2_key = service.save_audio(io.BytesIO(data), 'answer.webm')
+
+    stats = _stats(url)
+    assert stats['part_errors'] > 0
+    assert stats['objects'][f'{settings.r2_bucket_name}/{r2_key}']['parts'] == 3
+    assert service.download_file(r2_key) == data
+
+
+def test_failed_multipart_upload_is_aborted(storage):
+    service, url = storage(FakeS3Config(part_error_rate=1.0))
+
+    with pytest.raises(Exception, match='Failed to save audio to R2'):
+        service.save_audio(io.BytesIO(os.urandom(12 * MB)), 'answer.webm')
+
+    stats = _stats(url)
+    assert stats['objects'] == {}
+    assert stats['open_uploads'] == []
+    assert stats['aborted_uploads'] == 1
@@ -0,0 +1,105 @@
+"""
+Transcription benchmark fixtures and timing of WhisperService.transcribe_async().
+
+The timed test needs the fast profile's Whisper model on disk (it is not
+downloaded here), and is skipped otherwise:
+    pytest tests/test_transcription_benchmark.py --benchmark-only
+"""
+
+import asyncio
+
+import pytest
+from app.core.config import settings
+from app.services.whisper_service import NO_SPEECH_TRANSCRIPT, SAMPLE_RATE
+from benchmarks.transcription import (
+    DEFAULT_MANIFEST,
+    BenchmarkConfig,
+    benchmark_service,
+    load_fixtures,
+    normalize_words,
+    synthetic_clip,
+    transcript_words,
+    word_edit_distance,
+)
+
+# Highest word error rate accepted on the synthesized answers
+MAX_WER = 0.3
+
+
+def _model_available(model: str) -> bool:
+    """Whether a Whisper model can be loaded without downloading it."""
+    from faster_whisper.utils import download_model
+
+    try:
+        download_model(
+            model, local_files_only=True, cache_dir=settings.whisper_download_root
+        )
+    except Exception:
+        return False
+    return True
+
+
+@pytest.fixture(scope='module')
+def fixtures():
+    """Committed fixtures plus one synthetic clip."""
+    return {
+        fixture.name: fixture for fixture in load_fixtures(DEFAULT_MANIFEST, [2.5])
+    }
+
+
+def test_no_speech_transcript_scores_as_empty():
+    assert transcript_words(NO_SPEECH_TRANSCRIPT) == []
+    assert word_edit_distance([], transcript_words(NO_SPEECH_TRANSCRIPT)) == 0
+    assert transcript_words('Led the migration.') == ['led', 'the', 'migration']
+
+
+def test_fixtures_decode_with_references(fixtures):
+    assert list(fixtures) == [
+        'star-answer-short',
+        'star-answer-long',
+        'silence',
+        'synthetic-2.5s',
+    ]
+    assert normalize_words(fixtures['star-answer-long'].reference)
+    assert fixtures['silence'].reference == ''
+    assert fixtures['synthetic-2.5s'].reference is None
+    for fixture in fixtures.values():
+        assert fixture.audio.dtype.name == 'float32'
+        assert fixture.duration_seconds > 1
+
+
+def test_synthetic_clip_is_deterministic():
+    clip = synthetic_clip(4.0, seed=3)
+    assert len(clip) == 4 * SAMPLE_RATE
+    assert 0.1 < abs(clip).max() <= 1
+    assert (clip == synthetic_clip(4.0, seed=3)).all()
+    assert not (clip == synthetic_clip(4.0, seed=4)).all()
+
+
+@pytest.mark.skipif(
+    not _model_available(settings.whisper_fast_model),
+    reason=f'Whisper model {settings.whisper_fast_model} is not downloaded',
+)
+def test_transcribe_short_answer(benchmark, fixtures):
+    config = BenchmarkConfig(
+        model=settings.whisper_fast_model,
+        compute_type='int8',
+        beam_size=1,
+        cpu_threads=0,
+        device='cpu',
+    )
+    short = fixtures['star-answer-short']
+
+    with benchmark_service(config) as service:
+        service.preload()
+        transcript = benchmark.pedantic(
+            lambda: asyncio.run(service.transcribe_async(short.audio)),
+            rounds=5,
+            warmup_rounds=1,
+        )
+        silence = asyncio.run(service.transcribe_async(fixtures['silence'].audio))
+
+    reference = normalize_words(short.reference)
+    errors = word_edit_distance(reference, transcript_words(transcript))
+    assert errors / len(reference) <= MAX_WER
+    assert transcript_words(silence) == []
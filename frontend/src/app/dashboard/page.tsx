@@ -8,7 +8,13 @@ import { jobDescriptionsAPI } from "@/services/api";
 import type { JobDescription } from "@/types";
 import { ProtectedRoute } from "@/components/ProtectedRoute";
 import { CircularProgress } from "@/components/CircularProgress";
-import { formatDateOnly } from "@/utils/dateFormatter";
+import { formatDateOnly, parseUTCDate } from "@/utils/dateFormatter";
+import { QUESTION_GENERATION_POLL_LIMIT_MS } from "@/utils/constants";
+
+// Whether a job description may still get its questions; older pending ones are failed by the server
+const isGenerating = (job: JobDescription) =>
+  job.status === "pending" &&
+  Date.now() - parseUTCDate(job.created_at).getTime() < QUESTION_GENERATION_POLL_LIMIT_MS;
 
 function DashboardContent() {
   const router = useRouter();
@@ -16,6 +22,9 @@ function DashboardContent() {
   const { data: jobDescriptions, isLoading } = useQuery({
     queryKey: ["jobDescriptions"],
     queryFn: jobDescriptionsAPI.list,
+    // Keep refreshing while questions are still being generated
+    refetchInterval: (query) =>
+      query.state.data?.some(isGenerating) ? 3000 : false,
   });
 
   const getStatusBadge = (status: string) => {
@@ -19,6 +19,11 @@ function HistoryContent() {
       return responsesAPI.list(questionId);
     },
     enabled: !!questionId,
+    // Keep refreshing while an attempt is waiting to be scored
+    refetchInterval: (query) =>
+      query.state.data?.some((response) => response.evaluation_status === "pending")
+        ? 10000
+        : false,
   });
 
   if (isLoading) {
@@ -60,18 +65,28 @@ function HistoryContent() {
                   </h3>
                 </div>
 
-                <div className="grid grid-cols-2 md:grid-cols-5 gap-4">
-                  {Object.entries(response.scores).map(([key, value]) => (
-                    <div key={key} className="text-center">
-                      <div className="text-2xl font-bold text-primary-600">
-                        {value}
+                {response.scores ? (
+                  <div className="grid grid-cols-2 md:grid-cols-5 gap-4">
+                    {Object.entries(response.scores).map(([key, value]) => (
+                      <div key={key} className="text-center">
+                        <div className="text-2xl font-bold text-primary-600">
+                          {value}
+                        </div>
+                        <div className="text-sm text-gray-600 dark:text-gray-400 capitalize">
+                          {key.replace("_", " ")}
+                        </div>
                       </div>
-                      <div className="text-sm text-gray-600 dark:text-gray-400 capitalize">
-                        {key.replace("_", " ")}
-                      </div>
-                    </div>
-                  ))}
-                </div>
+                    ))}
+                  </div>
+                ) : (
+                  <p className="text-sm text-gray-600 dark:text-gray-400">
+                    {response.processing_stage === "failed"
+                      ? "This attempt could not be processed. Please record it again."
+                      : response.evaluation_status === "failed"
+                      ? "This attempt could not be evaluated."
+                      : "Feedback pending. Scores will appear once the evaluation finishes."}
+                  </p>
+                )}
               </div>
             ))}
           </div>
@@ -6,7 +6,11 @@ import { useParams, useRouter } from "next/navigation";
 import { motion } from "framer-motion";
 import { jobDescriptionsAPI, responsesAPI } from "@/services/api";
 import { useAudioRecorder } from "@/hooks/useAudioRecorder";
-import type { Response as EvaluationResponse } from "@/types";
+import type {
+  EvaluationProgress,
+  Feedback,
+  Response as EvaluationResponse,
+} from "@/types";
 import { ProtectedRoute } from "@/components/ProtectedRoute";
 import { CustomDropdown } from "@/components/CustomDropdown";
 import { QuestionTimeline } from "@/components/QuestionTimeline";
@@ -21,6 +25,7 @@ function PracticeContent() {
 
   const [currentQuestionIndex, setCurrentQuestionIndex] = useState(0);
   const [evaluation, setEvaluation] = useState<EvaluationResponse | null>(null);
+  const [progress, setProgress] = useState<EvaluationProgress | null>(null);
   const [initialIndexSet, setInitialIndexSet] = useState(false);
   const [isViewingHistory, setIsViewingHistory] = useState(false);
   const [selectedResponseId, setSelectedResponseId] = useState<string | null>(
@@ -61,6 +66,11 @@ function PracticeContent() {
     },
     enabled: !!currentQuestion && (currentQuestion.attempts_count ?? 0) > 0,
     retry: false,
+    // Keep refreshing while an attempt is waiting to be scored
+    refetchInterval: (query) =>
+      query.state.data?.some((response) => response.evaluation_status === "pending")
+        ? 10000
+        : false,
   });
 
   // Set initial question index to first unanswered question
@@ -112,10 +122,23 @@ function PracticeContent() {
     }: {
       questionId: string;
       audioFile: File;
-    }) => responsesAPI.submit(questionId, audioFile),
+    }) => {
+      setProgress(null);
+      return responsesAPI.submitStream(questionId, audioFile, setProgress);
+    },
     onSuccess: (data) => {
+      setProgress(null);
       setEvaluation(data);
       setIsViewingHistory(false);
+    },
+    onError: (err: unknown) => {
+      setProgress(null);
+      setSubmitError(
+        err instanceof Error ? err.message : "Failed to process response. Please try again."
+      );
+    },
+    // A response is saved even if its evaluation fails, so refresh either way
+    onSettled: () => {
       // Invalidate questions query to update attempts_count
       queryClient.invalidateQueries({
         queryKey: ["questions", jobDescriptionId],
@@ -279,11 +302,12 @@ function PracticeContent() {
                 </label>
                 <CustomDropdown
                   options={previousResponses.map((response, index) => {
-                    const avgScore =
-                      Object.values(response.scores).reduce(
-                        (a, b) => a + b,
-                        0
-                      ) / Object.keys(response.scores).length;
+                    const avgScore = response.scores
+                      ? Object.values(response.scores).reduce(
+                          (a, b) => a + b,
+                          0
+                        ) / Object.keys(response.scores).length
+                      : undefined;
                     return {
                       value: response.response_id,
                       label: `Attempt ${previousResponses.length - index}`,
@@ -427,7 +451,7 @@ function PracticeContent() {
                           : "Submit Response"}
                       </motion.button>
                     </div>
-                    {submitMutation.isPending && (
+                    {submitMutation.isPending && !progress && (
                       <motion.p
                         className="text-sm text-gray-600 dark:text-gray-300"
                         initial={{ opacity: 0 }}
@@ -437,6 +461,30 @@ function PracticeContent() {
                         seconds.
                       </motion.p>
                     )}
+                    {submitMutation.isPending && progress && (
+                      <motion.div
+                        className="space-y-3 text-sm text-gray-600 dark:text-gray-300"
+                        initial={{ opacity: 0 }}
+                        animate={{ opacity: 1 }}
+                      >
+                        {progress.transcript && (
+                          <p className="italic">&ldquo;{progress.transcript}&rdquo;</p>
+                        )}
+                        {progress.criteria.map((item) => (
+                          <motion.div
+                            key={item.criterion}
+                            initial={{ opacity: 0, y: 10 }}
+                            animate={{ opacity: 1, y: 0 }}
+                          >
+                            <span className="font-semibold capitalize text-gray-900 dark:text-white">
+                              {item.criterion.replace(/_/g, " ")}: {item.score}/10
+                            </span>{" "}
+                            {item.feedback}
+                          </motion.div>
+                        ))}
+                        <p>Evaluating...</p>
+                      </motion.div>
+                    )}
                   </motion.div>
                 )}
               </div>
@@ -487,7 +535,9 @@ function PracticeContent() {
               <div className="relative">
                 <div className="absolute left-0 top-0 bottom-0 w-1 bg-gradient-to-b from-blue-500 to-blue-600 rounded-full"></div>
                 <p className="text-gray-700 dark:text-gray-300 leading-relaxed pl-4 italic">
-                  "{evaluation.transcript}"
+                  {evaluation.transcript
+                    ? `"${evaluation.transcript}"`
+                    : "Your answer is still being transcribed."}
                 </p>
               </div>
             </motion.div>
@@ -529,82 +579,102 @@ function PracticeContent() {
             )}
 
             {/* Scores Grid */}
-            <motion.div
-              className="card backdrop-blur-sm bg-white/80 dark:bg-gray-800/80"
-              initial={{ opacity: 0, y: 20 }}
-              animate={{ opacity: 1, y: 0 }}
-              transition={{ delay: 0.3 }}
-            >
-              <h3 className="text-lg font-semibold text-gray-900 dark:text-white mb-6">
-                Performance Breakdown
-              </h3>
-              <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
-                {Object.entries(evaluation.scores).map(([key, value]) => {
-                  const percentage = (value / 10) * 100;
-                  const getScoreColor = (score: number) => {
-                    if (score >= 8)
-                      return {
-                        bg: "bg-green-500",
-                        text: "text-green-600 dark:text-green-400",
-                        ring: "ring-green-100 dark:ring-green-900",
-                      };
-                    if (score >= 6)
-                      return {
-                        bg: "bg-blue-500",
-                        text: "text-blue-600 dark:text-blue-400",
-                        ring: "ring-blue-100 dark:ring-blue-900",
-                      };
-                    if (score >= 4)
+            {evaluation.scores ? (
+              <motion.div
+                className="card backdrop-blur-sm bg-white/80 dark:bg-gray-800/80"
+                initial={{ opacity: 0, y: 20 }}
+                animate={{ opacity: 1, y: 0 }}
+                transition={{ delay: 0.3 }}
+              >
+                <h3 className="text-lg font-semibold text-gray-900 dark:text-white mb-6">
+                  Performance Breakdown
+                </h3>
+                <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+                  {Object.entries(evaluation.scores ?? {}).map(([key, value]) => {
+                    const percentage = (value / 10) * 100;
+                    const getScoreColor = (score: number) => {
+                      if (score >= 8)
+                        return {
+                          bg: "bg-green-500",
+                          text: "text-green-600 dark:text-green-400",
+                          ring: "ring-green-100 dark:ring-green-900",
+                        };
+                      if (score >= 6)
+                        return {
+                          bg: "bg-blue-500",
+                          text: "text-blue-600 dark:text-blue-400",
+                          ring: "ring-blue-100 dark:ring-blue-900",
+                        };
+                      if (score >= 4)
+                        return {
+                          bg: "bg-yellow-500",
+                          text: "text-yellow-600 dark:text-yellow-400",
+                          ring: "ring-yellow-100 dark:ring-yellow-900",
+                        };
                       return {
-                        bg: "bg-yellow-500",
-                        text: "text-yellow-600 dark:text-yellow-400",
-                        ring: "ring-yellow-100 dark:ring-yellow-900",
+                        bg: "bg-red-500",
+                        text: "text-red-600 dark:text-red-400",
+                        ring: "ring-red-100 dark:ring-red-900",
                       };
-                    return {
-                      bg: "bg-red-500",
-                      text: "text-red-600 dark:text-red-400",
-                      ring: "ring-red-100 dark:ring-red-900",
                     };
-                  };
-                  const colors = getScoreColor(value);
-
-                  return (
-                    <div key={key} className="space-y-3">
-                      <div className="flex items-center justify-between">
-                        <span className="text-sm font-medium text-gray-900 dark:text-white capitalize">
-                          {key.replace(/_/g, " ")}
-                        </span>
-                        <div
-                          className={`flex items-center gap-2 px-3 py-1 rounded-full ${colors.ring} ring-2`}
-                        >
-                          <span className={`text-sm font-bold ${colors.text}`}>
-                            {value}
-                          </span>
-                          <span className="text-xs text-gray-500 dark:text-gray-400">
-                            /10
+                    const colors = getScoreColor(value);
+
+                    return (
+                      <div key={key} className="space-y-3">
+                        <div className="flex items-center justify-between">
+                          <span className="text-sm font-medium text-gray-900 dark:text-white capitalize">
+                            {key.replace(/_/g, " ")}
                           </span>
+                          <div
+                            className={`flex items-center gap-2 px-3 py-1 rounded-full ${colors.ring} ring-2`}
+                          >
+                            <span className={`text-sm font-bold ${colors.text}`}>
+                              {value}
+                            </span>
+                            <span className="text-xs text-gray-500 dark:text-gray-400">
+                              /10
+                            </span>
+                          </div>
                         </div>
-                      </div>
-                      <div className="relative h-2 bg-gray-200 dark:bg-gray-700 rounded-full overflow-hidden">
-                        <div
-                          className={`absolute top-0 left-0 h-full ${colors.bg} rounded-full transition-all duration-500 ease-out`}
-                          style={{ width: `${percentage}%` }}
-                        >
-                          <div className="absolute inset-0 bg-gradient-to-r from-transparent to-white/20"></div>
+                        <div className="relative h-2 bg-gray-200 dark:bg-gray-700 rounded-full overflow-hidden">
+                          <div
+                            className={`absolute top-0 left-0 h-full ${colors.bg} rounded-full transition-all duration-500 ease-out`}
+                            style={{ width: `${percentage}%` }}
+                          >
+                            <div className="absolute inset-0 bg-gradient-to-r from-transparent to-white/20"></div>
+                          </div>
                         </div>
+                        <p className="text-sm text-gray-600 dark:text-gray-400 leading-relaxed">
+                          {
+                            evaluation.feedback?.[
+                              key as keyof Feedback
+                            ]
+                          }
+                        </p>
                       </div>
-                      <p className="text-sm text-gray-600 dark:text-gray-400 leading-relaxed">
-                        {
-                          evaluation.feedback[
-                            key as keyof typeof evaluation.feedback
-                          ]
-                        }
-                      </p>
-                    </div>
-                  );
-                })}
-              </div>
-            </motion.div>
+                    );
+                  })}
+                </div>
+              </motion.div>
+            ) : (
+              <motion.div
+                className="card bg-yellow-50 dark:bg-yellow-950 border-yellow-200 dark:border-yellow-800"
+                initial={{ opacity: 0, y: 20 }}
+                animate={{ opacity: 1, y: 0 }}
+                transition={{ delay: 0.3 }}
+              >
+                <h3 className="text-lg font-semibold text-gray-900 dark:text-white mb-2">
+                  {evaluation.evaluation_status === "failed"
+                    ? "Feedback unavailable"
+                    : "Feedback pending"}
+                </h3>
+                <p className="text-sm text-gray-700 dark:text-gray-300">
+                  {evaluation.evaluation_status === "failed"
+                    ? "We couldn't evaluate this attempt. Your answer is still saved; please try recording it again."
+                    : "Your answer was saved. Scores and feedback will appear here as soon as the evaluation finishes."}
+                </p>
+              </motion.div>
+            )}
 
             {/* Action Buttons */}
             <motion.div
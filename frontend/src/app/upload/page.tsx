@@ -6,18 +6,25 @@ import { useRouter } from "next/navigation";
 import { motion, AnimatePresence } from "framer-motion";
 import { jobDescriptionsAPI } from "@/services/api";
 import { ProtectedRoute } from "@/components/ProtectedRoute";
+import type { Question } from "@/types";
 import {
   JOB_DESCRIPTION_COMPANY_NAME_MAX_LENGTH,
   JOB_DESCRIPTION_JOB_TITLE_MAX_LENGTH,
   JOB_DESCRIPTION_TEXT_MAX_LENGTH,
   JOB_DESCRIPTION_TEXT_MIN_LENGTH,
+  QUESTION_GENERATION_POLL_LIMIT_MS,
 } from "@/utils/constants";
 
+// How often to check whether question generation has finished
+const STATUS_POLL_INTERVAL_MS = 1500;
+
 
 function UploadContent() {
   const [descriptionText, setDescriptionText] = useState("");
   const [companyName, setCompanyName] = useState("");
   const [jobTitle, setJobTitle] = useState("");
+  const [forceRefresh, setForceRefresh] = useState(false);
+  const [generatedQuestions, setGeneratedQuestions] = useState<Question[]>([]);
   const [error, setError] = useState("");
   const textareaRef = useRef<HTMLTextAreaElement>(null);
 
@@ -49,7 +56,7 @@ function UploadContent() {
   }, [descriptionText]);
 
   const mutation = useMutation({
-    mutationFn: () => {
+    mutationFn: async () => {
       if (!companyName.trim())
         throw new Error("Company name is required");
       if (companyName.length > JOB_DESCRIPTION_COMPANY_NAME_MAX_LENGTH)
@@ -62,7 +69,29 @@ function UploadContent() {
         throw new Error("Job description is required");
       if (descriptionText.length > JOB_DESCRIPTION_TEXT_MAX_LENGTH)
         throw new Error(`Job description must be ${JOB_DESCRIPTION_TEXT_MAX_LENGTH} characters or less`);
-      return jobDescriptionsAPI.create(companyName, jobTitle, descriptionText);
+      setGeneratedQuestions([]);
+      let jobDescription = await jobDescriptionsAPI.createStream(
+        companyName,
+        jobTitle,
+        descriptionText,
+        forceRefresh,
+        (question) => setGeneratedQuestions((questions) => [...questions, question])
+      );
+
+      // If the stream ended early, generation continues on the server; wait for it
+      const pollDeadline = Date.now() + QUESTION_GENERATION_POLL_LIMIT_MS;
+      while (jobDescription.status === "pending") {
+        if (Date.now() > pollDeadline)
+          throw new Error("Question generation is taking longer than expected. Check its status on the dashboard.");
+        await new Promise((resolve) => setTimeout(resolve, STATUS_POLL_INTERVAL_MS));
+        jobDescription = await jobDescriptionsAPI.get(jobDescription.id);
+      }
+      if (jobDescription.status === "error") {
+        // The server discards the questions of a failed generation
+        setGeneratedQuestions([]);
+        throw new Error(jobDescription.error_message || "Failed to generate questions. Please try again.");
+      }
+      return jobDescription;
     },
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["jobDescriptions"] });
@@ -75,6 +104,8 @@ function UploadContent() {
          err.response.data && typeof err.response.data === 'object' && 'detail' in err.response.data &&
          typeof err.response.data.detail === 'string')
           ? err.response.data.detail
+          : err instanceof Error && !('isAxiosError' in err)
+          ? err.message
           : "Failed to create job description. Please try again.";
       setError(errorMessage);
     },
@@ -237,6 +268,15 @@ function UploadContent() {
                descriptionText.length < JOB_DESCRIPTION_TEXT_MAX_LENGTH &&
                " (approaching limit)"}
             </motion.p>
+            <label className="mt-4 flex items-center gap-3 text-base text-gray-600 dark:text-gray-400 cursor-pointer">
+              <input
+                type="checkbox"
+                className="checkbox checkbox-primary"
+                checked={forceRefresh}
+                onChange={(e) => setForceRefresh(e.target.checked)}
+              />
+              Generate fresh questions even if this posting was used before
+            </label>
           </motion.div>
 
           <motion.div
@@ -311,7 +351,21 @@ function UploadContent() {
                   </motion.span>
                   Generating interview questions...
                 </motion.p>
-                <p className="mt-2">This may take 10-30 seconds.</p>
+                {generatedQuestions.length === 0 ? (
+                  <p className="mt-2">This may take 10-30 seconds.</p>
+                ) : (
+                  <ol className="mt-4 space-y-2 text-left list-decimal list-inside">
+                    {generatedQuestions.map((question) => (
+                      <motion.li
+                        key={question.id}
+                        initial={{ opacity: 0, y: 10 }}
+                        animate={{ opacity: 1, y: 0 }}
+                      >
+                        {question.question_text}
+                      </motion.li>
+                    ))}
+                  </ol>
+                )}
               </motion.div>
             )}
           </AnimatePresence>
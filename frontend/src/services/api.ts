@@ -1,5 +1,13 @@
 import axios from 'axios';
-import type { Token, JobDescription, Question, Response } from '@/types';
+import type {
+  Token,
+  JobDescription,
+  Question,
+  Response,
+  CriterionEvaluation,
+  EvaluationProgress,
+  LiveResponseSession,
+} from '@/types';
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
@@ -19,6 +27,44 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+// Send a request with the stored token and dispatch its Server-Sent Events as they arrive
+const fetchEventStream = async (
+  path: string,
+  init: RequestInit,
+  onEvent: (event: string, data: unknown) => void
+): Promise<void> => {
+  const token = localStorage.getItem('token');
+  const response = await fetch(`${API_URL}${path}`, {
+    ...init,
+    headers: {
+      ...init.headers,
+      ...(token ? { Authorization: `Bearer ${token}` } : {}),
+    },
+  });
+
+  if (!response.ok || !response.body) {
+    const data = await response.json().catch(() => null);
+    throw new Error(typeof data?.detail === 'string' ? data.detail : 'Request failed. Please try again.');
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += value;
+
+    let boundary: number;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const message = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      const event = message.match(/^event: (.*)$/m)?.[1];
+      const data = message.match(/^data: (.*)$/m)?.[1];
+      if (event && data) onEvent(event, JSON.parse(data));
+    }
+  }
+};
+
 // Authentication
 export const authAPI = {
   register: async (email: string, password: string): Promise<Token> => {
@@ -34,12 +80,57 @@ export const authAPI = {
 
 // Job Descriptions
 export const jobDescriptionsAPI = {
-  create: async (companyName: string, jobTitle: string, descriptionText: string): Promise<JobDescription> => {
-    const response = await api.post<JobDescription>('/api/job-descriptions', {
-      company_name: companyName,
-      job_title: jobTitle,
-      description_text: descriptionText,
-    });
+  create: async (
+    companyName: string,
+    jobTitle: string,
+    descriptionText: string,
+    forceRefresh = false
+  ): Promise<JobDescription> => {
+    const response = await api.post<JobDescription>(
+      '/api/job-descriptions',
+      {
+        company_name: companyName,
+        job_title: jobTitle,
+        description_text: descriptionText,
+      },
+      { params: forceRefresh ? { force_refresh: true } : undefined }
+    );
+    return response.data;
+  },
+
+  // Create a job description and receive each question as soon as it is generated
+  createStream: async (
+    companyName: string,
+    jobTitle: string,
+    descriptionText: string,
+    forceRefresh: boolean,
+    onQuestion: (question: Question) => void
+  ): Promise<JobDescription> => {
+    const query = forceRefresh ? '?force_refresh=true' : '';
+    let jobDescription: JobDescription | null = null;
+    await fetchEventStream(
+      `/api/job-descriptions/stream${query}`,
+      {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+          company_name: companyName,
+          job_title: jobTitle,
+          description_text: descriptionText,
+        }),
+      },
+      (event, data) => {
+        if (event === 'question') onQuestion(data as Question);
+        else if (event === 'job_description' || event === 'status') jobDescription = data as JobDescription;
+      }
+    );
+
+    if (!jobDescription) throw new Error('Failed to create job description. Please try again.');
+    return jobDescription;
+  },
+
+  get: async (jobDescriptionId: string): Promise<JobDescription> => {
+    const response = await api.get<JobDescription>(`/api/job-descriptions/${jobDescriptionId}`);
     return response.data;
   },
 
@@ -56,6 +147,7 @@ export const jobDescriptionsAPI = {
 
 // Responses
 export const responsesAPI = {
+  // Accept a response for background processing; poll get() for its progress
   submit: async (questionId: string, audioFile: File): Promise<Response> => {
     const formData = new FormData();
     formData.append('audio_file', audioFile);
@@ -68,6 +160,98 @@ export const responsesAPI = {
     return response.data;
   },
 
+  // Submit a response and receive the transcript and each criterion as they are evaluated
+  submitStream: async (
+    questionId: string,
+    audioFile: File,
+    onProgress: (progress: EvaluationProgress) => void
+  ): Promise<Response> => {
+    const formData = new FormData();
+    formData.append('audio_file', audioFile);
+
+    const progress: EvaluationProgress = { criteria: [] };
+    let result: Response | null = null;
+    let error: string | null = null;
+    await fetchEventStream(
+      `/api/questions/${questionId}/responses/stream`,
+      { method: 'POST', body: formData },
+      (event, data) => {
+        if (event === 'transcript') {
+          progress.transcript = (data as { transcript: string }).transcript;
+        } else if (event === 'criterion') {
+          progress.criteria = [...progress.criteria, data as CriterionEvaluation];
+        } else if (event === 'overall_comment') {
+          progress.overall_comment = (data as { overall_comment: string }).overall_comment;
+        } else if (event === 'result') {
+          result = data as Response;
+          return;
+        } else if (event === 'error') {
+          error = (data as { detail: string }).detail;
+          return;
+        }
+        onProgress({ ...progress });
+      }
+    );
+
+    if (error) throw new Error(error);
+    if (!result) throw new Error('Failed to evaluate response. Please try again.');
+    return result;
+  },
+
+  // Record a response over a WebSocket, receiving the transcript while the user speaks.
+  // The token is sent as the first message, never in the URL.
+  live: (
+    questionId: string,
+    onPartial: (transcript: string) => void
+  ): Promise<LiveResponseSession> =>
+    new Promise((resolveSession, rejectSession) => {
+      const socket = new WebSocket(
+        `${API_URL.replace(/^http/, 'ws')}/api/questions/${questionId}/responses/live`
+      );
+      let ready = false;
+      let settle: { resolve: (response: Response) => void; reject: (error: Error) => void } | null = null;
+      let error: string | null = null;
+
+      const session: LiveResponseSession = {
+        send: (chunk) => socket.send(chunk),
+        stop: () =>
+          new Promise((resolve, reject) => {
+            settle = { resolve, reject };
+            socket.send(JSON.stringify({ type: 'stop' }));
+          }),
+        close: () => socket.close(),
+      };
+
+      socket.onopen = () => {
+        socket.send(JSON.stringify({ type: 'auth', token: localStorage.getItem('token') }));
+      };
+      socket.onmessage = (message) => {
+        const data = JSON.parse(message.data);
+        if (data.type === 'ready') {
+          ready = true;
+          resolveSession(session);
+        } else if (data.type === 'partial' || data.type === 'transcript') {
+          onPartial(data.transcript);
+        } else if (data.type === 'result') {
+          settle?.resolve(data.response as Response);
+        } else if (data.type === 'error') {
+          error = data.detail;
+        }
+      };
+      socket.onclose = () => {
+        const reason = new Error(error || 'Connection lost. Please try again.');
+        if (!ready) rejectSession(reason);
+        settle?.reject(reason);
+      };
+    }),
+
+  get: async (questionId: string, responseId: string): Promise<Response> => {
+    const response = await api.get<Response>(
+      `/api/questions/${questionId}/responses/${responseId}`
+    );
+    return response.data;
+  },
+
   list: async (questionId: string): Promise<Response[]> => {
     const response = await api.get<Response[]>(`/api/questions/${questionId}/responses`);
     return response.data;
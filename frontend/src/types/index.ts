@@ -52,11 +52,41 @@ export interface Evaluation {
   overall_comment?: string;
 }
 
+export type EvaluationStatus = 'pending' | 'scored' | 'failed';
+
+export type ProcessingStage = 'received' | 'transcribed' | 'stored' | 'evaluated' | 'failed';
+
 export interface Response {
   response_id: string;
-  transcript: string;
-  scores: Scores;
-  feedback: Feedback;
+  processing_stage: ProcessingStage;
+  processing_error?: string | null;
+  // Missing until the response is transcribed
+  transcript?: string | null;
+  evaluation_status: EvaluationStatus;
+  // Missing until the response is scored
+  scores?: Scores | null;
+  feedback?: Feedback | null;
   overall_comment?: string;
+  duration_seconds?: number;
   created_at: string;
 }
+
+export interface CriterionEvaluation {
+  criterion: keyof Scores;
+  score: number;
+  feedback: string;
+}
+
+export interface EvaluationProgress {
+  transcript?: string;
+  criteria: CriterionEvaluation[];
+  overall_comment?: string;
+}
+
+export interface LiveResponseSession {
+  // Send the next MediaRecorder chunk
+  send: (chunk: Blob) => void;
+  // Stop recording and wait for the evaluated response
+  stop: () => Promise<Response>;
+  close: () => void;
+}
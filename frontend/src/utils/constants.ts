@@ -28,3 +28,8 @@ export const JOB_DESCRIPTION_COMPANY_NAME_MAX_LENGTH = 200;
 export const JOB_DESCRIPTION_JOB_TITLE_MAX_LENGTH = 200;
 export const JOB_DESCRIPTION_TEXT_MIN_LENGTH = 50;
 export const JOB_DESCRIPTION_TEXT_MAX_LENGTH = 10000;
+
+// Question generation: the backend fails job descriptions still pending after
+// QUESTION_GENERATION_TIMEOUT_SECONDS (10 minutes) on its next sweep, so clients
+// stop polling a pending job description once it is older than this
+export const QUESTION_GENERATION_POLL_LIMIT_MS = 11 * 60 * 1000; // 11 minutes
@@ -7,7 +7,7 @@
  * @param dateString - ISO date string from the server (UTC)
  * @returns Date object in UTC
  */
-const parseUTCDate = (dateString: string): Date => {
+export const parseUTCDate = (dateString: string): Date => {
   // If the date string doesn't end with 'Z', append it to indicate UTC
   const utcString = dateString.endsWith('Z') ? dateString : `${dateString}Z`;
   return new Date(utcString);